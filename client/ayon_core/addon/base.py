@@ -3,8 +3,11 @@
 import copy
 import os
 import sys
+import json
 import time
+import hashlib
 import inspect
+import importlib.util
 import logging
 import threading
 import collections
@@ -16,8 +19,9 @@ import appdirs
 import ayon_api
 from semver import VersionInfo
 
-from ayon_core import AYON_CORE_ROOT
+from ayon_core import AYON_CORE_ROOT, __version__
 from ayon_core.lib import Logger, is_dev_mode_enabled
+from ayon_core.lib.local_settings import get_ayon_appdirs
 from ayon_core.settings import get_studio_settings
 
 from .interfaces import (
@@ -138,9 +142,270 @@ class _ModuleClass(object):
 class _LoadCache:
     addons_lock = threading.Lock()
     addons_loaded = False
+    # Discovery manifest of loaded addons
+    manifest = None
+    # Time spent on import of addon modules by alias
+    import_times = {}
 
 
-def load_addons(force=False):
+def _get_path_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _get_module_files_mtimes(path):
+    """Modification times of python files of a module.
+
+    Modification time of module directory changes only when a file is
+        added or removed, so python files directly in the directory are
+        checked too.
+
+    Args:
+        path (str): Path to module directory or python file.
+
+    Returns:
+        dict[str, Union[float, None]]: Modification times by path.
+    """
+    output = {path: _get_path_mtime(path)}
+    if not os.path.isdir(path):
+        return output
+
+    try:
+        filenames = os.listdir(path)
+    except OSError:
+        return output
+
+    for filename in filenames:
+        if os.path.splitext(filename)[1].lower() == ".py":
+            filepath = os.path.join(path, filename)
+            output[filepath] = _get_path_mtime(filepath)
+    return output
+
+
+def _get_module_path(module):
+    """Path to module directory or python file.
+
+    Args:
+        module (ModuleType): Imported module.
+
+    Returns:
+        Union[str, None]: Path to module or None if module has no file.
+    """
+    filepath = getattr(module, "__file__", None)
+    if not filepath:
+        return None
+    if os.path.splitext(os.path.basename(filepath))[0] == "__init__":
+        return os.path.dirname(filepath)
+    return filepath
+
+
+class _AddonsManifest:
+    """Cached result of addons discovery for a bundle.
+
+    Manifest stores, for each addon, name of module which contains the
+    addon, alias under which is the module available in 'openpype_modules'
+    and names of addon classes with names of addons they define. With that
+    information the addon directory doesn't have to be scanned, addon
+    module can be imported lazily and addons can be initialized on demand.
+
+    Entry is used only if addon version, path and modification time of
+    the path and of python files of the addon module did not change. Plugin
+    paths and other information that depend on settings are not cached.
+
+    Args:
+        filepath (str): Path to manifest file.
+        data (Optional[dict[str, Any]]): Manifest data.
+    """
+    manifest_version = 2
+
+    def __init__(self, filepath, data=None):
+        if not data or data.get("version") != self.manifest_version:
+            data = {}
+        self._filepath = filepath
+        self._entries = data.get("entries") or {}
+        self._valid_entries_by_alias = {}
+        self._changed = False
+
+    @classmethod
+    def load(cls):
+        """Load manifest of current bundle.
+
+        Returns:
+            _AddonsManifest: Manifest object.
+        """
+        bundle_name = os.getenv("AYON_BUNDLE_NAME") or "_unknown_"
+        server_hash = hashlib.sha1(
+            (ayon_api.get_base_url() or "").encode("utf-8")
+        ).hexdigest()[:8]
+        filepath = get_ayon_appdirs(
+            "addons_manifest",
+            "{}_{}.json".format(bundle_name, server_hash)
+        )
+        data = None
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, "r") as stream:
+                    data = json.load(stream)
+            except (OSError, ValueError):
+                data = None
+
+        if not isinstance(data, dict):
+            data = None
+        return cls(filepath, data)
+
+    def get_entry(self, key, version, path):
+        """Get valid entry of addon.
+
+        Args:
+            key (str): Entry key.
+            version (str): Addon version.
+            path (str): Path to addon directory or module.
+
+        Returns:
+            Union[dict[str, Any], None]: Entry data or None if entry is not
+                available or is not valid anymore.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        module_path = entry.get("module_path")
+        if (
+            entry.get("version") != version
+            or entry.get("path") != path
+            or entry.get("mtime") != _get_path_mtime(path)
+            or not module_path
+            or entry.get("module_files") != _get_module_files_mtimes(
+                module_path
+            )
+        ):
+            self._entries.pop(key)
+            self._changed = True
+            return None
+
+        self._valid_entries_by_alias[entry["alias"]] = entry
+        return entry
+
+    def set_entry(
+        self, key, version, path, alias, module_name=None, module_path=None
+    ):
+        """Store entry of addon.
+
+        Args:
+            key (str): Entry key.
+            version (str): Addon version.
+            path (str): Path to addon directory or module.
+            alias (str): Alias of addon module in 'openpype_modules'.
+            module_name (Optional[str]): Name of importable module.
+            module_path (Optional[str]): Path to module directory or python
+                file. Entry is not stored if not passed.
+        """
+        if not module_path:
+            return
+
+        entry = {
+            "version": version,
+            "path": path,
+            "mtime": _get_path_mtime(path),
+            "module_path": module_path,
+            "module_files": _get_module_files_mtimes(module_path),
+            "alias": alias,
+            "module_name": module_name,
+            "classes": None,
+        }
+        self._entries[key] = entry
+        self._valid_entries_by_alias[alias] = entry
+        self._changed = True
+
+    def get_addon_classes(self, alias):
+        """Names of addon classes with addon names in module.
+
+        Args:
+            alias (str): Alias of addon module in 'openpype_modules'.
+
+        Returns:
+            Union[list[tuple[str, str]], None]: Class names with addon
+                names or None if classes are not known.
+        """
+        entry = self._valid_entries_by_alias.get(alias)
+        if entry is None or entry["classes"] is None:
+            return None
+        return [tuple(item) for item in entry["classes"]]
+
+    def set_addon_classes(self, alias, addon_classes):
+        """Store addon classes of module.
+
+        Args:
+            alias (str): Alias of addon module in 'openpype_modules'.
+            addon_classes (list[tuple[str, str]]): Class names with addon
+                names.
+        """
+        entry = self._valid_entries_by_alias.get(alias)
+        if entry is None:
+            return
+        addon_classes = [list(item) for item in addon_classes]
+        if entry["classes"] != addon_classes:
+            entry["classes"] = addon_classes
+            self._changed = True
+
+    def save(self):
+        """Save manifest to disk if anything changed."""
+        if not self._changed:
+            return
+
+        self._changed = False
+        dirpath = os.path.dirname(self._filepath)
+        tmp_path = "{}.{}.tmp".format(self._filepath, uuid4().hex)
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(
+                    {
+                        "version": self.manifest_version,
+                        "entries": self._entries,
+                    },
+                    stream
+                )
+            os.replace(tmp_path, self._filepath)
+
+        except OSError:
+            Logger.get_logger("AddonsLoader").debug(
+                "Failed to store addons manifest.", exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _import_module_lazy(module_name):
+    """Import module which is loaded on first access to its attributes.
+
+    Args:
+        module_name (str): Name of module.
+
+    Returns:
+        Union[ModuleType, None]: Module or None if module was not found.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(module_name)
+    if (
+        spec is None
+        or spec.loader is None
+        or not hasattr(spec.loader, "exec_module")
+    ):
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_addons(force=False, lazy=False):
     """Load AYON addons as python modules.
 
     Modules does not load only classes (like in Interfaces) because there must
@@ -152,6 +417,9 @@ def load_addons(force=False):
     Args:
         force (bool): Force to load addons even if are already loaded.
             This won't update already loaded and used (cached) modules.
+        lazy (bool): Addon modules known from discovery manifest are
+            executed on first access to their content. Import of the
+            modules is not deferred by default.
     """
 
     if _LoadCache.addons_loaded and not force:
@@ -159,7 +427,7 @@ def load_addons(force=False):
 
     if not _LoadCache.addons_lock.locked():
         with _LoadCache.addons_lock:
-            _load_addons()
+            _load_addons(lazy)
             _LoadCache.addons_loaded = True
     else:
         # If lock is locked wait until is finished
@@ -251,18 +519,24 @@ def _handle_moved_addons(addon_name, milestone_version, log):
     return addon_dir
 
 
-def _load_ayon_addons(openpype_modules, modules_key, log):
+def _load_ayon_addons(openpype_modules, modules_key, manifest, lazy, log):
     """Load AYON addons based on information from server.
 
     This function should not trigger downloading of any addons but only use
     what is already available on the machine (at least in first stages of
     development).
 
+    Addon directory is scanned only if discovery manifest does not contain
+    valid entry. Modules known from manifest can be imported lazily.
+
     Args:
         openpype_modules (_ModuleClass): Module object where modules are
             stored.
         modules_key (str): Key under which will be modules imported in
             `sys.modules`.
+        manifest (_AddonsManifest): Discovery manifest.
+        lazy (bool): Import modules known from manifest on first access
+            to their content.
         log (logging.Logger): Logger object.
 
     Returns:
@@ -340,63 +614,46 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
             continue
 
         sys.path.insert(0, addon_dir)
-        imported_modules = []
-        for name in os.listdir(addon_dir):
-            # Ignore of files is implemented to be able to run code from code
-            #   where usually is more files than just the addon
-            # Ignore start and setup scripts
-            if name in ("setup.py", "start.py", "__pycache__"):
-                continue
+        import_start = time.time()
+        mod = None
+        entry = None
+        # Content of dev addon can change without change of version
+        if not use_dev_path:
+            entry = manifest.get_entry(
+                addon_name, addon_version, addon_dir
+            )
+        if entry is not None:
+            try:
+                if lazy:
+                    # Module is loaded on first access to its content
+                    mod = _import_module_lazy(entry["module_name"])
+                else:
+                    mod = importlib.import_module(entry["module_name"])
+            except Exception:
+                mod = None
+            addon_alias = entry["alias"]
 
-            path = os.path.join(addon_dir, name)
-            basename, ext = os.path.splitext(name)
-            # Ignore folders/files with dot in name
-            #   - dot names cannot be imported in Python
-            if "." in basename:
-                continue
-            is_dir = os.path.isdir(path)
-            is_py_file = ext.lower() == ".py"
-            if not is_py_file and not is_dir:
+        if mod is None:
+            mod = _import_addon_dir_module(
+                addon_name, addon_version, addon_dir, log
+            )
+            if mod is None:
                 continue
 
-            try:
-                mod = __import__(basename, fromlist=("",))
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        inspect.isclass(attr)
-                        and issubclass(attr, AYONAddon)
-                    ):
-                        imported_modules.append(mod)
-                        break
-
-            except BaseException:
-                log.warning(
-                    "Failed to import \"{}\"".format(basename),
-                    exc_info=True
+            addon_alias = getattr(mod, "V3_ALIAS", None)
+            if not addon_alias:
+                addon_alias = addon_name
+            if not use_dev_path:
+                manifest.set_entry(
+                    addon_name,
+                    addon_version,
+                    addon_dir,
+                    addon_alias,
+                    mod.__name__,
+                    _get_module_path(mod),
                 )
 
-        if not imported_modules:
-            log.warning("Addon {} {} has no content to import".format(
-                addon_name, addon_version
-            ))
-            continue
-
-        if len(imported_modules) > 1:
-            log.warning((
-                "Skipping addon '{}'."
-                " Multiple modules were found ({}) in dir {}."
-            ).format(
-                addon_name,
-                ", ".join([m.__name__ for m in imported_modules]),
-                addon_dir,
-            ))
-            continue
-
-        mod = imported_modules[0]
-        addon_alias = getattr(mod, "V3_ALIAS", None)
-        if not addon_alias:
-            addon_alias = addon_name
+        _LoadCache.import_times[addon_alias] = time.time() - import_start
         addons_to_skip_in_core.append(addon_alias)
         new_import_str = "{}.{}".format(modules_key, addon_alias)
 
@@ -406,8 +663,77 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
     return addons_to_skip_in_core
 
 
+def _import_addon_dir_module(addon_name, addon_version, addon_dir, log):
+    """Find and import module with addon in addon directory.
+
+    Args:
+        addon_name (str): Addon name.
+        addon_version (str): Addon version.
+        addon_dir (str): Path to addon client directory.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        Union[ModuleType, None]: Imported module or None if addon directory
+            does not contain exactly one module with addon.
+    """
+    imported_modules = []
+    for name in os.listdir(addon_dir):
+        # Ignore of files is implemented to be able to run code from code
+        #   where usually is more files than just the addon
+        # Ignore start and setup scripts
+        if name in ("setup.py", "start.py", "__pycache__"):
+            continue
+
+        path = os.path.join(addon_dir, name)
+        basename, ext = os.path.splitext(name)
+        # Ignore folders/files with dot in name
+        #   - dot names cannot be imported in Python
+        if "." in basename:
+            continue
+        is_dir = os.path.isdir(path)
+        is_py_file = ext.lower() == ".py"
+        if not is_py_file and not is_dir:
+            continue
+
+        try:
+            mod = __import__(basename, fromlist=("",))
+            for attr_name in dir(mod):
+                attr = getattr(mod, attr_name)
+                if (
+                    inspect.isclass(attr)
+                    and issubclass(attr, AYONAddon)
+                ):
+                    imported_modules.append(mod)
+                    break
+
+        except BaseException:
+            log.warning(
+                "Failed to import \"{}\"".format(basename),
+                exc_info=True
+            )
+
+    if not imported_modules:
+        log.warning("Addon {} {} has no content to import".format(
+            addon_name, addon_version
+        ))
+        return None
+
+    if len(imported_modules) > 1:
+        log.warning((
+            "Skipping addon '{}'."
+            " Multiple modules were found ({}) in dir {}."
+        ).format(
+            addon_name,
+            ", ".join([m.__name__ for m in imported_modules]),
+            addon_dir,
+        ))
+        return None
+
+    return imported_modules[0]
+
+
 def _load_addons_in_core(
-    ignore_addon_names, openpype_modules, modules_key, log
+    ignore_addon_names, openpype_modules, modules_key, manifest, log
 ):
     # Add current directory at first place
     #   - has small differences in import logic
@@ -460,6 +786,7 @@ def _load_addons_in_core(
 
             # TODO add more logic how to define if folder is addon or not
             # - check manifest and content of manifest
+            import_start = time.time()
             try:
                 # Don't import dynamically current directory modules
                 new_import_str = "{}.{}".format(modules_key, basename)
@@ -468,6 +795,7 @@ def _load_addons_in_core(
                     default_module = __import__(import_str, fromlist=("", ))
                     sys.modules[new_import_str] = default_module
                     setattr(openpype_modules, basename, default_module)
+                    _store_core_manifest_entry(manifest, basename, fullpath)
 
                 else:
                     import_str = "ayon_core.hosts.{}".format(basename)
@@ -479,6 +807,9 @@ def _load_addons_in_core(
                         )
                         sys.modules[new_import_str] = default_module
                         setattr(openpype_modules, basename, default_module)
+                        _store_core_manifest_entry(
+                            manifest, basename, fullpath
+                        )
 
                     except Exception:
                         log.warning(
@@ -495,8 +826,18 @@ def _load_addons_in_core(
                     msg = "Failed to import addon '{}'.".format(fullpath)
                 log.error(msg, exc_info=True)
 
+            _LoadCache.import_times[basename] = time.time() - import_start
 
-def _load_addons():
+
+def _store_core_manifest_entry(manifest, basename, fullpath):
+    key = "ayon_core/{}".format(basename)
+    if manifest.get_entry(key, __version__, fullpath) is None:
+        manifest.set_entry(
+            key, __version__, fullpath, basename, module_path=fullpath
+        )
+
+
+def _load_addons(lazy=False):
     # Support to use 'openpype' imports
     sys.modules["openpype"] = sys.modules["ayon_core"]
 
@@ -508,12 +849,16 @@ def _load_addons():
 
     log = Logger.get_logger("AddonsLoader")
 
+    manifest = _AddonsManifest.load()
+    _LoadCache.manifest = manifest
+
     ignore_addon_names = _load_ayon_addons(
-        openpype_modules, modules_key, log
+        openpype_modules, modules_key, manifest, lazy, log
     )
     _load_addons_in_core(
-        ignore_addon_names, openpype_modules, modules_key, log
+        ignore_addon_names, openpype_modules, modules_key, manifest, log
     )
+    manifest.save()
 
 
 _MARKING_ATTR = "_marking"
@@ -747,31 +1092,57 @@ class _AddonReportInfo:
 class AddonsManager:
     """Manager of addons that helps to load and prepare them to work.
 
+    Lazy manager initializes addons known from discovery manifest on first
+    access to them. Addons are connected only when all of them are
+    initialized, so the first access to an addon by name, e.g. using
+    'get_enabled_addon', initializes and connects all addons if the
+    manager should connect them. Addon modules known from manifest are
+    also imported on first access to their content.
+
+    Report of time spent on addons startup is printed when environment
+    variable 'AYON_ADDONS_STARTUP_REPORT' is set to '1'.
+
     Args:
         settings (Optional[dict[str, Any]]): AYON studio settings.
         initialize (Optional[bool]): Initialize addons on init.
             True by default.
+        lazy (Optional[bool]): Initialize addons on demand. False by default.
     """
 
     # Helper attributes for report
     _report_total_key = "Total"
     _log = None
 
-    def __init__(self, settings=None, initialize=True):
+    def __init__(self, settings=None, initialize=True, lazy=False):
         self._settings = settings
+        self._lazy = lazy
 
         self._addons = []
         self._addons_by_id = {}
         self._addons_by_name = {}
+        # Addons which were not initialized yet
+        # - addon name -> (module alias, addon module, class name)
+        self._lazy_addon_classes = {}
+        self._lazy_addons_settings = None
+        self._lazy_connect = False
         # For report of time consumption
         self._report = {}
 
         if initialize:
             self.initialize_addons()
-            self.connect_addons()
+            if self._lazy_addon_classes:
+                self._lazy_connect = True
+            else:
+                self.connect_addons()
+
+            if os.getenv("AYON_ADDONS_STARTUP_REPORT") == "1":
+                self.print_report()
 
     def __getitem__(self, addon_name):
-        return self._addons_by_name[addon_name]
+        addon = self.get(addon_name)
+        if addon is None:
+            raise KeyError(addon_name)
+        return addon
 
     @property
     def log(self):
@@ -790,18 +1161,36 @@ class AddonsManager:
             Union[AYONAddon, Any]: Addon found by name or `default`.
         """
 
-        return self._addons_by_name.get(addon_name, default)
+        addon = self._addons_by_name.get(addon_name)
+        if addon is None and self._lazy_addon_classes:
+            if (
+                addon_name in self._lazy_addon_classes
+                and not self._lazy_connect
+            ):
+                addon = self._initialize_lazy_addon(addon_name)
+            else:
+                # Addons must be connected with all other addons, or name
+                #   might be an alias of not yet initialized addon
+                self._initialize_lazy_addons()
+                addon = self._addons_by_name.get(addon_name)
+
+        if addon is None:
+            return default
+        return addon
 
     @property
     def addons(self):
+        self._initialize_lazy_addons()
         return list(self._addons)
 
     @property
     def addons_by_id(self):
+        self._initialize_lazy_addons()
         return dict(self._addons_by_id)
 
     @property
     def addons_by_name(self):
+        self._initialize_lazy_addons()
         return dict(self._addons_by_name)
 
     def get_enabled_addon(self, addon_name, default=None):
@@ -830,6 +1219,7 @@ class AddonsManager:
             list[AYONAddon]: Initialized and enabled addons.
         """
 
+        self._initialize_lazy_addons()
         return [
             addon
             for addon in self._addons
@@ -837,9 +1227,14 @@ class AddonsManager:
         ]
 
     def initialize_addons(self):
-        """Import and initialize addons."""
+        """Import and initialize addons.
+
+        Addon classes known from discovery manifest are not looked up in
+        addon modules. If manager is lazy, the addons are only registered
+        to be initialized on demand.
+        """
         # Make sure modules are loaded
-        load_addons()
+        load_addons(lazy=self._lazy)
 
         import openpype_modules
 
@@ -851,85 +1246,77 @@ class AddonsManager:
             settings = get_studio_settings()
 
         modules_settings = {}
+        manifest = _LoadCache.manifest
 
+        import_report = {}
+        discovery_report = {}
         report = {}
         time_start = time.time()
-        prev_start_time = time_start
 
         addon_classes = []
-        for module in openpype_modules:
-            # Go through globals in `ayon_core.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   AYONAddon
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is AYONAddon
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, AYONAddon)
-                ):
-                    continue
-
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
+        for alias, module in openpype_modules.items():
+            discovery_start = time.time()
+            classes_info = None
+            if manifest is not None:
+                classes_info = manifest.get_addon_classes(alias)
+
+            if classes_info is not None and self._lazy:
+                for class_name, addon_name in classes_info:
+                    self._lazy_addon_classes[addon_name] = (
+                        alias, module, class_name
+                    )
+                continue
 
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
+            module_classes = None
+            if classes_info is not None:
+                module_classes = self._get_addon_classes_by_names(
+                    module, [class_name for class_name, _ in classes_info]
+                )
 
-                addon_classes.append(modules_item)
+            if module_classes is None:
+                module_classes = self._find_addon_classes(module)
+                classes_info = None
+
+            discovery_time = time.time() - discovery_start
+            import_time = _LoadCache.import_times.get(alias)
+            for addon_cls in module_classes:
+                addon_classes.append((alias, classes_info, addon_cls))
+                class_name = addon_cls.__name__
+                discovery_report[class_name] = discovery_time
+                if import_time is not None:
+                    import_report[class_name] = import_time
+                # Report time of module only once
+                discovery_time = 0.0
+                import_time = None
 
         aliased_names = []
-        for addon_cls in addon_classes:
-            name = addon_cls.__name__
-            if issubclass(addon_cls, OpenPypeModule):
-                # TODO change to warning
-                self.log.debug((
-                    "Addon '{}' is inherited from 'OpenPypeModule'."
-                    " Please use 'AYONAddon'."
-                ).format(name))
+        prev_start_time = time.time()
+        classes_by_alias = collections.defaultdict(list)
+        failed_aliases = set()
+        for alias, classes_info, addon_cls in addon_classes:
+            addon = self._initialize_addon(
+                addon_cls, settings, modules_settings, aliased_names
+            )
+            if addon is None:
+                failed_aliases.add(alias)
+            elif classes_info is None:
+                classes_by_alias[alias].append(
+                    (addon_cls.__name__, addon.name)
+                )
 
-            try:
-                # Try initialize module
-                if issubclass(addon_cls, OpenPypeModule):
-                    addon = addon_cls(self, modules_settings)
-                else:
-                    addon = addon_cls(self, settings)
-                # Store initialized object
-                self._addons.append(addon)
-                self._addons_by_id[addon.id] = addon
-                self._addons_by_name[addon.name] = addon
-                # NOTE This will be removed with release 1.0.0 of ayon-core
-                #   please use carefully.
-                # Gives option to use alias name for addon for cases when
-                #   name in OpenPype was not the same as in AYON.
-                name_alias = getattr(addon, "openpype_alias", None)
-                if name_alias:
-                    aliased_names.append((name_alias, addon))
-
-                now = time.time()
+            now = time.time()
+            if addon is not None:
                 report[addon.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+            prev_start_time = now
 
-            except Exception:
-                self.log.warning(
-                    "Initialization of addon '{}' failed.".format(name),
-                    exc_info=True
-                )
+        if manifest is not None:
+            for alias, classes_info in classes_by_alias.items():
+                if alias not in failed_aliases:
+                    manifest.set_addon_classes(alias, classes_info)
+            manifest.save()
+
+        if self._lazy_addon_classes:
+            self._lazy_addons_settings = (settings, modules_settings)
 
         for addon_name in sorted(self._addons_by_name.keys()):
             addon = self._addons_by_name[addon_name]
@@ -938,6 +1325,155 @@ class AddonsManager:
                 f"[{enabled_str}] {addon.name} ({addon.version})"
             )
 
+        self._apply_aliased_names(aliased_names)
+
+        if self._report is not None:
+            total_time = time.time() - time_start
+            import_report[self._report_total_key] = sum(
+                _LoadCache.import_times.values()
+            )
+            discovery_report[self._report_total_key] = sum(
+                discovery_report.values()
+            )
+            report[self._report_total_key] = total_time
+            self._report["Import"] = import_report
+            self._report["Discovery"] = discovery_report
+            self._report["Initialization"] = report
+
+    def _find_addon_classes(self, module):
+        """Find addon classes in module.
+
+        Args:
+            module (ModuleType): Addon module.
+
+        Returns:
+            list[type[AYONAddon]]: Addon classes which can be initialized.
+        """
+        addon_classes = []
+        try:
+            attr_names = dir(module)
+        except Exception:
+            # Lazy imported module is loaded on first access
+            self.log.warning(
+                "Failed to import addon module '{}'.".format(module),
+                exc_info=True
+            )
+            return addon_classes
+
+        # Go through globals in `ayon_core.modules`
+        for name in attr_names:
+            modules_item = getattr(module, name, None)
+            # Filter globals that are not classes which inherit from
+            #   AYONAddon
+            if (
+                not inspect.isclass(modules_item)
+                or modules_item is AYONAddon
+                or modules_item is OpenPypeModule
+                or modules_item is OpenPypeAddOn
+                or not issubclass(modules_item, AYONAddon)
+            ):
+                continue
+
+            # Check if class is abstract (Developing purpose)
+            if inspect.isabstract(modules_item):
+                # Find abstract attributes by convention on `abc` module
+                not_implemented = []
+                for attr_name in dir(modules_item):
+                    attr = getattr(modules_item, attr_name, None)
+                    abs_method = getattr(
+                        attr, "__isabstractmethod__", None
+                    )
+                    if attr and abs_method:
+                        not_implemented.append(attr_name)
+
+                # Log missing implementations
+                self.log.warning((
+                    "Skipping abstract Class: {}."
+                    " Missing implementations: {}"
+                ).format(name, ", ".join(not_implemented)))
+                continue
+
+            addon_classes.append(modules_item)
+        return addon_classes
+
+    def _get_addon_classes_by_names(self, module, class_names):
+        """Get addon classes from module by names stored in manifest.
+
+        Args:
+            module (ModuleType): Addon module.
+            class_names (list[str]): Names of addon classes.
+
+        Returns:
+            Union[list[type[AYONAddon]], None]: Addon classes or None if
+                any of classes is not available in module anymore.
+        """
+        addon_classes = []
+        for class_name in class_names:
+            try:
+                addon_cls = getattr(module, class_name, None)
+            except Exception:
+                addon_cls = None
+            if (
+                not inspect.isclass(addon_cls)
+                or not issubclass(addon_cls, AYONAddon)
+            ):
+                return None
+            addon_classes.append(addon_cls)
+        return addon_classes
+
+    def _initialize_addon(
+        self, addon_cls, settings, modules_settings, aliased_names
+    ):
+        """Initialize addon and store it to manager.
+
+        Args:
+            addon_cls (type[AYONAddon]): Addon class.
+            settings (dict[str, Any]): AYON studio settings.
+            modules_settings (dict[str, Any]): Settings for
+                'OpenPypeModule' addons.
+            aliased_names (list[tuple[str, AYONAddon]]): Alias names are
+                added to the list.
+
+        Returns:
+            Union[AYONAddon, None]: Initialized addon or None if
+                initialization failed.
+        """
+        name = addon_cls.__name__
+        if issubclass(addon_cls, OpenPypeModule):
+            # TODO change to warning
+            self.log.debug((
+                "Addon '{}' is inherited from 'OpenPypeModule'."
+                " Please use 'AYONAddon'."
+            ).format(name))
+
+        try:
+            # Try initialize module
+            if issubclass(addon_cls, OpenPypeModule):
+                addon = addon_cls(self, modules_settings)
+            else:
+                addon = addon_cls(self, settings)
+
+        except Exception:
+            self.log.warning(
+                "Initialization of addon '{}' failed.".format(name),
+                exc_info=True
+            )
+            return None
+
+        # Store initialized object
+        self._addons.append(addon)
+        self._addons_by_id[addon.id] = addon
+        self._addons_by_name[addon.name] = addon
+        # NOTE This will be removed with release 1.0.0 of ayon-core
+        #   please use carefully.
+        # Gives option to use alias name for addon for cases when
+        #   name in OpenPype was not the same as in AYON.
+        name_alias = getattr(addon, "openpype_alias", None)
+        if name_alias:
+            aliased_names.append((name_alias, addon))
+        return addon
+
+    def _apply_aliased_names(self, aliased_names):
         for item in aliased_names:
             name_alias, addon = item
             if name_alias not in self._addons_by_name:
@@ -949,15 +1485,81 @@ class AddonsManager:
                 )
             )
 
-        if self._report is not None:
-            report[self._report_total_key] = time.time() - time_start
-            self._report["Initialization"] = report
+    def _initialize_lazy_addon(self, addon_name):
+        """Initialize addon which was registered for lazy initialization.
+
+        Args:
+            addon_name (str): Addon name.
+
+        Returns:
+            Union[AYONAddon, None]: Initialized addon.
+        """
+        alias, module, class_name = self._lazy_addon_classes.pop(
+            addon_name
+        )
+        settings, modules_settings = self._lazy_addons_settings
+        start = time.time()
+        addon_classes = self._get_addon_classes_by_names(
+            module, [class_name]
+        )
+        classes_info = None
+        if addon_classes is None:
+            # Manifest is outdated, look for the classes in module
+            addon_classes = self._find_addon_classes(module)
+            classes_info = []
+        import_time = time.time() - start
+
+        aliased_names = []
+        addon = None
+        for addon_cls in addon_classes:
+            start = time.time()
+            _addon = self._initialize_addon(
+                addon_cls, settings, modules_settings, aliased_names
+            )
+            if _addon is None:
+                classes_info = None
+                continue
+
+            if classes_info is not None:
+                classes_info.append((addon_cls.__name__, _addon.name))
+
+            if self._report is not None:
+                self._report.setdefault("Import", {})[
+                    addon_cls.__name__] = import_time
+                self._report.setdefault("Initialization", {})[
+                    addon_cls.__name__] = time.time() - start
+            import_time = 0.0
+            self._lazy_addon_classes.pop(_addon.name, None)
+            if _addon.name == addon_name:
+                addon = _addon
+        self._apply_aliased_names(aliased_names)
+
+        manifest = _LoadCache.manifest
+        if classes_info is not None and manifest is not None:
+            manifest.set_addon_classes(alias, classes_info)
+            manifest.save()
+        return addon
+
+    def _initialize_lazy_addons(self):
+        """Initialize all addons which were not initialized yet."""
+        if not self._lazy_addon_classes:
+            return
+
+        for addon_name in tuple(self._lazy_addon_classes.keys()):
+            if addon_name in self._lazy_addon_classes:
+                self._initialize_lazy_addon(addon_name)
+
+        if self._lazy_connect:
+            self._lazy_connect = False
+            self.connect_addons()
 
     def connect_addons(self):
         """Trigger connection with other enabled addons.
 
         Addons should handle their interfaces in `connect_with_addons`.
         """
+        # Addons are connected now, skip connection on lazy initialization
+        self._lazy_connect = False
         report = {}
         time_start = time.time()
         prev_start_time = time_start
@@ -1226,9 +1828,10 @@ class AddonsManager:
             available_col_names |= set(addon_names.keys())
 
         # Prepare ordered dictionary for columns
+        # - use only initialized addons
         addons_info = [
             _AddonReportInfo.from_addon(addon, self._report)
-            for addon in self.addons
+            for addon in self._addons
             if addon.__class__.__name__ in available_col_names
         ]
         addons_info.sort(key=lambda x: x.name)
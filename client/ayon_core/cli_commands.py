@@ -162,7 +162,7 @@ class Commands:
             DeprecationWarning
         )
 
-        addons_manager = AddonsManager()
+        addons_manager = AddonsManager(lazy=True)
         applications_addon = addons_manager.get_enabled_addon("applications")
         if applications_addon is None:
             raise RuntimeError(
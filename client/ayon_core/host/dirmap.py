@@ -50,7 +50,7 @@ class HostDirmap(object):
     def sitesync_addon(self):
         if not self._sitesync_addon_discovered:
             self._sitesync_addon_discovered = True
-            manager = AddonsManager()
+            manager = AddonsManager(lazy=True)
             self._sitesync_addon = manager.get("sitesync")
         return self._sitesync_addon
 
@@ -48,7 +48,7 @@ def main(*subprocess_args):
     launcher.start()
 
     if os.environ.get("HEADLESS_PUBLISH"):
-        manager = AddonsManager()
+        manager = AddonsManager(lazy=True)
         webpublisher_addon = manager["webpublisher"]
 
         launcher.execute_in_main_thread(
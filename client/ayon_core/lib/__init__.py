@@ -99,6 +99,7 @@ from .dateutils import (
 from .python_module_tools import (
     import_filepath,
     modules_from_path,
+    clear_modules_from_path_cache,
     recursive_bases_from_class,
     classes_from_module,
     import_module_from_dirpath,
@@ -107,6 +108,8 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
+    ProfilesFilter,
+    get_profiles_filter,
     filter_profiles
 )
 
@@ -115,6 +118,8 @@ from .transcoding import (
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
+    MediaProbeCache,
+    get_media_probe_cache,
     get_ffprobe_data,
     get_ffprobe_streams,
     get_ffmpeg_codec_args,
@@ -127,6 +132,8 @@ from .transcoding import (
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
+    collect_files_stats,
 )
 
 from .path_tools import (
@@ -206,6 +213,7 @@ __all__ = [
 
     "import_filepath",
     "modules_from_path",
+    "clear_modules_from_path_cache",
     "recursive_bases_from_class",
     "classes_from_module",
     "import_module_from_dirpath",
@@ -215,6 +223,8 @@ __all__ = [
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
     "convert_input_paths_for_ffmpeg",
+    "MediaProbeCache",
+    "get_media_probe_cache",
     "get_ffprobe_data",
     "get_ffprobe_streams",
     "get_ffmpeg_codec_args",
@@ -225,10 +235,14 @@ __all__ = [
 
     "compile_list_of_regexes",
 
+    "ProfilesFilter",
+    "get_profiles_filter",
     "filter_profiles",
 
     "prepare_template_data",
     "source_hash",
+    "source_hash_from_stat",
+    "collect_files_stats",
 
     "format_file_size",
     "collect_frames",
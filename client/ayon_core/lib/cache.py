@@ -178,6 +178,59 @@ class NestedCacheItem:
         """
         return self[key]
 
+    def get_valid_data(self, keys):
+        """Get data of valid cache items for multiple keys at once.
+
+        Cache items are not created for keys that are not cached.
+
+        Args:
+            keys (Iterable[str]): Keys of cache items.
+
+        Returns:
+            tuple[dict[str, Any], set[str]]: Data by key of valid cache
+                items and keys which don't have valid data.
+
+        Raises:
+            AttributeError: If called on nested cache item with more
+                than one level.
+
+        """
+        if self._levels > 1:
+            raise AttributeError((
+                "{} does not support 'get_valid_data'."
+                " Lower nested level by {}"
+            ).format(self.__class__.__name__, self._levels - 1))
+
+        output = {}
+        missing_keys = set()
+        for key in keys:
+            cache = self._data_by_key.get(key)
+            if cache is not None and cache.is_valid:
+                output[key] = cache.get_data()
+            else:
+                missing_keys.add(key)
+        return output, missing_keys
+
+    def update_data_many(self, data_by_key):
+        """Update cached data for multiple keys at once.
+
+        Args:
+            data_by_key (dict[str, Any]): Data to cache by key.
+
+        Raises:
+            AttributeError: If called on nested cache item with more
+                than one level.
+
+        """
+        if self._levels > 1:
+            raise AttributeError((
+                "{} does not support 'update_data_many'."
+                " Lower nested level by {}"
+            ).format(self.__class__.__name__, self._levels - 1))
+
+        for key, value in data_by_key.items():
+            self[key].update_data(value)
+
     def cached_count(self):
         """Amount of cached items.
 
@@ -3,6 +3,7 @@ import os
 import re
 import copy
 import inspect
+import itertools
 import collections
 import logging
 import weakref
@@ -172,6 +173,10 @@ class EventCallback(object):
         self._topic = topic
         self._order = order
         self._enabled = True
+        # Sort key is set by event system on registration
+        self._sort_index = 0
+        # Function called when order of callback changes
+        self._order_changed_ref = None
         # Replace '*' with any character regex and escape rest of text
         #   - when callback is registered for '*' topic it will receive all
         #       events
@@ -293,9 +298,23 @@ class EventCallback(object):
 
         self._validate_order(order)
         self._order = order
+        if self._order_changed_ref is not None:
+            on_order_changed = self._order_changed_ref()
+            if on_order_changed is not None:
+                on_order_changed()
 
     order = property(get_order, set_order)
 
+    @property
+    def topic(self):
+        """Topic to which callback is registered.
+
+        Returns:
+            str: Topic which may contain '*'.
+        """
+
+        return self._topic
+
     def topic_matches(self, topic):
         """Check if event topic matches callback's topic.
 
@@ -315,6 +334,16 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        if self.topic_matches(event.topic):
+            self._process_matched_event(event)
+
+    def _process_matched_event(self, event):
+        """Process event which topic already matches callback's topic.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
         # Skip if callback is not enabled
         if not self._enabled:
             return
@@ -324,9 +353,6 @@ class EventCallback(object):
         if callback is None:
             return
 
-        if not self.topic_matches(event.topic):
-            return
-
         # Try to execute callback
         try:
             if self._expect_args:
@@ -346,6 +372,9 @@ class EventCallback(object):
                 exc_info=True
             )
 
+    def _get_sort_key(self):
+        return self._order, self._sort_index
+
     def _validate_order(self, order):
         if isinstance(order, int):
             return
@@ -380,6 +409,52 @@ class EventCallback(object):
             self._partial_func = None
 
 
+class _TopicTrie(object):
+    """Prefix tree of callbacks registered to topics with wildcards.
+
+    Callbacks are stored under the literal part of their topic before first
+    '*', so only callbacks with a prefix matching the topic are checked
+    with regex.
+    """
+
+    def __init__(self):
+        self._root = {}
+
+    def add(self, callback):
+        node = self._root
+        for char in callback.topic.split("*", 1)[0]:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(callback)
+
+    def remove(self, callback):
+        node = self._root
+        for char in callback.topic.split("*", 1)[0]:
+            node = node.get(char)
+            if node is None:
+                return
+        callbacks = node.get(None)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def get_matching(self, topic):
+        output = []
+        node = self._root
+        for char in itertools.chain(topic, (None, )):
+            callbacks = node.get(None)
+            if callbacks:
+                output.extend(
+                    callback
+                    for callback in callbacks
+                    if callback.topic_matches(topic)
+                )
+            if char is None:
+                break
+            node = node.get(char)
+            if node is None:
+                break
+        return output
+
+
 # Inherit from 'object' for Python 2 hosts
 class Event(object):
     """Base event object.
@@ -498,12 +573,23 @@ class EventSystem(object):
     Callbacks are stored by order of their registration, but it is possible to
     manually define order of callbacks using 'order' argument within
     'add_callback'.
+
+    Callbacks registered to exact topics are indexed by the topic and
+    callbacks with wildcards are stored in prefix tree. Sorted callbacks
+    matching a topic are cached until a callback is added, removed or its
+    order is changed. Only 'topic_cache_size' most recently emitted topics
+    are cached.
     """
 
     default_order = 100
+    topic_cache_size = 256
 
     def __init__(self):
         self._registered_callbacks = []
+        self._sort_index_iter = itertools.count()
+        self._exact_callbacks = collections.defaultdict(list)
+        self._wildcard_callbacks = _TopicTrie()
+        self._callbacks_by_topic = collections.OrderedDict()
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -524,7 +610,14 @@ class EventSystem(object):
             order = self.default_order
 
         callback = EventCallback(topic, callback, order)
+        callback._sort_index = next(self._sort_index_iter)
+        callback._order_changed_ref = WeakMethod(self._clear_topic_cache)
         self._registered_callbacks.append(callback)
+        if "*" in topic:
+            self._wildcard_callbacks.add(callback)
+        else:
+            self._exact_callbacks[topic].append(callback)
+        self._clear_topic_cache()
         return callback
 
     def create_event(self, topic, data, source):
@@ -575,13 +668,57 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
-        callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
-        ))
-        for callback in callbacks:
-            callback.process_event(event)
+        for callback in self._get_topic_callbacks(event.topic):
+            callback._process_matched_event(event)
             if not callback.is_ref_valid:
-                self._registered_callbacks.remove(callback)
+                self._remove_callback(callback)
+
+    def _get_topic_callbacks(self, topic):
+        """Sorted callbacks matching topic.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            tuple[EventCallback, ...]: Callbacks sorted by order.
+        """
+
+        callbacks = self._callbacks_by_topic.pop(topic, None)
+        if callbacks is None:
+            matching = list(self._exact_callbacks.get(topic, []))
+            matching.extend(self._wildcard_callbacks.get_matching(topic))
+            matching.sort(key=EventCallback._get_sort_key)
+            # Remove callbacks with destroyed references before caching
+            valid_callbacks = []
+            for callback in matching:
+                if callback.is_ref_valid:
+                    valid_callbacks.append(callback)
+                else:
+                    self._remove_callback(callback)
+            callbacks = tuple(valid_callbacks)
+
+        # Move topic to the end to keep most recently used topics
+        self._callbacks_by_topic[topic] = callbacks
+        while len(self._callbacks_by_topic) > self.topic_cache_size:
+            self._callbacks_by_topic.popitem(last=False)
+        return callbacks
+
+    def _remove_callback(self, callback):
+        if callback not in self._registered_callbacks:
+            return
+        self._registered_callbacks.remove(callback)
+        if "*" in callback.topic:
+            self._wildcard_callbacks.remove(callback)
+        else:
+            exact_callbacks = self._exact_callbacks.get(callback.topic)
+            if exact_callbacks and callback in exact_callbacks:
+                exact_callbacks.remove(callback)
+                if not exact_callbacks:
+                    self._exact_callbacks.pop(callback.topic)
+        self._clear_topic_cache()
+
+    def _clear_topic_cache(self):
+        self._callbacks_by_topic.clear()
 
 
 class QueuedEventSystem(EventSystem):
@@ -2,9 +2,17 @@ import os
 import logging
 import sys
 import errno
+import time
+import shutil
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    as_completed,
+)
+
 import six
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import create_hard_link, format_file_size
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -12,6 +20,23 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+# Linux ioctl request to clone file content (reflink) on CoW filesystems
+FICLONE = 0x40049409
+# Size of chunk copied by one kernel call
+KERNEL_COPY_CHUNK_SIZE = 1024 * 1024 * 64
+# Errors meaning that kernel copy is not supported for the files
+_KERNEL_COPY_UNSUPPORTED_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+# Kernel copy methods that are not supported between devices
+#   - key is tuple of source and destination device ids
+_unsupported_kernel_copies = {}
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -23,6 +48,117 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+def _reflink_file(src_fd, dst_fd):
+    import fcntl
+
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd, dst_fd):
+    while os.copy_file_range(src_fd, dst_fd, KERNEL_COPY_CHUNK_SIZE):
+        pass
+
+
+def _sendfile(src_fd, dst_fd):
+    offset = 0
+    while True:
+        sent = os.sendfile(dst_fd, src_fd, offset, KERNEL_COPY_CHUNK_SIZE)
+        if not sent:
+            break
+        offset += sent
+
+
+def _get_kernel_copy_methods():
+    methods = [("reflink", _reflink_file)]
+    if hasattr(os, "copy_file_range"):
+        methods.append(("copy_file_range", _copy_file_range))
+    if hasattr(os, "sendfile"):
+        methods.append(("sendfile", _sendfile))
+    return methods
+
+
+def kernel_copyfile(src, dst):
+    """Copy file content using kernel calls without userspace buffers.
+
+    Tries to clone the file using reflink (FICLONE) which is available on
+    copy-on-write filesystems (e.g. XFS, btrfs). Then falls back to
+    'copy_file_range' and 'sendfile'. If none of them is supported for
+    the source and destination, the file is copied with 'shutil.copyfile'.
+
+    Methods which are not supported between two devices are remembered so
+    they are not tried again for next files.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+
+    """
+    if not sys.platform.startswith("linux"):
+        copyfile(src, dst)
+        return
+
+    with open(src, "rb") as src_stream:
+        src_fd = src_stream.fileno()
+        src_dev = os.fstat(src_fd).st_dev
+        for name, func in _get_kernel_copy_methods():
+            # Open destination for each attempt to truncate any data
+            #   written by previous failed attempt
+            with open(dst, "wb") as dst_stream:
+                dst_fd = dst_stream.fileno()
+                devices_key = (src_dev, os.fstat(dst_fd).st_dev)
+                unsupported = _unsupported_kernel_copies.setdefault(
+                    devices_key, set()
+                )
+                if name in unsupported:
+                    continue
+
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                try:
+                    func(src_fd, dst_fd)
+                    return
+                except OSError as exc:
+                    if exc.errno not in _KERNEL_COPY_UNSUPPORTED_ERRNOS:
+                        raise
+                    unsupported.add(name)
+
+    shutil.copyfile(src, dst)
+
+
+def _transfer_file(src, dst, mode, copy_backend=None, fallback_src=None):
+    """Transfer single file from source to destination.
+
+    Function is defined on module level so it can be pickled and used by
+    process pool workers.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+        mode (int): Transfer mode 'FileTransaction.MODE_COPY' or
+            'FileTransaction.MODE_HARDLINK'.
+        copy_backend (Optional[str]): Backend used to copy files.
+        fallback_src (Optional[str]): Source path copied to destination
+            when hardlink can't be created.
+
+    Returns:
+        int: Number of copied bytes. Hardlinks don't copy any data.
+
+    """
+    if mode == FileTransaction.MODE_HARDLINK:
+        try:
+            create_hard_link(src, dst)
+            return 0
+        except OSError:
+            if fallback_src is None:
+                raise
+        src = fallback_src
+
+    if copy_backend == FileTransaction.COPY_BACKEND_KERNEL:
+        kernel_copyfile(src, dst)
+    else:
+        copyfile(src, dst)
+    return os.path.getsize(dst)
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -47,19 +183,67 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Files can be transferred in parallel using a pool of workers. Backups
+    are always created before any file is transferred and only destinations
+    of successfully transferred files are marked as transferred, so rollback
+    works the same way as with serial transfer.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for messages.
+        allow_queue_replacements (Optional[bool]): Allow to replace queued
+            transfer to a destination by a transfer from different source.
+        max_workers (Optional[int]): Maximum number of parallel transfers.
+            Files are transferred one by one if is lower than 2.
+        use_processes (Optional[bool]): Use process pool instead of thread
+            pool for parallel transfers. Can be useful for large files.
+        progress_callback (Optional[Callable]): Function called after each
+            transferred file. Called with destination path, number of
+            processed transfers, total number of transfers, transferred
+            bytes and elapsed time in seconds.
+        copy_backend (Optional[str]): Backend used to copy files.
+            'COPY_BACKEND_KERNEL' uses kernel calls (reflink,
+            copy_file_range, sendfile) on Linux, see 'kernel_copyfile'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    COPY_BACKEND_DEFAULT = "default"
+    COPY_BACKEND_KERNEL = "kernel"
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        use_processes=False,
+        progress_callback=None,
+        copy_backend=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if not max_workers or max_workers < 1:
+            max_workers = 1
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._progress_callback = progress_callback
+
+        if copy_backend is None:
+            copy_backend = self.COPY_BACKEND_DEFAULT
+        if copy_backend not in (
+            self.COPY_BACKEND_DEFAULT,
+            self.COPY_BACKEND_KERNEL,
+        ):
+            raise ValueError(
+                "Unknown copy backend '{}'".format(copy_backend))
+        self._copy_backend = copy_backend
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -72,16 +256,21 @@ class FileTransaction(object):
 
         self._allow_queue_replacements = allow_queue_replacements
 
-    def add(self, src, dst, mode=MODE_COPY):
+    def add(self, src, dst, mode=MODE_COPY, fallback_src=None):
         """Add a new file to transfer queue.
 
         Args:
             src (str): Source path.
             dst (str): Destination path.
             mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            fallback_src (Optional[str]): Source path which is copied to
+                destination if hardlink can't be created, e.g. when source
+                and destination are on different devices.
         """
 
-        opts = {"mode": mode}
+        if fallback_src is not None:
+            fallback_src = os.path.normpath(os.path.abspath(fallback_src))
+        opts = {"mode": mode, "fallback_src": fallback_src}
 
         src = os.path.normpath(os.path.abspath(src))
         dst = os.path.normpath(os.path.abspath(dst))
@@ -125,7 +314,8 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
-        # Copy the files to transfer
+        # Prepare the files to transfer
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -133,18 +323,110 @@ class FileTransaction(object):
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
+            transfers.append(
+                (src, dst, opts["mode"], opts.get("fallback_src"))
+            )
+
+        if not transfers:
+            return
+
+        # Create all destination folders at once
+        self._create_folders_for_files(
+            transfer[1] for transfer in transfers
+        )
+
+        progress = _TransferProgress(len(transfers))
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_parallel(transfers, progress)
+        else:
+            self._process_serial(transfers, progress)
+
+        elapsed = progress.elapsed
+        speed = 0
+        if elapsed > 0:
+            speed = progress.transferred_bytes / elapsed
+        self.log.debug(
+            "Transferred {} files ({}) in {:.2f}s ({}/s)".format(
+                progress.processed,
+                format_file_size(progress.transferred_bytes),
+                elapsed,
+                format_file_size(speed)
+            )
+        )
+
+    def _process_serial(self, transfers, progress):
+        for src, dst, mode, fallback_src in transfers:
+            self._log_transfer(src, dst, mode)
+            size = _transfer_file(
+                src, dst, mode, self._copy_backend, fallback_src
+            )
+            self._on_file_transferred(dst, size, progress)
+
+    def _process_parallel(self, transfers, progress):
+        if self._use_processes:
+            executor_cls = ProcessPoolExecutor
+        else:
+            executor_cls = ThreadPoolExecutor
+
+        exc_info = None
+        with executor_cls(max_workers=self._max_workers) as executor:
+            futures = {}
+            for src, dst, mode, fallback_src in transfers:
+                self._log_transfer(src, dst, mode)
+                future = executor.submit(
+                    _transfer_file,
+                    src,
+                    dst,
+                    mode,
+                    self._copy_backend,
+                    fallback_src,
+                )
+                futures[future] = dst
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                dst = futures[future]
+                try:
+                    size = future.result()
+                except Exception:
+                    # Keep first error and don't start any other transfers
+                    if exc_info is None:
+                        exc_info = sys.exc_info()
+                        for _future in futures:
+                            _future.cancel()
+                    continue
+
+                self._on_file_transferred(dst, size, progress)
+
+        if exc_info is not None:
+            six.reraise(*exc_info)
+
+    def _log_transfer(self, src, dst, mode):
+        if mode == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+        elif mode == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+
+    def _on_file_transferred(self, dst, size, progress):
+        self._transferred.append(dst)
+        progress.add(size)
+        if self._progress_callback is None:
+            return
 
-            self._create_folder_for_file(dst)
-
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
-
-            self._transferred.append(dst)
+        try:
+            self._progress_callback(
+                dst,
+                progress.processed,
+                progress.total,
+                progress.transferred_bytes,
+                progress.elapsed
+            )
+        except Exception:
+            self.log.warning(
+                "Failed to report transfer progress.", exc_info=True)
 
     def finalize(self):
         # Delete any backed up files
@@ -195,6 +477,14 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    def _create_folders_for_files(self, paths):
+        dirnames = set()
+        for path in paths:
+            dirname = os.path.dirname(path)
+            if dirname not in dirnames:
+                dirnames.add(dirname)
+                self._create_folder_for_file(path)
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -212,3 +502,21 @@ class FileTransaction(object):
             return os.stat(src) == os.stat(dst)
 
         return src == dst
+
+
+class _TransferProgress(object):
+    """Progress of transfers processed by 'FileTransaction'."""
+
+    def __init__(self, total):
+        self.total = total
+        self.processed = 0
+        self.transferred_bytes = 0
+        self._start_time = time.time()
+
+    @property
+    def elapsed(self):
+        return time.time() - self._start_time
+
+    def add(self, size):
+        self.processed += 1
+        self.transferred_bytes += size
@@ -4,6 +4,18 @@ import numbers
 
 import six
 
+# disable lru cache in Python 2
+try:
+    from functools import lru_cache
+except ImportError:
+    def lru_cache(maxsize):
+        def max_size(func):
+            def wrapper(*args, **kwargs):
+                value = func(*args, **kwargs)
+                return value
+            return wrapper
+        return max_size
+
 KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
@@ -40,8 +52,61 @@ class TemplateUnsolved(Exception):
         )
 
 
+@lru_cache(maxsize=2048)
+def _get_template_parts(template):
+    """Parse template string to parts.
+
+    Parsed parts are cached by template string and shared across all
+    'StringTemplate' objects using the same template (e.g. templates of
+    multiple 'AnatomyTemplates' objects). Parts are not changed during
+    formatting so they can be shared.
+
+    Args:
+        template (str): Template string.
+
+    Returns:
+        tuple[Union[str, FormattingPart, OptionalPart], ...]: Template
+            parts.
+    """
+    parts = []
+    last_end_idx = 0
+    for item in KEY_PATTERN.finditer(template):
+        start, end = item.span()
+        if start > last_end_idx:
+            parts.append(template[last_end_idx:start])
+        parts.append(FormattingPart(template[start:end]))
+        last_end_idx = end
+
+    if last_end_idx < len(template):
+        parts.append(template[last_end_idx:len(template)])
+
+    new_parts = []
+    for part in parts:
+        if not isinstance(part, six.string_types):
+            new_parts.append(part)
+            continue
+
+        substr = ""
+        for char in part:
+            if char not in ("<", ">"):
+                substr += char
+            else:
+                if substr:
+                    new_parts.append(substr)
+                new_parts.append(char)
+                substr = ""
+        if substr:
+            new_parts.append(substr)
+
+    return tuple(StringTemplate.find_optional_parts(new_parts))
+
+
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsing of template is cached by template string, so creating multiple
+    objects with the same template is cheap.
+    """
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -49,37 +114,7 @@ class StringTemplate(object):
             ))
 
         self._template = template
-        parts = []
-        last_end_idx = 0
-        for item in KEY_PATTERN.finditer(template):
-            start, end = item.span()
-            if start > last_end_idx:
-                parts.append(template[last_end_idx:start])
-            parts.append(FormattingPart(template[start:end]))
-            last_end_idx = end
-
-        if last_end_idx < len(template):
-            parts.append(template[last_end_idx:len(template)])
-
-        new_parts = []
-        for part in parts:
-            if not isinstance(part, six.string_types):
-                new_parts.append(part)
-                continue
-
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
-
-        self._parts = self.find_optional_parts(new_parts)
+        self._parts = _get_template_parts(template)
 
     def __str__(self):
         return self.template
@@ -142,6 +177,25 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_items, strict=False):
+        """Format template with multiple data items.
+
+        Each data item is formatted with 'format' (or 'format_strict'),
+            reusing parts of this template object. This is a convenience
+            for formatting of many items, e.g. frames of a sequence,
+            formatting of each item is the same as calling 'format'.
+
+        Args:
+            data_items (Iterable[dict]): Data used to fill template.
+            strict (Optional[bool]): Validate each result. Raise
+                'TemplateUnsolved' if any of results is not solved.
+
+        Returns:
+            list[TemplateResult]: Results in order of passed data items.
+        """
+        format_func = self.format_strict if strict else self.format
+        return [format_func(data) for data in data_items]
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -440,6 +494,17 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Pre-compute key lookup path
+        key = template[1:-1]
+        # check if key expects subdictionary keys (e.g. project[name])
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -468,17 +533,13 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -145,9 +145,91 @@ def source_hash(filepath, *args):
         filepath (str): The source file path.
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
+    """
+    return source_hash_from_stat(filepath, os.stat(filepath), *args)
+
+
+def source_hash_from_stat(filepath, stat_result, *args):
+    """Generate source hash using already collected stat of a file.
+
+    Output is the same as from 'source_hash' but the file is not accessed.
+
+    Args:
+        filepath (str): The source file path.
+        stat_result (os.stat_result): Stat result of the file.
+        *args (str): Additional 'processing' values.
+
+    Returns:
+        str: Source hash of the file.
+
     """
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    time = str(stat_result.st_mtime)
+    size = str(stat_result.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
+
+
+def _collect_dir_files_stats(dirpath, filenames):
+    output = {}
+    if dirpath and os.path.isdir(dirpath):
+        with os.scandir(dirpath) as scan_iter:
+            for entry in scan_iter:
+                if entry.name in filenames:
+                    output[entry.name] = entry.stat()
+
+    # Files that were not found by scandir (e.g. different letter case
+    #   on case-insensitive filesystem) are stat-ed directly
+    for filename in filenames:
+        if filename not in output:
+            output[filename] = os.stat(os.path.join(dirpath, filename))
+    return dirpath, output
+
+
+def collect_files_stats(filepaths, max_workers=None):
+    """Collect stat of multiple files at once.
+
+    Files are grouped by directory and each directory is scanned once using
+    'os.scandir', so each file is stat-ed only once. Directories can be
+    scanned in parallel.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        max_workers (Optional[int]): Maximum number of directories scanned
+            at the same time. Directories are scanned one by one if is
+            lower than 2.
+
+    Returns:
+        dict[str, os.stat_result]: Stat result by passed filepath.
+
+    Raises:
+        OSError: If any of the files does not exist.
+
+    """
+    filepaths = list(filepaths)
+    filenames_by_dir = collections.defaultdict(set)
+    for filepath in filepaths:
+        dirpath, filename = os.path.split(filepath)
+        filenames_by_dir[dirpath].add(filename)
+
+    items = list(filenames_by_dir.items())
+    if max_workers and max_workers > 1 and len(items) > 1:
+        # Python 3 only module
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda item: _collect_dir_files_stats(*item), items
+            ))
+    else:
+        results = [
+            _collect_dir_files_stats(dirpath, filenames)
+            for dirpath, filenames in items
+        ]
+
+    stats_by_dir = dict(results)
+    output = {}
+    for filepath in filepaths:
+        dirpath, filename = os.path.split(filepath)
+        output[filepath] = stats_by_dir[dirpath][filename]
+    return output
@@ -1,8 +1,17 @@
 import re
 import logging
+import collections
 
 log = logging.getLogger(__name__)
 
+# Characters which make a filter value a regex instead of exact value
+_REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+# Maximum number of cached profile filters
+_PROFILES_FILTERS_CACHE_SIZE = 64
+# Maximum number of cached results of one profiles filter
+_PROFILES_RESULTS_CACHE_SIZE = 256
+_profiles_filters_cache = collections.OrderedDict()
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +125,245 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+class ProfilesFilter:
+    """Filter of profiles with compiled filter values and cached results.
+
+    Filter values of profiles are compiled only once, exact values (without
+    regex characters) are compared by lookup in a set and results are cached
+    by key values. Result is the same as from 'filter_profiles'.
+
+    Profiles must not be modified after the filter is created.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles_data):
+        self._profiles = list(profiles_data or [])
+        # Compiled matchers by key for each profile
+        self._matchers = [{} for _ in self._profiles]
+        self._results_cache = collections.OrderedDict()
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for key values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if
+                is available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        if not keys_order:
+            keys_order = tuple(key_values.keys())
+        else:
+            _keys_order = list(keys_order)
+            # Make all keys from `key_values` are passed
+            for key in key_values.keys():
+                if key not in _keys_order:
+                    _keys_order.append(key)
+            keys_order = tuple(_keys_order)
+
+        cache_key = None
+        try:
+            cache_key = (
+                keys_order,
+                tuple(key_values[key] for key in keys_order)
+            )
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._results_cache:
+            # Move result to the end to keep most recently used results
+            profile = self._results_cache.pop(cache_key)
+            self._results_cache[cache_key] = profile
+            logger.debug("Profile selected (cached): {}".format(profile))
+            return profile
+
+        profile = self._filter(key_values, keys_order, logger)
+        if cache_key is not None:
+            self._results_cache[cache_key] = profile
+            while len(self._results_cache) > _PROFILES_RESULTS_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
+        return profile
+
+    def _get_matcher(self, profile_idx, key):
+        matchers = self._matchers[profile_idx]
+        matcher = matchers.get(key)
+        if matcher is not None:
+            return matcher
+
+        in_list = self._profiles[profile_idx].get(key)
+        if in_list and not isinstance(in_list, (list, tuple, set)):
+            in_list = [in_list]
+
+        if not in_list or "*" in in_list:
+            matcher = (False, None, None)
+        else:
+            exact_values = set()
+            regex_values = []
+            for item in in_list:
+                if (
+                    isinstance(item, str)
+                    and not _REGEX_CHARS.intersection(item)
+                ):
+                    exact_values.add(item)
+                else:
+                    regex_values.append(item)
+            matcher = (
+                True,
+                exact_values,
+                tuple(compile_list_of_regexes(regex_values))
+            )
+        matchers[key] = matcher
+        return matcher
+
+    def _validate_value(self, profile_idx, key, value):
+        has_filter, exact_values, regexes = self._get_matcher(
+            profile_idx, key
+        )
+        if not has_filter:
+            return 0
+
+        # If value is not set and in list has specific values then resolve
+        #   value as not matching.
+        if not value:
+            return -1
+
+        if not isinstance(value, str):
+            return validate_value_by_regexes(
+                value, self._profiles[profile_idx].get(key)
+            )
+
+        if value in exact_values:
+            return 1
+
+        for regex in regexes:
+            if hasattr(regex, "fullmatch"):
+                result = regex.fullmatch(value)
+            else:
+                result = fullmatch(regex, value)
+            if result:
+                return 1
+        return -1
+
+    def _filter(self, key_values, keys_order, logger):
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
+
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
+
+        matching_profiles = None
+        highest_profile_points = -1
+        # Each profile get 1 point for each matching filter. Profile with
+        # most points is returned. For cases when more than one profile will
+        # match are also stored ordered lists of matching values.
+        for profile_idx, profile in enumerate(self._profiles):
+            profile_points = 0
+            profile_scores = []
+
+            for key in keys_order:
+                value = key_values[key]
+                match = self._validate_value(profile_idx, key, value)
+                if match == -1:
+                    profile_value = profile.get(key) or []
+                    logger.debug(
+                        "\"{}\" not found in \"{}\": {}".format(
+                            value, key, profile_value
+                        )
+                    )
+                    profile_points = -1
+                    break
+
+                profile_points += match
+                profile_scores.append(bool(match))
+
+            if (
+                profile_points < 0
+                or profile_points < highest_profile_points
+            ):
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            if profile_points == highest_profile_points:
+                matching_profiles.append((profile, profile_scores))
+
+        if not matching_profiles:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
+            return None
+
+        if len(matching_profiles) > 1:
+            logger.debug(
+                "More than one profile match your setup. {}".format(
+                    log_parts
+                )
+            )
+
+        profile = _profile_exclusion(matching_profiles, logger)
+        if profile:
+            logger.debug(
+                "Profile selected: {}".format(profile)
+            )
+        return profile
+
+
+def get_profiles_filter(profiles_data):
+    """Get cached profiles filter for profiles.
+
+    Filters are cached by identity of passed profiles, so the same filter
+    is returned for the same profiles object e.g. for plugin attribute
+    or for profiles from the same settings object.
+
+    Profiles must not be modified after the filter is created.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+
+    Returns:
+        ProfilesFilter: Filter of profiles.
+    """
+    cache_key = id(profiles_data)
+    item = _profiles_filters_cache.get(cache_key)
+    # Cache item holds reference to profiles so the id can't be reused
+    if item is not None and item[0] is profiles_data:
+        # Move filter to the end to keep most recently used filters
+        _profiles_filters_cache[cache_key] = _profiles_filters_cache.pop(
+            cache_key
+        )
+        return item[1]
+
+    profiles_filter = ProfilesFilter(profiles_data)
+    _profiles_filters_cache[cache_key] = (profiles_data, profiles_filter)
+    while len(_profiles_filters_cache) > _PROFILES_FILTERS_CACHE_SIZE:
+        _profiles_filters_cache.popitem(last=False)
+    return profiles_filter
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -134,6 +382,9 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Use 'get_profiles_filter' when the same profiles are filtered multiple
+    times.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -149,79 +400,6 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
+    return ProfilesFilter(profiles_data).filter(
+        key_values, keys_order, logger
     )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
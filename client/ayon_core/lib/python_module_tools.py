@@ -45,11 +45,166 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+def _compile_filepath(filepath, module_name):
+    """Compile python file to code object.
+
+    Args:
+        filepath (str): Path to python file.
+        module_name (str): Name of module.
+
+    Returns:
+        types.CodeType: Compiled code of the file.
+    """
+    if six.PY3:
+        # Loader reuses bytecode cache of the file if is available
+        module_loader = importlib.machinery.SourceFileLoader(
+            module_name, filepath
+        )
+        return module_loader.get_code(module_name)
+
+    with open(filepath) as _stream:
+        return compile(_stream.read(), filepath, "exec")
+
+
+class _ModulesFromPathCache(object):
+    """Cache of compiled python files from directories.
+
+    Only compiled code of files is cached. New module objects are created
+    and executed on each call, so classes never keep attributes that were
+    set on them after previous discovery, e.g. applied settings.
+
+    Compiled code is reused until modification time or size of file
+    changes. Content of directory is listed again only when modification
+    time of the directory changes. Files which crashed on import are
+    imported again on each call.
+
+    In frozen mode (environment variable 'AYON_PLUGINS_DISCOVERY_FROZEN'
+    set to '1'), files are not checked for changes and crashed files are
+    not imported again once the directory was processed. That is useful
+    for processes where plugins can't change, e.g. on farm.
+    """
+
+    def __init__(self):
+        # Directory path -> (directory mtime, file paths)
+        self._filepaths_by_dir = {}
+        # File path -> (file stat key, code object)
+        self._code_by_path = {}
+        # File path -> exc info of last failed import
+        self._crashed_by_path = {}
+
+    @staticmethod
+    def is_frozen():
+        return os.getenv("AYON_PLUGINS_DISCOVERY_FROZEN") == "1"
+
+    def clear(self):
+        self._filepaths_by_dir.clear()
+        self._code_by_path.clear()
+        self._crashed_by_path.clear()
+
+    def get_modules(self, folder_path):
+        """Get python modules from a directory.
+
+        Args:
+            folder_path (str): Normalized path to existing directory.
+
+        Returns:
+            tuple[list, list]: Modules and crashed files in the same format
+                as 'modules_from_path'.
+        """
+        frozen = self.is_frozen()
+        dir_item = self._filepaths_by_dir.get(folder_path)
+        if frozen and dir_item is not None:
+            filepaths = dir_item[1]
+        else:
+            filepaths = self._get_filepaths(folder_path, dir_item)
+
+        modules = []
+        crashed = []
+        for filepath in filepaths:
+            if frozen and filepath in self._crashed_by_path:
+                crashed.append((filepath, self._crashed_by_path[filepath]))
+                continue
+
+            mod_name = os.path.splitext(os.path.basename(filepath))[0]
+            try:
+                code = self._get_code(filepath, mod_name, frozen)
+                if code is None:
+                    continue
+                # Make sure it is not 'unicode' in Python 2
+                module = types.ModuleType(str(mod_name))
+                module.__file__ = filepath
+                six.exec_(code, module.__dict__)
+
+            except Exception:
+                exc_info = sys.exc_info()
+                self._crashed_by_path[filepath] = exc_info
+                crashed.append((filepath, exc_info))
+                continue
+            self._crashed_by_path.pop(filepath, None)
+            modules.append((filepath, module))
+        return modules, crashed
+
+    def _get_code(self, filepath, mod_name, frozen):
+        cached_item = self._code_by_path.get(filepath)
+        if frozen and cached_item is not None:
+            return cached_item[1]
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            self._code_by_path.pop(filepath, None)
+            return None
+
+        stat_key = (stat.st_mtime, stat.st_size)
+        if cached_item is not None and cached_item[0] == stat_key:
+            return cached_item[1]
+
+        self._code_by_path.pop(filepath, None)
+        code = _compile_filepath(filepath, mod_name)
+        self._code_by_path[filepath] = (stat_key, code)
+        return code
+
+    def _get_filepaths(self, folder_path, dir_item):
+        dir_mtime = os.stat(folder_path).st_mtime
+        if dir_item is not None and dir_item[0] == dir_mtime:
+            return dir_item[1]
+
+        filepaths = []
+        for filename in os.listdir(folder_path):
+            # Ignore files which start with underscore
+            if filename.startswith("_"):
+                continue
+
+            mod_name, mod_ext = os.path.splitext(filename)
+            if not mod_ext == ".py":
+                continue
+
+            full_path = os.path.join(folder_path, filename)
+            if not os.path.isfile(full_path):
+                continue
+            filepaths.append(full_path)
+
+        # Forget modules of removed files
+        if dir_item is not None:
+            for filepath in set(dir_item[1]) - set(filepaths):
+                self._code_by_path.pop(filepath, None)
+                self._crashed_by_path.pop(filepath, None)
+
+        self._filepaths_by_dir[folder_path] = (dir_mtime, filepaths)
+        return filepaths
+
+
+_modules_from_path_cache = _ModulesFromPathCache()
+
+
+def modules_from_path(folder_path, use_cache=False):
     """Get python scripts as modules from a path.
 
     Arguments:
         path (str): Path to folder containing python scripts.
+        use_cache (Optional[bool]): Reuse compiled code of files from
+            previous calls if files did not change. Modules are always
+            created and executed again.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -75,6 +230,19 @@ def modules_from_path(folder_path):
         log.warning("Not a directory path: {}".format(folder_path))
         return output
 
+    if use_cache:
+        _modules, _crashed = _modules_from_path_cache.get_modules(
+            folder_path
+        )
+        modules.extend(_modules)
+        crashed.extend(_crashed)
+        for full_path, exc_info in _crashed:
+            log.warning(
+                "Failed to load path: \"{0}\"".format(full_path),
+                exc_info=exc_info
+            )
+        return output
+
     for filename in os.listdir(folder_path):
         # Ignore files which start with underscore
         if filename.startswith("_"):
@@ -103,6 +271,14 @@ def modules_from_path(folder_path):
     return output
 
 
+def clear_modules_from_path_cache():
+    """Clear cache of modules used by 'modules_from_path'.
+
+    Next call of 'modules_from_path' with cache will compile all files again.
+    """
+    _modules_from_path_cache.clear()
+
+
 def recursive_bases_from_class(klass):
     """Extract all bases from entered class."""
     result = []
@@ -1,14 +1,19 @@
 import os
 import re
+import copy
+import hashlib
 import logging
 import json
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -78,11 +83,188 @@ def get_transcode_temp_directory():
     )
 
 
+class MediaProbeCache:
+    """Process-wide cache of media probe results.
+
+    Results of 'oiiotool' and 'ffprobe' probes are cached by path,
+    modification time and size of the file and by probe arguments, so each
+    unchanged file is probed only once. Least recently used items are
+    removed when cache is full.
+
+    Results can be also stored to a directory, which is used when cache
+    does not contain the result in memory. The directory can be defined
+    with 'AYON_MEDIA_PROBE_CACHE_DIR' environment variable.
+
+    Args:
+        max_items (Optional[int]): Maximum number of cached results.
+        persistent_dir (Optional[str]): Directory where results are stored.
+
+    """
+    def __init__(self, max_items=512, persistent_dir=None):
+        if persistent_dir is None:
+            persistent_dir = os.environ.get("AYON_MEDIA_PROBE_CACHE_DIR")
+        self.enabled = True
+        self._max_items = max_items
+        self._persistent_dir = persistent_dir or None
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = collections.Counter()
+
+    def set_persistent_dir(self, persistent_dir):
+        """Change directory where results are stored.
+
+        Args:
+            persistent_dir (Union[str, None]): Directory path. Results are
+                not stored on disk if is 'None'.
+
+        """
+        self._persistent_dir = persistent_dir or None
+
+    def get_stats(self):
+        """Statistics of cache usage.
+
+        Returns:
+            dict[str, int]: Count of 'hits', 'disk_hits', 'misses',
+                'uncached' (file could not be stat-ed) and 'evictions'.
+
+        """
+        with self._lock:
+            output = {
+                key: self._stats[key]
+                for key in (
+                    "hits", "disk_hits", "misses", "uncached", "evictions"
+                )
+            }
+            output["items"] = len(self._items)
+        return output
+
+    def clear(self):
+        """Remove all cached results from memory and reset statistics."""
+        with self._lock:
+            self._items.clear()
+            self._stats.clear()
+
+    def get_value(self, probe_name, filepath, probe_args, probe_func):
+        """Get cached probe result or probe the file.
+
+        Args:
+            probe_name (str): Name of probe e.g. 'ffprobe'.
+            filepath (str): Path to probed file.
+            probe_args (tuple): Arguments that affect result of the probe.
+            probe_func (Callable[[], Any]): Function that probes the file.
+
+        Returns:
+            Any: Copy of probe result.
+
+        """
+        key = self._get_key(probe_name, filepath, probe_args)
+        if key is None:
+            with self._lock:
+                self._stats["uncached"] += 1
+            return probe_func()
+
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self._stats["hits"] += 1
+                return copy.deepcopy(self._items[key])
+
+        value = self._load_persistent(key)
+        if value is not None:
+            stat_key = "disk_hits"
+        else:
+            stat_key = "misses"
+            value = probe_func()
+            self._store_persistent(key, value)
+
+        with self._lock:
+            self._stats[stat_key] += 1
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+                self._stats["evictions"] += 1
+        return copy.deepcopy(value)
+
+    def _get_key(self, probe_name, filepath, probe_args):
+        if not self.enabled:
+            return None
+        try:
+            stat_result = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (
+            probe_name,
+            os.path.normpath(os.path.abspath(filepath)),
+            stat_result.st_mtime,
+            stat_result.st_size,
+            tuple(probe_args),
+        )
+
+    def _get_persistent_path(self, key):
+        if not self._persistent_dir:
+            return None
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._persistent_dir, key_hash + ".json")
+
+    def _load_persistent(self, key):
+        path = self._get_persistent_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as stream:
+                return json.load(stream)
+        except (OSError, ValueError):
+            return None
+
+    def _store_persistent(self, key, value):
+        path = self._get_persistent_path(key)
+        if not path:
+            return
+        try:
+            content = json.dumps(value)
+        except (TypeError, ValueError):
+            # Value can't be stored e.g. contains 'RationalToInt'
+            return
+
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            os.makedirs(self._persistent_dir, exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                stream.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+_media_probe_cache = MediaProbeCache()
+
+
+def get_media_probe_cache():
+    """Process-wide cache of 'oiiotool' and 'ffprobe' results.
+
+    Returns:
+        MediaProbeCache: Media probe cache.
+
+    """
+    return _media_probe_cache
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Results are cached
+    by 'MediaProbeCache'.
     """
+    return _media_probe_cache.get_value(
+        "oiiotool",
+        filepath,
+        (subimages, ),
+        lambda: _get_oiio_info_for_input(filepath, logger, subimages)
+    )
+
+
+def _get_oiio_info_for_input(filepath, logger, subimages):
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -656,10 +838,69 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_oiio_conversion_inputs(input_paths, frames_per_batch):
+    """Split input paths to batches converted by single oiiotool process.
+
+    Consecutive frames of a sequence are batched together using oiiotool
+    frame range syntax ('--frames 1001-1010 image.%04d.exr').
+
+    Args:
+        input_paths (list[str]): Paths to convert.
+        frames_per_batch (int): Maximum number of frames in one batch.
+
+    Returns:
+        list[tuple[Union[str, None], str]]: Frame range argument and input
+            path. Frame range is 'None' for single file conversion.
+
+    """
+    if frames_per_batch < 2:
+        return [(None, input_path) for input_path in input_paths]
+
+    src_collections, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        minimum_items=2
+    )
+    output = [(None, input_path) for input_path in remainders]
+    for collection in src_collections:
+        frames = sorted(collection.indexes)
+        if (
+            "%" in collection.head
+            or "%" in collection.tail
+            or frames[0] < 0
+        ):
+            output.extend((None, input_path) for input_path in collection)
+            continue
+
+        path_template = collection.format("{head}{padding}{tail}")
+        chunks = []
+        chunk = []
+        for frame in frames:
+            if chunk and (
+                frame != chunk[-1] + 1
+                or len(chunk) >= frames_per_batch
+            ):
+                chunks.append(chunk)
+                chunk = []
+            chunk.append(frame)
+        if chunk:
+            chunks.append(chunk)
+
+        for chunk in chunks:
+            if len(chunk) == 1:
+                output.append((None, path_template % chunk[0]))
+            else:
+                frames_arg = "{}-{}".format(chunk[0], chunk[-1])
+                output.append((frames_arg, path_template))
+    return output
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=1,
+    frames_per_batch=1,
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,12 +913,21 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Conversions can run in parallel oiiotool processes. Consecutive frames
+    can be converted in batches by single oiiotool process to reduce process
+    startup cost.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of oiiotool processes
+            running at the same time. Number of CPUs is used if is set
+            to 'None'. Conversions run one by one by default.
+        frames_per_batch (Optional[int]): Maximum number of frames converted
+            by one oiiotool process.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -706,13 +956,52 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
+    # Attributes are same for all inputs because information is loaded
+    #   only from first file
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+
+    oiio_cmds = []
+    for frames_arg, input_path in _get_oiio_conversion_inputs(
+        input_paths, frames_per_batch or 1
+    ):
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
             # Don't add any additional attributes
             "--nosoftwareattrib",
         )
+        if frames_arg:
+            oiio_cmd.extend(["--frames", frames_arg])
+
         # Add input compression if available
         if compression:
             oiio_cmd.extend(["--compression", compression])
@@ -725,36 +1014,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -762,19 +1022,48 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append(oiio_cmd)
 
+    def _convert(oiio_cmd):
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(oiio_cmds))
+    if max_workers < 2:
+        for oiio_cmd in oiio_cmds:
+            _convert(oiio_cmd)
+        return
+
+    # Python 3 only module
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume results to re-raise first error
+        for _ in executor.map(_convert, oiio_cmds):
+            pass
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Results are cached by 'MediaProbeCache'.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
+    return _media_probe_cache.get_value(
+        "ffprobe",
+        path_to_file,
+        (),
+        lambda: _get_ffprobe_data(path_to_file, logger)
+    )
+
+
+def _get_ffprobe_data(path_to_file, logger):
     if not logger:
         logger = logging.getLogger(__name__)
     logger.debug(
@@ -6,15 +6,21 @@ It provides Deadline JobInfo data class.
 """
 import json.decoder
 import os
+import sys
+import time
+import threading
 from abc import abstractmethod
 import platform
 import getpass
 from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import attr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 import pyblish.api
 from ayon_core.pipeline.publish import (
@@ -28,6 +34,114 @@ from ayon_core.pipeline.publish.lib import (
 
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
+# Default timeout of requests to Deadline Webservice in seconds
+DEADLINE_REQUEST_TIMEOUT = 10
+
+
+class DeadlineClient(object):
+    """Client of Deadline Webservice with pooled connections.
+
+    Connections are reused by all requests. Requests which failed to
+    connect are retried with exponential backoff. Other requests than
+    POST are also retried on any connection error or response that
+    the server is temporarily unavailable. POST requests which might have
+    reached the server are not retried to avoid duplicated jobs.
+
+    Client can be used from multiple threads, use 'get_deadline_client'
+    to get shared client.
+
+    Args:
+        max_retries (int): Number of retries of failed request.
+        backoff_factor (float): Delay before first retry in seconds,
+            doubled with each retry.
+        pool_size (int): Maximum number of connections kept per host.
+
+    """
+    retry_status_codes = {502, 503, 504}
+    # Methods which can't be safely repeated if request reached the server
+    not_idempotent_methods = {"POST", "PATCH"}
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, pool_size=10):
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._session = session
+
+    def request(self, method, url, **kwargs):
+        auth = kwargs.get("auth")
+        if auth:
+            kwargs["auth"] = tuple(auth)  # explicit cast to tuple
+        kwargs.setdefault("timeout", DEADLINE_REQUEST_TIMEOUT)
+
+        idempotent = method.upper() not in self.not_idempotent_methods
+        attempt = 0
+        while True:
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except requests.exceptions.ConnectionError as exc:
+                if (
+                    attempt >= self._max_retries
+                    or not (idempotent or self._is_not_sent_error(exc))
+                ):
+                    raise
+            else:
+                if (
+                    not idempotent
+                    or response.status_code not in self.retry_status_codes
+                    or attempt >= self._max_retries
+                ):
+                    return response
+            time.sleep(self._backoff_factor * (2 ** attempt))
+            attempt += 1
+
+    @staticmethod
+    def _is_not_sent_error(exc):
+        """Connection error happened before request was sent.
+
+        Args:
+            exc (requests.exceptions.ConnectionError): Connection error.
+
+        Returns:
+            bool: Request did not reach the server.
+
+        """
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+        # Reason of 'MaxRetryError' from urllib3
+        reason = exc.args[0] if exc.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, NewConnectionError)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+_deadline_client = None
+_deadline_client_lock = threading.Lock()
+
+
+def get_deadline_client():
+    """Shared Deadline Webservice client.
+
+    Returns:
+        DeadlineClient: Client used by all submissions of the process.
+
+    """
+    global _deadline_client
+    with _deadline_client_lock:
+        if _deadline_client is None:
+            _deadline_client = DeadlineClient()
+    return _deadline_client
+
 
 def requests_post(*args, **kwargs):
     """Wrap request post method.
@@ -37,17 +151,14 @@ def requests_post(*args, **kwargs):
     running with self-signed certificates and its certificate is not
     added to trusted certificates on client machines.
 
+    Request uses shared 'DeadlineClient'.
+
     Warning:
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
 
     """
-    auth = kwargs.get("auth")
-    if auth:
-        kwargs["auth"] = tuple(auth)  # explicit cast to tuple
-    # add 10sec timeout before bailing out
-    kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    return get_deadline_client().post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -58,17 +169,14 @@ def requests_get(*args, **kwargs):
     running with self-signed certificates and its certificate is not
     added to trusted certificates on client machines.
 
+    Request uses shared 'DeadlineClient'.
+
     Warning:
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
 
     """
-    auth = kwargs.get("auth")
-    if auth:
-        kwargs["auth"] = tuple(auth)
-    # add 10sec timeout before bailing out
-    kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    return get_deadline_client().get(*args, **kwargs)
 
 
 class DeadlineKeyValueVar(dict):
@@ -416,6 +524,8 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
     use_published = True
     asset_dependencies = False
     default_priority = 50
+    # Number of jobs submitted at the same time by 'submit_many'
+    submission_max_workers = 8
 
     def __init__(self, *args, **kwargs):
         super(AbstractSubmitDeadline, self).__init__(*args, **kwargs)
@@ -591,6 +701,99 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
+        result = self._submit_payload(payload, auth, verify)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_many(self, payloads, auth, verify):
+        """Submit multiple payloads to Deadline at the same time.
+
+        Payloads must not depend on each other, submit dependent jobs
+        after their dependencies were submitted.
+
+        Args:
+            payloads (list[dict]): dicts to become json in deadline
+                submissions.
+            auth (tuple): (username, password)
+            verify (bool): verify SSL certificate if present
+
+        Returns:
+            list[str]: resulting Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails. Jobs which were
+                submitted are deleted.
+
+        """
+        if not payloads:
+            return []
+
+        max_workers = min(self.submission_max_workers, len(payloads))
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(self._submit_payload, payload, auth, verify)
+                for payload in payloads
+            ]
+
+        results = []
+        exc_info = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception:
+                if exc_info is None:
+                    exc_info = sys.exc_info()
+
+        if exc_info is not None:
+            self._delete_jobs(
+                [result["_id"] for result in results], auth, verify
+            )
+            six.reraise(*exc_info)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
+
+        return [result["_id"] for result in results]
+
+    def _delete_jobs(self, job_ids, auth, verify):
+        """Delete submitted jobs, e.g. when sibling submission failed.
+
+        Args:
+            job_ids (list[str]): Deadline job ids.
+            auth (tuple): (username, password)
+            verify (bool): verify SSL certificate if present
+
+        """
+        if not job_ids:
+            return
+
+        self.log.warning(
+            "Deleting already submitted jobs: {}".format(", ".join(job_ids))
+        )
+        url = "{}/api/jobs".format(self._deadline_url)
+        try:
+            response = get_deadline_client().request(
+                "DELETE",
+                url,
+                params={"JobID": ",".join(job_ids)},
+                auth=auth,
+                verify=verify,
+            )
+            ok = response.ok
+        except requests.exceptions.RequestException:
+            ok = False
+            self.log.warning("Request to delete jobs failed.", exc_info=True)
+
+        if not ok:
+            self.log.error(
+                "Failed to delete submitted jobs, please remove them"
+                " manually: {}".format(", ".join(job_ids))
+            )
+
+    def _submit_payload(self, payload, auth, verify):
         url = "{}/api/jobs".format(self._deadline_url)
         response = requests_post(
             url, json=payload, auth=auth, verify=verify)
@@ -602,14 +805,9 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             raise KnownPublishError(response.text)
 
         try:
-            result = response.json()
+            return response.json()
         except JSONDecodeError:
             msg = "Broken response {}. ".format(response)
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
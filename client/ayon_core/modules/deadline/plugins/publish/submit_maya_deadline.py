@@ -454,11 +454,15 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             "Submitting tile job(s) [{}] ...".format(len(frame_payloads)))
 
         # Submit frame tile jobs
-        frame_tile_job_id = {}
-        for frame, tile_job_payload in frame_payloads.items():
-            job_id = self.submit(tile_job_payload,
-                                 instance.data["deadline"]["auth"])
-            frame_tile_job_id[frame] = job_id
+        auth = instance.data["deadline"]["auth"]
+        verify = instance.data["deadline"]["verify"]
+        frames = list(frame_payloads.keys())
+        tile_job_ids = self.submit_many(
+            [frame_payloads[frame] for frame in frames],
+            auth=auth,
+            verify=verify
+        )
+        frame_tile_job_id = dict(zip(frames, tile_job_ids))
 
         # Define assembly payloads
         assembly_job_info = copy.deepcopy(job_info)
@@ -557,22 +561,16 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
                 )
             )
 
-        # Submit assembly jobs
-        assembly_job_ids = []
-        num_assemblies = len(assembly_payloads)
-        auth = instance.data["deadline"]["auth"]
-        verify = instance.data["deadline"]["verify"]
-        for i, payload in enumerate(assembly_payloads):
-            self.log.debug(
-                "submitting assembly job {} of {}".format(i + 1,
-                                                          num_assemblies)
-            )
-            assembly_job_id = self.submit(
-                payload,
-                auth=auth,
-                verify=verify
-            )
-            assembly_job_ids.append(assembly_job_id)
+        # Submit assembly jobs after tile jobs they depend on
+        self.log.debug(
+            "Submitting assembly job(s) [{}] ...".format(
+                len(assembly_payloads))
+        )
+        assembly_job_ids = self.submit_many(
+            assembly_payloads,
+            auth=auth,
+            verify=verify
+        )
 
         instance.data["assemblySubmissionJobs"] = assembly_job_ids
 
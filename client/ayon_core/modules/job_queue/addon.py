@@ -27,6 +27,8 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are stored to database so they survive restart of the server, it is
+    possible to specify path to the database file
 
 ### start_worker
 - start worker which will process jobs
@@ -144,12 +146,50 @@ class JobQueueAddon(AYONAddon):
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
 
+    def send_jobs(self, host_name, jobs_data):
+        """Send multiple jobs in one request.
+
+        Args:
+            host_name (str): Host name which should process the jobs.
+            jobs_data (Iterable[dict[str, Any]]): Data of jobs. Job data can
+                contain "priority", jobs with higher priority are processed
+                first.
+
+        Returns:
+            list[str]: Ids of created jobs.
+        """
+        import requests
+
+        payload = []
+        for job_data in jobs_data:
+            job_data = dict(job_data or {})
+            job_data["host_name"] = host_name
+            payload.append(job_data)
+        api_path = "{}/api/jobs/bulk".format(self._server_url)
+        return requests.post(api_path, data=json.dumps(payload)).json()
+
     def get_job_status(self, job_id):
         import requests
 
         api_path = "{}/api/jobs/{}".format(self._server_url, job_id)
         return requests.get(api_path).json()
 
+    def get_jobs_status(self, job_ids):
+        """Statuses of multiple jobs in one request.
+
+        Args:
+            job_ids (Iterable[str]): Job ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Job status by job id.
+        """
+        import requests
+
+        api_path = "{}/api/jobs/status".format(self._server_url)
+        return requests.post(
+            api_path, data=json.dumps(list(job_ids))
+        ).json()
+
     def cli(self, click_group):
         click_group.add_command(cli_main.to_click_obj())
 
@@ -163,10 +203,13 @@ class JobQueueAddon(AYONAddon):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, db_path=None):
+        from ayon_core.lib.local_settings import get_ayon_appdirs
         from .job_server import main
 
-        return main(port, host)
+        if not db_path:
+            db_path = get_ayon_appdirs("job_queue", "jobs.db")
+        return main(port, host, db_path)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -225,8 +268,9 @@ def cli_main():
 )
 @click_wrap.option("--port", help="Server port")
 @click_wrap.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueAddon.start_server(port, host)
+@click_wrap.option("--db_path", help="Path to database file with jobs")
+def cli_start_server(port, host, db_path):
+    JobQueueAddon.start_server(port, host, db_path)
 
 
 @cli_main.command(
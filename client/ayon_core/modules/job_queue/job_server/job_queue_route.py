@@ -13,6 +13,8 @@ class JobQueueResource:
 
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
+            ("POST", "/jobs/bulk", self.post_jobs),
+            ("POST", "/jobs/status", self.get_jobs_status),
             ("GET", "/jobs", self.get_jobs),
             ("GET", "/jobs/{job_id}", self.get_job)
         )
@@ -40,9 +42,56 @@ class JobQueueResource:
                 status=400, message="Key \"host_name\" not filled."
             )
 
-        job = self._job_queue.create_job(host_name, data)
+        try:
+            job = self._job_queue.create_job(host_name, data)
+        except ValueError as exc:
+            return Response(status=400, text=str(exc))
         return Response(status=201, text=job.id)
 
+    async def post_jobs(self, request):
+        """Create multiple jobs at once.
+
+        Body is list of job data, each must have filled "host_name".
+        Response contains list of created job ids.
+        """
+        jobs_data = await request.json()
+        if not isinstance(jobs_data, list):
+            return Response(status=400, text="Expected list of jobs.")
+
+        jobs_info = []
+        for job_data in jobs_data:
+            if not isinstance(job_data, dict):
+                return Response(status=400, text="Expected job data.")
+            host_name = job_data.get("host_name")
+            if not host_name:
+                return Response(
+                    status=400, text="Key \"host_name\" not filled."
+                )
+            jobs_info.append((host_name, job_data))
+
+        try:
+            jobs = self._job_queue.create_jobs(jobs_info)
+        except ValueError as exc:
+            return Response(status=400, text=str(exc))
+        return Response(
+            status=201,
+            body=self.encode([job.id for job in jobs]),
+            content_type="application/json"
+        )
+
+    async def get_jobs_status(self, request):
+        """Statuses of multiple jobs by list of job ids in body."""
+        job_ids = await request.json()
+        if not isinstance(job_ids, list):
+            return Response(status=400, text="Expected list of job ids.")
+
+        content = self._job_queue.get_jobs_status(job_ids)
+        return Response(
+            status=200,
+            body=self.encode(content),
+            content_type="application/json"
+        )
+
     async def get_job(self, request):
         job_id = request.match_info["job_id"]
         content = self._job_queue.get_job_status(job_id)
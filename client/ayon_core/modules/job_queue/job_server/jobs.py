@@ -1,4 +1,10 @@
+import os
+import json
+import heapq
+import sqlite3
 import datetime
+import itertools
+import threading
 import collections
 from uuid import uuid4
 
@@ -11,7 +17,9 @@ class Job:
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self, host_name, data, job_id=None, created_time=None, priority=0
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
@@ -22,6 +30,7 @@ class Job:
         self._done_time = None
         self.host_name = host_name
         self.data = data
+        self.priority = priority
         self._result_data = None
 
         self._started = False
@@ -48,6 +57,34 @@ class Job:
     def done(self):
         return self._done
 
+    @property
+    def created_time(self):
+        return self._created_time
+
+    @property
+    def done_time(self):
+        return self._done_time
+
+    @property
+    def message(self):
+        return self._message
+
+    @property
+    def result_data(self):
+        return self._result_data
+
+    @property
+    def state(self):
+        if self._deleted:
+            return "deleted"
+        if self._errored:
+            return "error"
+        if self._done:
+            return "done"
+        if self._started:
+            return "started"
+        return "waiting"
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -104,39 +141,253 @@ class Job:
             "done": self._done
         }
         output["message"] = self._message or None
+        output["result"] = self._result_data
+        output["state"] = self.state
 
-        state = "waiting"
-        if self._deleted:
-            state = "deleted"
-        elif self._errored:
-            state = "error"
-        elif self._done:
-            state = "done"
-        elif self._started:
-            state = "started"
+        return output
 
-        output["result"] = self._result_data
 
-        output["state"] = state
+class JobStore:
+    """Durable storage of jobs in SQLite database.
 
-        return output
+    Database uses write-ahead log, so reads of jobs don't block writes.
+    Jobs which were waiting are loaded back to queue when server starts
+    again. Jobs which were already started are marked as errored because
+    it is not known if worker finished them.
+
+    Args:
+        db_path (str): Path to database file.
+    """
+
+    def __init__(self, db_path):
+        dirpath = os.path.dirname(os.path.abspath(db_path))
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " id TEXT UNIQUE NOT NULL,"
+                " host_name TEXT NOT NULL,"
+                " priority INTEGER NOT NULL DEFAULT 0,"
+                " data TEXT NOT NULL,"
+                " state TEXT NOT NULL,"
+                " message TEXT,"
+                " result TEXT,"
+                " created_time REAL NOT NULL,"
+                " done_time REAL"
+                ")"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state)"
+            )
+
+    def add_jobs(self, jobs):
+        """Store new jobs.
+
+        Args:
+            jobs (Iterable[Job]): Jobs to store.
+        """
+        rows = [
+            (
+                job.id,
+                job.host_name,
+                job.priority,
+                json.dumps(job.data),
+                job.state,
+                job.created_time.timestamp(),
+            )
+            for job in jobs
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO jobs"
+                " (id, host_name, priority, data, state, created_time)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def update_job(self, job):
+        """Store current state of a job.
+
+        Args:
+            job (Job): Job to update.
+        """
+        done_time = None
+        if job.done_time is not None:
+            done_time = job.done_time.timestamp()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET state = ?, message = ?, result = ?,"
+                " done_time = ? WHERE id = ?",
+                (
+                    job.state,
+                    job.message,
+                    json.dumps(job.result_data),
+                    done_time,
+                    job.id,
+                )
+            )
+
+    def set_started_jobs_interrupted(self, message):
+        """Mark started jobs as errored.
+
+        Args:
+            message (str): Message of errored jobs.
+        """
+        done_time = datetime.datetime.now().timestamp()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET state = 'error', message = ?,"
+                " done_time = ? WHERE state = 'started'",
+                (message, done_time)
+            )
+
+    def get_unfinished_jobs(self):
+        """Jobs which were not started in order of creation.
+
+        Returns:
+            list[Job]: Jobs waiting for processing.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, host_name, priority, data, created_time"
+                " FROM jobs WHERE state = 'waiting'"
+                " ORDER BY seq"
+            ).fetchall()
+
+        return [
+            Job(
+                host_name,
+                json.loads(data),
+                job_id=job_id,
+                created_time=datetime.datetime.fromtimestamp(created_time),
+                priority=priority,
+            )
+            for job_id, host_name, priority, data, created_time in rows
+        ]
+
+    def get_job_status(self, job_id):
+        """Status of stored job.
+
+        Args:
+            job_id (str): Job id.
+
+        Returns:
+            Union[dict[str, Any], None]: Job status or None if job is not
+                stored.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state, message, result FROM jobs WHERE id = ?",
+                (job_id, )
+            ).fetchone()
+
+        if row is None:
+            return None
+        state, message, result = row
+        return {
+            "id": job_id,
+            "worker_id": None,
+            "done": state in ("done", "error"),
+            "message": message or None,
+            "result": json.loads(result) if result else None,
+            "state": state,
+        }
+
+    def remove_done_jobs(self, older_than):
+        """Remove finished jobs.
+
+        Args:
+            older_than (datetime.datetime): Remove jobs finished before.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM jobs WHERE done_time IS NOT NULL"
+                " AND done_time < ?",
+                (older_than.timestamp(), )
+            )
 
 
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Jobs of each host name are ordered by
+    priority (higher first) and order of creation.
+
+    Jobs are stored to database if 'db_path' is passed, so they are not
+    lost when server is restarted.
+
+    Args:
+        db_path (Optional[str]): Path to database file where jobs are
+            stored.
     """
     old_jobs_check_minutes_interval = 30
+    # Jobs are errored if there is no worker for their host name
+    #   for this time
+    missing_worker_timeout_seconds = 60
 
-    def __init__(self):
+    def __init__(self, db_path=None):
         self._last_old_jobs_check = datetime.datetime.now()
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        # Heap of (-priority, order, job) by host name
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        self._queue_order = itertools.count()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._missing_worker_time_by_host_name = {}
+        self._jobs_changed_callbacks = []
+
+        self._store = None
+        if db_path:
+            self._store = JobStore(db_path)
+            self._store.set_started_jobs_interrupted(
+                "Job was interrupted by restart of server"
+            )
+            for job in self._store.get_unfinished_jobs():
+                self._jobs_by_id[job.id] = job
+                self._push_job(job)
+
+    def add_jobs_changed_callback(self, callback):
+        """Callback called when jobs can be assigned to workers.
+
+        Callbacks are called on thread which changed the queue.
+
+        Args:
+            callback (Callable[[], None]): Callback without arguments.
+        """
+        self._jobs_changed_callbacks.append(callback)
+
+    def _notify_jobs_changed(self):
+        for callback in self._jobs_changed_callbacks:
+            callback()
+
+    def _push_job(self, job, first=False):
+        order = next(self._queue_order)
+        # Re-queued jobs are before other jobs with the same priority
+        if first:
+            order = -order
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (-job.priority, order, job)
+        )
+
+    def _pop_job(self, host_name):
+        jobs = self._job_queue_by_host_name.get(host_name)
+        while jobs:
+            _, _, job = heapq.heappop(jobs)
+            if not job.deleted:
+                return job
+        return None
+
+    def _store_job(self, job):
+        if self._store is not None:
+            self._store.update_job(job)
 
     def workers(self):
         """All currently registered workers."""
@@ -147,6 +398,7 @@ class JobQueue:
         print("Added new worker for \"{}\"".format(host_name))
         self._workers_by_id[worker.id] = worker
         self._workers_by_host_name[host_name].append(worker)
+        self._notify_jobs_changed()
 
     def get_worker(self, worker_id):
         return self._workers_by_id.get(worker_id)
@@ -158,8 +410,10 @@ class JobQueue:
             # Reset job
             job.set_worker(None)
             job.reset()
+            self._store_job(job)
             # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            self._push_job(job, first=True)
+            self._notify_jobs_changed()
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
@@ -172,30 +426,42 @@ class JobQueue:
     def assign_jobs(self):
         """Try to assign job for each idle worker.
 
-        Error all jobs without needed worker.
+        Error all jobs without needed worker for
+            'missing_worker_timeout_seconds'.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
+        now = datetime.datetime.now()
+        for host_name, jobs in self._job_queue_by_host_name.items():
+            if not jobs:
+                continue
+
+            workers = self._workers_by_host_name.get(host_name)
+            if workers:
+                self._missing_worker_time_by_host_name.pop(host_name, None)
+                for worker in workers:
+                    if not jobs:
                         break
+                    if not worker.is_idle():
+                        continue
+                    job = self._pop_job(host_name)
+                    if job is not None:
+                        worker.set_current_job(job)
+                        job.set_started()
+                        self._store_job(job)
+                continue
 
-        for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+            missing_time = self._missing_worker_time_by_host_name.setdefault(
+                host_name, now
+            )
+            delta = now - missing_time
+            if delta.total_seconds() < self.missing_worker_timeout_seconds:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
+            while jobs:
+                job = self._pop_job(host_name)
+                if job is not None:
                     job.set_done(False, message)
+                    self._store_job(job)
         self._remove_old_jobs()
 
     def get_jobs(self):
@@ -207,22 +473,75 @@ class JobQueue:
 
     def create_job(self, host_name, job_data):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
-        self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
-        return job
+        return self.create_jobs([(host_name, job_data)])[0]
+
+    def create_jobs(self, jobs_info):
+        """Create multiple jobs and add them to queue.
+
+        Priority of job is taken from "priority" key in job data.
+
+        Args:
+            jobs_info (Iterable[tuple[str, dict[str, Any]]]): Host name and
+                job data of each job.
+
+        Returns:
+            list[Job]: Created jobs.
+
+        Raises:
+            ValueError: Priority of any job is not an integer. No job
+                is created.
+        """
+        jobs = []
+        for host_name, job_data in jobs_info:
+            priority = job_data.get("priority")
+            if priority is None:
+                priority = 0
+            elif (
+                not isinstance(priority, int)
+                or isinstance(priority, bool)
+            ):
+                raise ValueError(
+                    "Priority must be an integer, got \"{}\"".format(
+                        priority
+                    )
+                )
+            jobs.append(Job(host_name, job_data, priority=priority))
+        if self._store is not None:
+            self._store.add_jobs(jobs)
+
+        for job in jobs:
+            self._jobs_by_id[job.id] = job
+            self._push_job(job)
+        self._notify_jobs_changed()
+        return jobs
+
+    def finish_job(self, job_id, success=True, message=None, data=None):
+        """Mark job as done with result from worker."""
+        job = self._jobs_by_id.get(job_id)
+        if job is None:
+            return
+        job.set_done(success, message, data)
+        self._store_job(job)
+        self._notify_jobs_changed()
 
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        now = datetime.datetime.now()
+        delta = now - self._last_old_jobs_check
+        if delta.total_seconds() < self.old_jobs_check_minutes_interval * 60:
             return
+        self._last_old_jobs_check = now
 
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
 
+        if self._store is not None:
+            self._store.remove_done_jobs(
+                now - datetime.timedelta(days=Job.keep_in_memory_days)
+            )
+
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
         job = self._jobs_by_id.get(job_id)
@@ -230,11 +549,32 @@ class JobQueue:
             return
 
         job.set_deleted()
+        self._store_job(job)
         self._jobs_by_id.pop(job.id)
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
         job = self._jobs_by_id.get(job_id)
-        if job is None:
-            return {}
-        return job.status()
+        if job is not None:
+            return job.status()
+
+        if self._store is not None:
+            status = self._store.get_job_status(job_id)
+            if status is not None:
+                return status
+        return {}
+
+    def get_jobs_status(self, job_ids):
+        """Statuses of multiple jobs.
+
+        Args:
+            job_ids (Iterable[str]): Job ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Job status by job id. Status is empty
+                for unknown jobs.
+        """
+        return {
+            job_id: self.get_job_status(job_id)
+            for job_id in job_ids
+        }
@@ -17,6 +17,9 @@ class WorkerRpc(JsonRpc):
         self._manager = manager
 
         self._stopped = False
+        # Event is created in the loop
+        self._jobs_changed_event = None
+        self._job_queue.add_jobs_changed_callback(self._on_jobs_changed)
 
         # Register methods
         self.add_methods(
@@ -35,27 +38,37 @@ class WorkerRpc(JsonRpc):
         self._job_queue.add_worker(worker)
         return worker.id
 
+    def _on_jobs_changed(self):
+        # Wake up rpc loop to send jobs to idle workers right away
+        if self._jobs_changed_event is not None:
+            self._jobs_changed_event.set()
+
     async def _rpc_loop(self):
+        self._jobs_changed_event = asyncio.Event()
         while self.loop.is_running():
             if self._stopped:
                 break
 
+            self._jobs_changed_event.clear()
             for worker in tuple(self._job_queue.workers()):
                 if not worker.connection_is_alive():
                     self._job_queue.remove_worker(worker)
             self._job_queue.assign_jobs()
 
             await self.send_jobs()
-            await asyncio.sleep(5)
+            try:
+                await asyncio.wait_for(
+                    self._jobs_changed_event.wait(), timeout=5
+                )
+            except asyncio.TimeoutError:
+                pass
 
     async def job_done(self, worker_id, job_id, success, message, data):
         worker = self._job_queue.get_worker(worker_id)
         if worker is not None:
             worker.set_current_job(None)
 
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.finish_job(job_id, success, message, data)
         return True
 
     async def send_jobs(self):
@@ -1,11 +1,15 @@
 import re
 import os
 import json
+import uuid
+import atexit
 import contextlib
 import functools
 import platform
 import tempfile
 import warnings
+import threading
+import subprocess
 from copy import deepcopy
 
 import ayon_api
@@ -16,8 +20,11 @@ from ayon_core.lib import (
     filter_profiles,
     StringTemplate,
     run_ayon_launcher_process,
+    get_ayon_launcher_args,
     Logger,
+    CREATE_NO_WINDOW,
 )
+from ayon_core.lib.execute import clean_envs_for_ayon_process
 from ayon_core.lib.transcoding import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 from ayon_core.pipeline import Anatomy
 from ayon_core.pipeline.template_data import get_template_data
@@ -31,6 +38,8 @@ class CachedData:
     has_compatible_ocio_package = None
     config_version_data = {}
     ocio_config_colorspaces = {}
+    # OCIO config objects with modification time by config path
+    ocio_configs = {}
     allowed_exts = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
     }
@@ -430,9 +439,138 @@ def validate_imageio_colorspace_in_config(config_path, colorspace_name):
     return True
 
 
+class _OCIOWrapperProcessError(Exception):
+    """OCIO wrapper process failed or is not running."""
+    pass
+
+
+class _OCIOWrapperProcess:
+    """Long-lived OCIO wrapper process answering queries.
+
+    Process is started with first query and is used for all following
+    queries, so AYON launcher startup is done only once. Requests and
+    responses are json lines sent over stdin and stdout of the process,
+    response lines are prefixed with random token to be able to skip
+    other output of the process.
+
+    Process loads each OCIO config only once and caches results of
+    queries by config path and its modification time.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._token = uuid.uuid4().hex
+        self._process = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.stop)
+        return cls._instance
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def query(self, command, kwargs):
+        """Send query to the process and wait for response.
+
+        Args:
+            command (str): Command name.
+            kwargs (dict[str, Any]): Command arguments.
+
+        Returns:
+            Any: Result of the command.
+
+        Raises:
+            _OCIOWrapperProcessError: Process failed to answer.
+            RuntimeError: Command failed in the process.
+
+        """
+        request = json.dumps({"command": command, "kwargs": kwargs})
+        with self._lock:
+            try:
+                if not self.is_running():
+                    self._start()
+                self._process.stdin.write(request + "\n")
+                self._process.stdin.flush()
+                response = self._read_response()
+
+            except (IOError, OSError, ValueError) as exc:
+                self._stop()
+                raise _OCIOWrapperProcessError(str(exc))
+
+            except _OCIOWrapperProcessError:
+                self._stop()
+                raise
+
+        if "error" in response:
+            raise RuntimeError(
+                "OCIO wrapper command '{}' failed: {}".format(
+                    command, response["error"]
+                )
+            )
+        return response["result"]
+
+    def stop(self):
+        with self._lock:
+            self._stop()
+
+    def _start(self):
+        args = get_ayon_launcher_args(
+            "run",
+            get_ocio_config_script_path(),
+            "serve",
+            "--token", self._token
+        )
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = CREATE_NO_WINDOW
+
+        log.info("Starting OCIO wrapper process: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=clean_envs_for_ayon_process(os.environ),
+            encoding="utf-8",
+            **kwargs
+        )
+
+    def _read_response(self):
+        prefix = self._token + ":"
+        for line in iter(self._process.stdout.readline, ""):
+            if line.startswith(prefix):
+                return json.loads(line[len(prefix):])
+        raise _OCIOWrapperProcessError(
+            "OCIO wrapper process ended unexpectedly"
+        )
+
+    def _stop(self):
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+
+        # Process ends when stdin is closed
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+
 def _get_wrapped_with_subprocess(command, **kwargs):
     """Get data via subprocess.
 
+    Data are received from long-lived OCIO wrapper process. Single
+    process for the query is used if the long-lived process or the
+    command in it fails.
+
     Args:
         command (str): command name
         **kwargs: command arguments
@@ -440,6 +578,14 @@ def _get_wrapped_with_subprocess(command, **kwargs):
     Returns:
         Any[dict, None]: data
     """
+    try:
+        return _OCIOWrapperProcess.get_instance().query(command, kwargs)
+    except (_OCIOWrapperProcessError, RuntimeError):
+        log.warning(
+            "OCIO wrapper process failed. Using single process for query.",
+            exc_info=True
+        )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
@@ -1307,7 +1453,15 @@ def _get_ocio_config(config_path):
     if not os.path.isfile(config_path):
         raise IOError("Input path should be `config.ocio` file")
 
-    return PyOpenColorIO.Config.CreateFromFile(config_path)
+    # Reuse config object until the config file is changed
+    mtime = os.path.getmtime(config_path)
+    cached_mtime, config = CachedData.ocio_configs.get(
+        config_path, (None, None)
+    )
+    if config is None or cached_mtime != mtime:
+        config = PyOpenColorIO.Config.CreateFromFile(config_path)
+        CachedData.ocio_configs[config_path] = (mtime, config)
+    return config
 
 
 def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
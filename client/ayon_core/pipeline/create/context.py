@@ -259,14 +259,31 @@ class TrackChangesItem(object):
     """
 
     def __init__(self, old_value, new_value):
+        self._set_values(old_value, new_value, True)
+
+    @classmethod
+    def _from_snapshots(cls, old_value, new_value):
+        """Create object without copying of passed values.
+
+        Passed values must not be modified after the object is created.
+        """
+
+        obj = cls.__new__(cls)
+        obj._set_values(old_value, new_value, False)
+        return obj
+
+    def _set_values(self, old_value, new_value, copy_values):
         self._changed = old_value != new_value
         # Resolve if value is '_EMPTY_VALUE' after comparison of the values
         if old_value is _EMPTY_VALUE:
             old_value = None
         if new_value is _EMPTY_VALUE:
             new_value = None
-        self._old_value = copy.deepcopy(old_value)
-        self._new_value = copy.deepcopy(new_value)
+        if copy_values:
+            old_value = copy.deepcopy(old_value)
+            new_value = copy.deepcopy(new_value)
+        self._old_value = old_value
+        self._new_value = new_value
 
         self._old_is_dict = isinstance(old_value, dict)
         self._new_is_dict = isinstance(new_value, dict)
@@ -461,11 +478,13 @@ class TrackChangesItem(object):
 
         old_keys = self.old_keys
         new_keys = self.new_keys
-        new_value = self.new_value
-        old_value = self.old_value
+        # Values are owned by this object and are never modified so sub items
+        #   can share them without copying
+        new_value = self._new_value
+        old_value = self._old_value
         if self._old_is_dict and self._new_is_dict:
             for key in self.available_keys:
-                item = TrackChangesItem(
+                item = TrackChangesItem._from_snapshots(
                     old_value.get(key), new_value.get(key)
                 )
                 sub_items[key] = item
@@ -479,7 +498,7 @@ class TrackChangesItem(object):
             for key in available_keys:
                 # NOTE Use '_EMPTY_VALUE' because old value could be 'None'
                 #   which would result in "unchanged" item
-                sub_items[key] = TrackChangesItem(
+                sub_items[key] = TrackChangesItem._from_snapshots(
                     old_value.get(key), _EMPTY_VALUE
                 )
 
@@ -490,7 +509,7 @@ class TrackChangesItem(object):
             for key in available_keys:
                 # NOTE Use '_EMPTY_VALUE' because new value could be 'None'
                 #   which would result in "unchanged" item
-                sub_items[key] = TrackChangesItem(
+                sub_items[key] = TrackChangesItem._from_snapshots(
                     _EMPTY_VALUE, new_value.get(key)
                 )
 
@@ -498,6 +517,122 @@ class TrackChangesItem(object):
         self._changed_keys = changed_keys
 
 
+def _is_immutable_value(value):
+    return value is None or isinstance(value, (str, bool, int, float))
+
+
+class _DataSnapshot(object):
+    """Copy-on-write snapshot of dictionary data.
+
+    Snapshot is never modified, new dictionary is created when data changed
+    and only changed values are copied. That makes it possible to share
+    the snapshot and its values without copying them.
+
+    Owner of data must mark keys that were set as dirty. Only dirty keys and
+    keys with mutable values, which can be changed in place, are compared
+    on update.
+
+    Args:
+        base_data (Optional[dict]): Data that can be reused for unchanged
+            values. Must not be modified after passed in.
+        ignored_keys (Optional[Iterable[str]]): Keys that are not part
+            of snapshot.
+    """
+
+    def __init__(self, base_data=None, ignored_keys=None):
+        self._data = base_data or {}
+        self._ignored_keys = frozenset(ignored_keys or [])
+        self._mutable_keys = set()
+        self._dirty_keys = set()
+        self._all_dirty = True
+
+    def mark_dirty(self, key):
+        self._dirty_keys.add(key)
+
+    def mark_all_dirty(self):
+        self._all_dirty = True
+
+    def update(self, data):
+        """Update snapshot to match data.
+
+        Args:
+            data (dict): Current data.
+
+        Returns:
+            dict: Snapshot of data. Must not be modified.
+        """
+
+        if self._all_dirty:
+            self._rebuild(data)
+            return self._data
+
+        keys_to_check = self._dirty_keys | self._mutable_keys
+        self._dirty_keys = set()
+        if not keys_to_check:
+            return self._data
+
+        snapshot = self._data
+        new_snapshot = None
+        for key in keys_to_check:
+            if key in self._ignored_keys:
+                continue
+            value = data.get(key, _EMPTY_VALUE)
+            old_value = snapshot.get(key, _EMPTY_VALUE)
+            if value is _EMPTY_VALUE:
+                if old_value is _EMPTY_VALUE:
+                    continue
+                if new_snapshot is None:
+                    new_snapshot = dict(snapshot)
+                new_snapshot.pop(key)
+                continue
+
+            if self._is_same_value(old_value, value):
+                continue
+
+            if new_snapshot is None:
+                new_snapshot = dict(snapshot)
+            new_snapshot[key] = copy.deepcopy(value)
+
+        if new_snapshot is not None:
+            self._set_snapshot(new_snapshot)
+        return self._data
+
+    def _rebuild(self, data):
+        snapshot = self._data
+        new_snapshot = {}
+        for key, value in data.items():
+            if key in self._ignored_keys:
+                continue
+            old_value = snapshot.get(key, _EMPTY_VALUE)
+            if self._is_same_value(old_value, value):
+                value = old_value
+            else:
+                value = copy.deepcopy(value)
+            new_snapshot[key] = value
+
+        self._set_snapshot(new_snapshot)
+        self._dirty_keys = set()
+        self._all_dirty = False
+
+    def _set_snapshot(self, snapshot):
+        self._data = snapshot
+        self._mutable_keys = {
+            key
+            for key, value in snapshot.items()
+            if not _is_immutable_value(value)
+        }
+
+    @staticmethod
+    def _is_same_value(old_value, value):
+        if old_value is value:
+            return True
+        return (
+            old_value is not _EMPTY_VALUE
+            and type(old_value) is type(value)
+            and old_value == value
+        )
+
+
 class InstanceMember:
     """Representation of instance member.
 
@@ -535,9 +670,12 @@ class AttributeValues(object):
     """
 
     def __init__(self, attr_defs, values, origin_data=None):
-        if origin_data is None:
+        if origin_data is None or origin_data is values:
             origin_data = copy.deepcopy(values)
         self._origin_data = origin_data
+        # Snapshots of values, origin data are used as base for both
+        self._stored_snapshot = _DataSnapshot(origin_data)
+        self._data_to_store_snapshot = _DataSnapshot(origin_data)
 
         attr_defs_by_key = {
             attr_def.key: attr_def
@@ -567,6 +705,7 @@ class AttributeValues(object):
         if old_value == value:
             return
         self._data[key] = value
+        self._mark_dirty(key)
 
     def __getitem__(self, key):
         if key not in self._attr_defs_by_key:
@@ -604,13 +743,33 @@ class AttributeValues(object):
         if isinstance(attr_def, UnknownDef):
             self._attr_defs_by_key.pop(key)
             self._attr_defs.remove(attr_def)
+        self._mark_dirty(key)
         return value
 
     def reset_values(self):
         self._data = {}
+        self._stored_snapshot.mark_all_dirty()
+        self._data_to_store_snapshot.mark_all_dirty()
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        self._origin_data = self._stored_snapshot.update(self._data)
+
+    def _mark_dirty(self, key):
+        self._stored_snapshot.mark_dirty(key)
+        self._data_to_store_snapshot.mark_dirty(key)
+
+    def _get_origin_snapshot(self):
+        return self._origin_data
+
+    def _get_data_to_store_snapshot(self):
+        """Data to store that are copied only when changed.
+
+        Returns:
+            Dict[str, Any]: Attribute values that should be stored. Must not
+                be modified.
+        """
+
+        return self._data_to_store_snapshot.update(self.data_to_store())
 
     @property
     def attr_defs(self):
@@ -759,7 +918,16 @@ class PublishAttributes:
             yield name
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        self._origin_data = self._get_data_to_store_snapshot()
+
+    def _get_origin_snapshot(self):
+        return self._origin_data
+
+    def _get_data_to_store_snapshot(self):
+        return {
+            key: attr_value._get_data_to_store_snapshot()
+            for key, attr_value in self._data.items()
+        }
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -821,26 +989,30 @@ class PublishAttributes:
 
     def deserialize_attributes(self, data):
         self._plugin_names_order = data["plugin_names_order"]
-        self._missing_plugins = data["missing_plugins"]
+        self._missing_plugins = list(data["missing_plugins"])
 
-        attr_defs = deserialize_attr_defs(data["attr_defs"])
+        attr_defs_by_plugin = data["attr_defs"]
 
         origin_data = self._origin_data
         data = self._data
         self._data = {}
 
         added_keys = set()
-        for plugin_name, attr_defs_data in attr_defs.items():
+        for plugin_name, attr_defs_data in attr_defs_by_plugin.items():
             attr_defs = deserialize_attr_defs(attr_defs_data)
-            value = data.get(plugin_name) or {}
+            value = data.get(plugin_name)
+            value = value.data_to_store() if value is not None else {}
             orig_value = copy.deepcopy(origin_data.get(plugin_name) or {})
+            added_keys.add(plugin_name)
             self._data[plugin_name] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
 
         for key, value in data.items():
             if key not in added_keys:
-                self._missing_plugins.append(key)
+                if key not in self._missing_plugins:
+                    self._missing_plugins.append(key)
+                value = value.data_to_store()
                 self._data[key] = PublishAttributeValues(
                     self, [], value, value
                 )
@@ -978,6 +1150,12 @@ class CreatedInstance:
         if not self._data.get("instance_id"):
             self._data["instance_id"] = str(uuid4())
 
+        # Snapshot of data used to track changes, attribute values are
+        #   tracking their changes on their own
+        self._data_snapshot = _DataSnapshot(
+            self._orig_data, ("creator_attributes", "publish_attributes")
+        )
+
         self._folder_is_valid = self.has_set_folder
         self._task_is_valid = self.has_set_task
 
@@ -1002,6 +1180,7 @@ class CreatedInstance:
         # Validate immutable keys
         if key not in self.__immutable_keys:
             self._data[key] = value
+            self._data_snapshot.mark_dirty(key)
 
         elif value != self._data.get(key):
             # Raise exception if key is immutable and value has changed
@@ -1016,6 +1195,7 @@ class CreatedInstance:
             raise ImmutableKeyError(key)
 
         self._data.pop(key, *args, **kwargs)
+        self._data_snapshot.mark_dirty(key)
 
     def keys(self):
         return self._data.keys()
@@ -1108,9 +1288,30 @@ class CreatedInstance:
         return self._transient_data
 
     def changes(self):
-        """Calculate and return changes."""
+        """Calculate and return changes.
 
-        return TrackChangesItem(self.origin_data, self.data_to_store())
+        Only values that changed since last check are copied.
+
+        Returns:
+            TrackChangesItem: Changes of instance data.
+        """
+
+        origin_data = dict(self._orig_data)
+        origin_data["creator_attributes"] = (
+            self.creator_attributes._get_origin_snapshot()
+        )
+        origin_data["publish_attributes"] = (
+            self.publish_attributes._get_origin_snapshot()
+        )
+
+        new_data = dict(self._data_snapshot.update(self._data))
+        new_data["creator_attributes"] = (
+            self.creator_attributes._get_data_to_store_snapshot()
+        )
+        new_data["publish_attributes"] = (
+            self.publish_attributes._get_data_to_store_snapshot()
+        )
+        return TrackChangesItem._from_snapshots(origin_data, new_data)
 
     def mark_as_stored(self):
         """Should be called when instance data are stored.
@@ -1118,15 +1319,7 @@ class CreatedInstance:
         Origin data are replaced by current data so changes are cleared.
         """
 
-        orig_keys = set(self._orig_data.keys())
-        for key, value in self._data.items():
-            orig_keys.discard(key)
-            if key in ("creator_attributes", "publish_attributes"):
-                continue
-            self._orig_data[key] = copy.deepcopy(value)
-
-        for key in orig_keys:
-            self._orig_data.pop(key)
+        self._orig_data = self._data_snapshot.update(self._data)
 
         self.creator_attributes.mark_as_stored()
         self.publish_attributes.mark_as_stored()
@@ -1,5 +1,5 @@
 from ayon_core.settings import get_project_settings
-from ayon_core.lib import filter_profiles, prepare_template_data
+from ayon_core.lib import get_profiles_filter, prepare_template_data
 
 from .constants import DEFAULT_PRODUCT_TEMPLATE
 
@@ -44,7 +44,7 @@ def get_product_name_template(
     """
 
     if project_settings is None:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
     tools_settings = project_settings["core"]["tools"]
     profiles = tools_settings["creator"]["product_name_profiles"]
     filtering_criteria = {
@@ -54,7 +54,9 @@ def get_product_name_template(
         "task_types": task_type
     }
 
-    matching_profile = filter_profiles(profiles, filtering_criteria)
+    matching_profile = get_profiles_filter(profiles).filter(
+        filtering_criteria
+    )
     template = None
     if matching_profile:
         # TODO remove formatting keys replacement
@@ -1,10 +1,12 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
+import time
 import shutil
 import glob
 import clique
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ayon_core.lib import create_hard_link
 
@@ -27,6 +29,229 @@ def _copy_file(src_path, dst_path):
         shutil.copyfile(src_path, dst_path)
 
 
+def _is_delivered_file(dst_path, src_stat):
+    """Destination file has the same size and modification time as source.
+
+    Args:
+        dst_path (str): Destination path.
+        src_stat (os.stat_result): Stat of source file.
+
+    Returns:
+        bool: File is already delivered.
+    """
+    try:
+        dst_stat = os.stat(dst_path)
+    except OSError:
+        return False
+    return (
+        dst_stat.st_size == src_stat.st_size
+        # Some filesystems don't store fractions of seconds
+        and abs(dst_stat.st_mtime - src_stat.st_mtime) < 1
+    )
+
+
+def _deliver_file(src_path, dst_path, src_stat):
+    """Hardlink or copy file to destination if is not delivered yet.
+
+    Copied file keeps modification time of the source and is copied to
+    temporary file first, so interrupted copy is not resolved as delivered.
+
+    Args:
+        src_path (str): Source path.
+        dst_path (str): Destination path.
+        src_stat (os.stat_result): Stat of source file.
+
+    Returns:
+        bool: File was transferred, False if was already delivered.
+    """
+    if _is_delivered_file(dst_path, src_stat):
+        return False
+
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+
+    try:
+        create_hard_link(src_path, dst_path)
+        return True
+    except OSError:
+        pass
+
+    tmp_path = dst_path + ".delivery_tmp"
+    shutil.copy2(src_path, tmp_path)
+    os.replace(tmp_path, dst_path)
+    return True
+
+
+class DeliveryProgress:
+    """Progress of delivery files transfer.
+
+    Args:
+        files_count (int): Number of all files of delivery.
+        total_size (int): Size of all files of delivery.
+    """
+
+    def __init__(self, files_count, total_size):
+        self.files_count = files_count
+        self.total_size = total_size
+        self.processed_count = 0
+        self.processed_size = 0
+        self.skipped_count = 0
+        # Size of files that were not skipped
+        self.transferred_size = 0
+        self._start_time = time.time()
+
+    @property
+    def elapsed(self):
+        return time.time() - self._start_time
+
+    @property
+    def speed(self):
+        """Transferred bytes per second.
+
+        Returns:
+            float: Transfer speed.
+        """
+        elapsed = self.elapsed
+        if not elapsed:
+            return 0.0
+        return self.transferred_size / elapsed
+
+    @property
+    def eta(self):
+        """Estimated remaining time in seconds.
+
+        Returns:
+            Union[float, None]: Remaining time or None if can't be
+                estimated yet.
+        """
+        remaining_size = self.total_size - self.processed_size
+        if remaining_size <= 0:
+            return 0.0
+        speed = self.speed
+        if not speed:
+            return None
+        return remaining_size / speed
+
+    def add_processed(self, size, transferred):
+        self.processed_count += 1
+        self.processed_size += size
+        if transferred:
+            self.transferred_size += size
+        else:
+            self.skipped_count += 1
+
+
+class DeliveryPlan:
+    """Files of delivery planned up front and transferred in parallel.
+
+    Pass the plan to 'deliver_single_file' or 'deliver_sequence' to only
+    plan their files, then transfer all files with 'process'. Files which
+    are already in destination with the same size and modification time
+    are skipped, so interrupted delivery can be resumed.
+
+    Args:
+        max_workers (int): Number of files transferred at the same time.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    def __init__(self, max_workers=4, log=None):
+        self._max_workers = max(1, max_workers)
+        self._log = log
+        self._transfers = collections.OrderedDict()
+        self._total_size = 0
+        self._filenames_by_dir = {}
+
+    @property
+    def files_count(self):
+        return len(self._transfers)
+
+    @property
+    def total_size(self):
+        return self._total_size
+
+    def listdir(self, dir_path):
+        """Cached listing of a directory.
+
+        Args:
+            dir_path (str): Directory path.
+
+        Returns:
+            list[str]: Filenames in the directory.
+        """
+        filenames = self._filenames_by_dir.get(dir_path)
+        if filenames is None:
+            filenames = os.listdir(dir_path)
+            self._filenames_by_dir[dir_path] = filenames
+        return filenames
+
+    def add(self, src_path, dst_path):
+        """Add file to the plan.
+
+        Args:
+            src_path (str): Source path.
+            dst_path (str): Destination path.
+        """
+        if dst_path in self._transfers:
+            return
+        src_stat = os.stat(src_path)
+        self._transfers[dst_path] = (src_path, src_stat)
+        self._total_size += src_stat.st_size
+
+    def process(self, progress_callback=None):
+        """Transfer all planned files.
+
+        Args:
+            progress_callback (Optional[Callable[[DeliveryProgress], None]]):
+                Called from the calling thread after each processed file.
+
+        Returns:
+            collections.defaultdict: Report of happened errors.
+        """
+        report_items = collections.defaultdict(list)
+        progress = DeliveryProgress(self.files_count, self.total_size)
+
+        for dst_path in self._transfers:
+            dirpath = os.path.dirname(dst_path)
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _deliver_file, src_path, dst_path, src_stat
+                ): dst_path
+                for dst_path, (src_path, src_stat) in self._transfers.items()
+            }
+            for future in as_completed(futures):
+                dst_path = futures[future]
+                src_path, src_stat = self._transfers[dst_path]
+                transferred = False
+                try:
+                    transferred = future.result()
+                except Exception as exc:
+                    report_items["Failed to copy files"].append(
+                        "{} -> {}: {}".format(src_path, dst_path, exc)
+                    )
+                    if self._log is not None:
+                        self._log.warning("Failed to copy {} -> {}".format(
+                            src_path, dst_path
+                        ), exc_info=True)
+
+                progress.add_processed(src_stat.st_size, transferred)
+                if progress_callback is not None:
+                    progress_callback(progress)
+
+        if self._log is not None:
+            self._log.debug((
+                "Delivered {} files ({} skipped) in {:.1f}s"
+            ).format(
+                progress.processed_count,
+                progress.skipped_count,
+                progress.elapsed
+            ))
+        return report_items
+
+
 def get_format_dict(anatomy, location_path):
     """Returns replaced root values from user provider value.
 
@@ -122,7 +347,8 @@ def deliver_single_file(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    delivery_plan=None
 ):
     """Copy single file to calculated path based on template
 
@@ -136,6 +362,8 @@ def deliver_single_file(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        delivery_plan (Optional[DeliveryPlan]): file is only added to the
+            plan if passed
 
     Returns:
         (collections.defaultdict, int)
@@ -164,6 +392,10 @@ def deliver_single_file(
     # Remove newlines from the end of the string to avoid OSError during copy
     delivery_path = delivery_path.rstrip()
 
+    if delivery_plan is not None:
+        delivery_plan.add(src_path, delivery_path)
+        return report_items, 1
+
     delivery_folder = os.path.dirname(delivery_path)
     if not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
@@ -184,7 +416,8 @@ def deliver_sequence(
     report_items,
     log,
     has_renumbered_frame=False,
-    new_frame_start=0
+    new_frame_start=0,
+    delivery_plan=None
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -204,6 +437,8 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        delivery_plan (Optional[DeliveryPlan]): files are only added to the
+            plan if passed
 
     Returns:
         (collections.defaultdict, int)
@@ -261,7 +496,11 @@ def deliver_sequence(
     # context.representation could be .psd
     ext = ext.replace("..", ".")
 
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
+    if delivery_plan is not None:
+        filenames = delivery_plan.listdir(dir_path)
+    else:
+        filenames = os.listdir(dir_path)
+    src_collections, remainder = clique.assemble(filenames)
     src_collection = None
     for col in src_collections:
         if col.tail != ext:
@@ -294,7 +533,7 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
+    if delivery_plan is None and not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
 
     src_head = src_collection.head
@@ -321,8 +560,11 @@ def deliver_sequence(
                 return report_items, 0
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
-        log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
+        if delivery_plan is not None:
+            delivery_plan.add(src, dst)
+        else:
+            log.debug("Copying single: {} -> {}".format(src, dst))
+            _copy_file(src, dst)
 
         uploaded += 1
 
@@ -1,5 +1,6 @@
 from .utils import (
     HeroVersionType,
+    ContainerUpdateResult,
 
     LoadError,
     IncompatibleLoaderError,
@@ -20,6 +21,7 @@ from .utils import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     get_loader_identifier,
@@ -55,6 +57,7 @@ from .plugins import (
 __all__ = (
     # utils.py
     "HeroVersionType",
+    "ContainerUpdateResult",
 
     "LoadError",
     "IncompatibleLoaderError",
@@ -75,6 +78,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "get_loader_identifier",
@@ -22,6 +22,10 @@ ContainersFilterResult = collections.namedtuple(
     "ContainersFilterResult",
     ["latest", "outdated", "not_found", "invalid"]
 )
+ContainerUpdateResult = collections.namedtuple(
+    "ContainerUpdateResult",
+    ["container", "result", "error"]
+)
 
 
 class HeroVersionType(object):
@@ -458,78 +462,272 @@ def remove_container(container):
     return Loader().remove(container)
 
 
-def update_container(container, version=-1):
-    """Update a container"""
-    from ayon_core.pipeline import get_current_project_name
+def _get_loaders_by_identifier():
+    """Discovered loaders by identifier, first discovered loader wins."""
+    from .plugins import discover_loader_plugins
 
-    # Compute the different version from 'representation'
-    project_name = get_current_project_name()
-    current_representation = ayon_api.get_representation_by_id(
-        project_name, container["representation"]
-    )
+    loaders_by_identifier = {}
+    for Plugin in discover_loader_plugins():
+        loaders_by_identifier.setdefault(get_loader_identifier(Plugin), Plugin)
+    return loaders_by_identifier
 
-    assert current_representation is not None, "This is a bug"
 
-    current_version_id = current_representation["versionId"]
-    current_version = ayon_api.get_version_by_id(
-        project_name, current_version_id, fields={"productId"}
-    )
-    if isinstance(version, HeroVersionType):
-        new_version = ayon_api.get_hero_version_by_product_id(
-            project_name, current_version["productId"]
-        )
-    elif version == -1:
-        new_version = ayon_api.get_last_version_by_product_id(
-            project_name, current_version["productId"]
-        )
+def _get_new_versions_for_update(project_name, requests):
+    """Find target versions for update requests.
 
-    else:
-        new_version = ayon_api.get_version_by_name(
-            project_name, version, current_version["productId"]
+    Args:
+        project_name (str): Project name.
+        requests (Iterable[tuple[str, Union[int, HeroVersionType]]]): Pairs
+            of product id and requested version.
+
+    Returns:
+        dict[tuple[str, Union[int, str]], dict[str, Any]]: Version entities
+            by product id and requested version. Key of hero version
+            is 'hero' and key of last version is '-1'.
+    """
+    last_product_ids = set()
+    hero_product_ids = set()
+    product_ids_by_version = collections.defaultdict(set)
+    for product_id, version in requests:
+        if isinstance(version, HeroVersionType):
+            hero_product_ids.add(product_id)
+        elif version == -1:
+            last_product_ids.add(product_id)
+        else:
+            product_ids_by_version[version].add(product_id)
+
+    output = {}
+    if last_product_ids:
+        last_versions = ayon_api.get_last_versions(
+            project_name, last_product_ids
         )
+        for product_id, version_entity in last_versions.items():
+            # Products without matching last version have 'None' value
+            if version_entity is not None:
+                output[(product_id, -1)] = version_entity
+
+    if hero_product_ids:
+        for version_entity in ayon_api.get_hero_versions(
+            project_name, product_ids=hero_product_ids
+        ):
+            output[(version_entity["productId"], "hero")] = version_entity
+
+    if product_ids_by_version:
+        all_product_ids = set()
+        for product_ids in product_ids_by_version.values():
+            all_product_ids |= product_ids
+        for version_entity in ayon_api.get_versions(
+            project_name,
+            product_ids=all_product_ids,
+            versions=set(product_ids_by_version.keys()),
+            hero=False,
+        ):
+            version = version_entity["version"]
+            product_id = version_entity["productId"]
+            if product_id in product_ids_by_version.get(version, set()):
+                output[(product_id, version)] = version_entity
+    return output
 
-    if new_version is None:
-        raise ValueError("Failed to find matching version")
 
-    product_entity = ayon_api.get_product_by_id(
-        project_name, current_version["productId"]
-    )
-    folder_entity = ayon_api.get_folder_by_id(
-        project_name, product_entity["folderId"]
-    )
+def update_containers(containers, versions=-1, project_name=None):
+    """Update multiple containers using batched server queries.
 
-    repre_name = current_representation["name"]
-    new_representation = ayon_api.get_representation_by_name(
-        project_name, repre_name, new_version["id"]
-    )
-    if new_representation is None:
+    All entities needed for update are queried in a few requests for all
+    containers at once and loader plugins are discovered only once. Then
+    loader 'update' is called for each container.
+
+    An error of one container does not stop update of other containers, it
+    is stored to result of the container instead.
+
+    Args:
+        containers (list[dict[str, Any]]): Containers to update.
+        versions (Union[int, HeroVersionType, list]): Version to update to.
+            Version -1 means last version and 'HeroVersionType' means hero
+            version. Can be a list with version for each container.
+        project_name (Optional[str]): Project name. Current project is used
+            if not passed.
+
+    Returns:
+        list[ContainerUpdateResult]: Result for each container in
+            order of passed containers.
+    """
+    from ayon_core.pipeline import get_current_project_name, registered_root
+
+    containers = list(containers)
+    if not isinstance(versions, (list, tuple)):
+        versions = [versions] * len(containers)
+
+    if len(containers) != len(versions):
         raise ValueError(
-            "Representation '{}' wasn't found on requested version".format(
-                repre_name
+            "Number of containers mismatches number of versions:"
+            " {} containers - {} versions".format(
+                len(containers), len(versions)
             )
         )
 
-    path = get_representation_path(new_representation)
-    if not path or not os.path.exists(path):
-        raise ValueError("Path {} doesn't exist".format(path))
+    if not containers:
+        return []
 
-    # Run update on the Loader for this container
-    Loader = _get_container_loader(container)
-    if not Loader:
-        raise LoaderNotFoundError(
-            "Can't update container because loader '{}' was not found."
-            .format(container.get("loader"))
+    if project_name is None:
+        project_name = get_current_project_name()
+
+    repre_ids = {
+        container["representation"]
+        for container in containers
+    }
+    current_repres_by_id = {
+        repre_entity["id"]: repre_entity
+        for repre_entity in ayon_api.get_representations(
+            project_name, representation_ids=repre_ids
         )
-    project_entity = ayon_api.get_project(project_name)
-    context = {
-        "project": project_entity,
-        "folder": folder_entity,
-        "product": product_entity,
-        "version": new_version,
-        "representation": new_representation,
     }
+    current_version_ids = {
+        repre_entity["versionId"]
+        for repre_entity in current_repres_by_id.values()
+    }
+    current_versions_by_id = {}
+    if current_version_ids:
+        current_versions_by_id = {
+            version_entity["id"]: version_entity
+            for version_entity in ayon_api.get_versions(
+                project_name,
+                version_ids=current_version_ids,
+                fields={"id", "productId"}
+            )
+        }
+
+    # Product id of each container, 'None' if it can't be found
+    product_ids = []
+    for container in containers:
+        product_id = None
+        repre_entity = current_repres_by_id.get(container["representation"])
+        if repre_entity is not None:
+            version_entity = current_versions_by_id.get(
+                repre_entity["versionId"]
+            )
+            if version_entity is not None:
+                product_id = version_entity["productId"]
+        product_ids.append(product_id)
+
+    new_versions_by_key = _get_new_versions_for_update(
+        project_name,
+        [
+            (product_id, version)
+            for product_id, version in zip(product_ids, versions)
+            if product_id is not None
+        ]
+    )
+
+    products_by_id = {}
+    folders_by_id = {}
+    found_product_ids = {
+        product_id
+        for product_id in product_ids
+        if product_id is not None
+    }
+    if found_product_ids:
+        products_by_id = {
+            product_entity["id"]: product_entity
+            for product_entity in ayon_api.get_products(
+                project_name, product_ids=found_product_ids
+            )
+        }
+    folder_ids = {
+        product_entity["folderId"]
+        for product_entity in products_by_id.values()
+    }
+    if folder_ids:
+        folders_by_id = {
+            folder_entity["id"]: folder_entity
+            for folder_entity in ayon_api.get_folders(
+                project_name, folder_ids=folder_ids
+            )
+        }
+
+    new_version_ids = {
+        version_entity["id"]
+        for version_entity in new_versions_by_key.values()
+    }
+    repre_names = {
+        repre_entity["name"]
+        for repre_entity in current_repres_by_id.values()
+    }
+    new_repres_by_key = {}
+    if new_version_ids and repre_names:
+        new_repres_by_key = {
+            (repre_entity["versionId"], repre_entity["name"]): repre_entity
+            for repre_entity in ayon_api.get_representations(
+                project_name,
+                representation_names=repre_names,
+                version_ids=new_version_ids
+            )
+        }
+
+    project_entity = ayon_api.get_project(project_name)
+    loaders_by_identifier = _get_loaders_by_identifier()
+    root = registered_root()
 
-    return Loader().update(container, context)
+    output = []
+    for container, version, product_id in zip(
+        containers, versions, product_ids
+    ):
+        result = error = None
+        try:
+            current_repre = current_repres_by_id.get(
+                container["representation"]
+            )
+            assert current_repre is not None, "This is a bug"
+            assert product_id is not None, "This is a bug"
+
+            if isinstance(version, HeroVersionType):
+                version_key = "hero"
+            else:
+                version_key = version
+            new_version = new_versions_by_key.get((product_id, version_key))
+            if new_version is None:
+                raise ValueError("Failed to find matching version")
+
+            repre_name = current_repre["name"]
+            new_repre = new_repres_by_key.get((new_version["id"], repre_name))
+            if new_repre is None:
+                raise ValueError(
+                    "Representation '{}' wasn't found on requested version"
+                    .format(repre_name)
+                )
+
+            path = get_representation_path(new_repre, root)
+            if not path or not os.path.exists(path):
+                raise ValueError("Path {} doesn't exist".format(path))
+
+            Loader = loaders_by_identifier.get(container["loader"])
+            if not Loader:
+                raise LoaderNotFoundError(
+                    "Can't update container because loader '{}' was not"
+                    " found.".format(container.get("loader"))
+                )
+
+            product_entity = products_by_id[product_id]
+            context = {
+                "project": project_entity,
+                "folder": folders_by_id[product_entity["folderId"]],
+                "product": product_entity,
+                "version": new_version,
+                "representation": new_repre,
+            }
+            result = Loader().update(container, context)
+
+        except Exception as exc:
+            error = exc
+        output.append(ContainerUpdateResult(container, result, error))
+    return output
+
+
+def update_container(container, version=-1):
+    """Update a container"""
+    update_result = update_containers([container], [version])[0]
+    if update_result.error is not None:
+        raise update_result.error
+    return update_result.result
 
 
 def switch_container(container, representation, loader_plugin=None):
@@ -100,8 +100,9 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Modules of files which did not change since
+    previous discover are reused, so different discover calls return the
+    same class objects if files were not modified.
     """
 
     def __init__(self):
@@ -168,7 +169,7 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = modules_from_path(path, use_cache=True)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -11,7 +11,7 @@ import pyblish.api
 
 from ayon_core.lib import (
     Logger,
-    import_filepath,
+    modules_from_path,
     filter_profiles,
 )
 from ayon_core.settings import get_project_settings
@@ -52,7 +52,7 @@ def get_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     return copy.deepcopy(
         project_settings
@@ -87,7 +87,7 @@ def get_hero_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
 
     return copy.deepcopy(
         project_settings
@@ -239,33 +239,16 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
+        # Compiled code of files which did not change is reused
+        modules, crashed = modules_from_path(path, use_cache=True)
+        for abspath, exc_info in crashed:
+            result.crashed_file_paths[abspath] = exc_info
 
-            abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
-            mod_name, mod_ext = os.path.splitext(fname)
-
-            if mod_ext != ".py":
-                continue
-
-            try:
-                module = import_filepath(abspath, mod_name)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
-
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
-
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+        for abspath, module in modules:
+            # Store reference to original module, to avoid
+            # garbage collection from collecting it's global
+            # imports, such as `import os`.
+            sys.modules[abspath] = module
 
             for plugin in pyblish.plugin.plugins_from_module(module):
                 # Ignore base plugin classes
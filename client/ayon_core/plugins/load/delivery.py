@@ -1,4 +1,5 @@
 import copy
+import time
 import platform
 from collections import defaultdict
 
@@ -19,6 +20,7 @@ from ayon_core.pipeline.delivery import (
     check_destination_path,
     deliver_single_file,
     deliver_sequence,
+    DeliveryPlan,
 )
 
 
@@ -57,6 +59,9 @@ class Delivery(load.ProductLoaderPlugin):
 class DeliveryOptionsDialog(QtWidgets.QDialog):
     """Dialog to select template where to deliver selected representations."""
 
+    # Number of files transferred at the same time
+    max_workers = 4
+
     def __init__(self, contexts, log=None, parent=None):
         super(DeliveryOptionsDialog, self).__init__(parent=parent)
 
@@ -76,7 +81,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.anatomy = Anatomy(project_name)
         self._representations = None
         self.log = log
-        self.currently_uploaded = 0
 
         self._set_representations(project_name, contexts)
 
@@ -201,6 +205,8 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        # Files are transferred at once when all files are planned
+        delivery_plan = DeliveryPlan(self.max_workers, log=self.log)
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -264,20 +270,28 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
                     if frame is not None:
                         anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, delivery_plan=delivery_plan
+                    )
                     report_items.update(new_report_items)
-                    self._update_progress(uploaded)
             else:  # fallback for Pype2 and representations without files
                 frame = repre["context"].get("frame")
                 if frame:
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
                 if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, delivery_plan=delivery_plan
+                    )
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
+                    new_report_items, _ = deliver_sequence(
+                        *args, delivery_plan=delivery_plan
+                    )
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+
+        report_items.update(
+            delivery_plan.process(self._update_progress)
+        )
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -364,12 +378,21 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_file_label.setText(template_value["file"])
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
-
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+    def _update_progress(self, progress):
+        """Update progress bar, throughput and ETA after each file copied."""
+        ratio = 1.0
+        if progress.files_count:
+            ratio = progress.processed_count / progress.files_count
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+
+        eta = progress.eta
+        eta_text = "--:--:--"
+        if eta is not None:
+            eta_text = time.strftime("%H:%M:%S", time.gmtime(eta))
+        self.progress_bar.setFormat("%p% - {}/s - ETA {}".format(
+            format_file_size(progress.speed), eta_text
+        ))
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
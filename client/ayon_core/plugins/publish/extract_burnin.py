@@ -4,6 +4,8 @@ import copy
 import tempfile
 import platform
 import shutil
+import subprocess
+from fractions import Fraction
 
 import clique
 import six
@@ -13,12 +15,15 @@ from ayon_core import resources, AYON_CORE_ROOT
 from ayon_core.pipeline import publish
 from ayon_core.lib import (
     run_ayon_launcher_process,
+    run_subprocess,
+    get_ffmpeg_tool_args,
+    path_to_subprocess_arg,
 
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
-from ayon_core.lib.profiles_filtering import filter_profiles
+from ayon_core.lib.profiles_filtering import get_profiles_filter
 from ayon_core.pipeline.publish.lib import add_repre_files_for_cleanup
 
 
@@ -76,6 +81,13 @@ class ExtractBurnin(publish.Extractor):
     profiles = None
     options = None
 
+    # Maximum number of frames converted by one oiiotool process when
+    #   input has to be converted for ffmpeg
+    conversion_frames_per_batch = 10
+    # Maximum number of oiiotool processes converting input at the same
+    #   time, number of CPUs is used if is 'None'
+    conversion_max_workers = None
+
     def process(self, instance):
         if not self.profiles:
             self.log.warning("No profiles present for create burnin")
@@ -169,8 +181,7 @@ class ExtractBurnin(publish.Extractor):
             "task_names": task_name,
             "task_types": task_type,
         }
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_profiles_filter(self.profiles).filter(
             filtering_criteria,
             logger=self.log
         )
@@ -222,6 +233,10 @@ class ExtractBurnin(publish.Extractor):
             # Prepare representation based data.
             self.prepare_repre_data(instance, repre, burnin_data, temp_data)
 
+            # Output of 'ExtractReview' which was not encoded yet
+            #   - burnins are added to its ffmpeg process
+            encode_data = repre.pop("reviewEncode", None)
+
             src_repre_staging_dir = repre["stagingDir"]
             # Should convert representation source files before processing?
             repre_files = repre["files"]
@@ -237,7 +252,10 @@ class ExtractBurnin(publish.Extractor):
 
             first_input_path = os.path.join(src_repre_staging_dir, filename)
             # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
+            #   - output of 'ExtractReview' is always readable by ffmpeg
+            do_convert = False
+            if not encode_data:
+                do_convert = should_convert_for_ffmpeg(first_input_path)
             # If result is None the requirement of conversion can't be
             #   determined
             if do_convert is None:
@@ -257,7 +275,9 @@ class ExtractBurnin(publish.Extractor):
                 convert_input_paths_for_ffmpeg(
                     src_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.conversion_max_workers,
+                    frames_per_batch=self.conversion_frames_per_batch
                 )
 
             # Add anatomy keys to burnin_data.
@@ -358,37 +378,12 @@ class ExtractBurnin(publish.Extractor):
                     "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
                 }
 
-                self.log.debug(
-                    "script_data: {}".format(json.dumps(script_data, indent=4))
-                )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                args.append("--headless")
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_ayon_launcher_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                if encode_data:
+                    self._render_with_review(
+                        executable_args, script_data, encode_data, new_repre
+                    )
+                else:
+                    self._run_burnin_script(executable_args, script_data)
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
@@ -420,6 +415,138 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def _run_burnin_script(self, executable_args, script_data):
+        """Run burnin script with passed data in AYON launcher process.
+
+        Args:
+            executable_args (list[str]): Arguments to run the script.
+            script_data (dict[str, Any]): Data for burnin script.
+        """
+        self.log.debug(
+            "script_data: {}".format(json.dumps(script_data, indent=4))
+        )
+
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = list(executable_args)
+        args.append(temporary_json_filepath)
+        args.append("--headless")
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        run_ayon_launcher_process(*args, **process_kwargs)
+        # Remove the temporary json
+        os.remove(temporary_json_filepath)
+
+    def _render_with_review(
+        self, executable_args, script_data, encode_data, new_repre
+    ):
+        """Render review output with burnins by single ffmpeg process.
+
+        Burnin script only prepares burnin filters which are added to video
+        filters of the review output, so the source is encoded only once.
+
+        Args:
+            executable_args (list[str]): Arguments to run the burnin script.
+            script_data (dict[str, Any]): Data for burnin script.
+            encode_data (dict[str, Any]): Ffmpeg arguments of review output
+                prepared by 'ExtractReview'.
+            new_repre (dict[str, Any]): Representation of the output.
+        """
+        filters_output = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        filters_output.close()
+        filters_output_path = filters_output.name.replace("\\", "/")
+
+        # Burnin positions are calculated for output resolution and fps
+        video_stream = {}
+        width = new_repre.get("resolutionWidth")
+        height = new_repre.get("resolutionHeight")
+        if width and height:
+            video_stream["width"] = width
+            video_stream["height"] = height
+
+        fps = new_repre.get("fps")
+        if fps:
+            fps = Fraction(fps).limit_denominator(1001)
+            video_stream["r_frame_rate"] = "{}/{}".format(
+                fps.numerator, fps.denominator
+            )
+
+        script_data = copy.deepcopy(script_data)
+        script_data.update({
+            "full_input_path": encode_data["probe_path"],
+            "video_stream": video_stream,
+            "filters_output": filters_output_path,
+        })
+        self._run_burnin_script(executable_args, script_data)
+
+        with open(filters_output_path, "r") as stream:
+            filters_data = json.load(stream)
+        os.remove(filters_output_path)
+
+        video_filters = list(encode_data["video_filters"])
+        if filters_data["filters"]:
+            video_filters.append(filters_data["filters"])
+
+        # Filters are stored to file as burnin filters are escaped for it
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".txt", delete=False
+        ) as stream:
+            stream.write(",".join(video_filters))
+            filter_script_path = stream.name
+
+        ffmpeg_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        ffmpeg_args.extend(encode_data["input_args"])
+        if video_filters:
+            ffmpeg_args.extend([
+                "-filter_script:v", path_to_subprocess_arg(filter_script_path)
+            ])
+
+        if encode_data["audio_filters"]:
+            ffmpeg_args.append("-filter:a")
+            ffmpeg_args.append("\"{}\"".format(
+                ",".join(encode_data["audio_filters"])
+            ))
+
+        # Last output argument is path to output of review
+        ffmpeg_args.extend(encode_data["output_args"][:-1])
+        ffmpeg_args.append(
+            path_to_subprocess_arg(script_data["output"])
+        )
+
+        subprcs_cmd = " ".join(ffmpeg_args)
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+        try:
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        finally:
+            cleanup_paths = list(filters_data["cleanup_paths"])
+            cleanup_paths.append(filter_script_path)
+            for path in cleanup_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        new_repre["ffmpeg_cmd"] = subprcs_cmd
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
@@ -14,7 +14,7 @@ from ayon_core.lib.transcoding import (
     get_transcode_temp_directory,
 )
 
-from ayon_core.lib.profiles_filtering import filter_profiles
+from ayon_core.lib.profiles_filtering import get_profiles_filter
 
 
 class ExtractOIIOTranscode(publish.Extractor):
@@ -326,8 +326,9 @@ class ExtractOIIOTranscode(publish.Extractor):
             "task_names": task_name,
             "task_types": task_type,
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profiles_filter(self.profiles).filter(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.debug((
@@ -3,6 +3,7 @@ import re
 import copy
 import json
 import shutil
+import itertools
 import subprocess
 from abc import ABCMeta, abstractmethod
 
@@ -13,9 +14,10 @@ import pyblish.api
 
 from ayon_core.lib import (
     get_ffmpeg_tool_args,
-    filter_profiles,
+    get_profiles_filter,
     path_to_subprocess_arg,
     run_subprocess,
+    create_hard_link,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -24,6 +26,7 @@ from ayon_core.lib.transcoding import (
     get_review_layer_name,
     convert_input_paths_for_ffmpeg,
     get_transcode_temp_directory,
+    get_media_probe_cache,
 )
 from ayon_core.pipeline.publish import (
     KnownPublishError,
@@ -105,6 +108,21 @@ class ExtractReview(pyblish.api.InstancePlugin):
     # Preset attributes
     profiles = []
 
+    # Maximum number of frames converted by one oiiotool process when
+    #   input has to be converted for ffmpeg
+    conversion_frames_per_batch = 10
+    # Maximum number of oiiotool processes converting input at the same
+    #   time, number of CPUs is used if is 'None'
+    conversion_max_workers = None
+    # Methods used to fill gaps in sequences, first that works is used
+    #   - possible values are "hardlink", "symlink" and "copy"
+    gap_fill_methods = ["hardlink", "symlink", "copy"]
+    # Encode outputs with same input by single ffmpeg process
+    single_pass_encoding = False
+    # Outputs with "burnin" tag are not encoded here but by 'ExtractBurnin'
+    #   which adds burnins to the video filters of the output
+    fuse_burnins = False
+
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
         # Skip review when requested.
@@ -113,6 +131,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Run processing
         self.main_process(instance)
+        self.log.debug("Media probe cache stats: {}".format(
+            get_media_probe_cache().get_stats()
+        ))
 
         # Make sure cleanup happens and pop representations with "delete" tag.
         for repre in tuple(instance.data["representations"]):
@@ -137,8 +158,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.debug("Host: \"{}\"".format(host_name))
         self.log.debug("Product type: \"{}\"".format(product_type))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_profiles_filter(self.profiles).filter(
             {
                 "hosts": host_name,
                 "product_types": product_type,
@@ -317,7 +337,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 convert_input_paths_for_ffmpeg(
                     input_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.conversion_max_workers,
+                    frames_per_batch=self.conversion_frames_per_batch
                 )
 
             try:
@@ -348,139 +370,87 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            new_tags = new_repre.get("tags") or []
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_tags:
-                new_tags.remove("delete")
-
-            if "need_thumbnail" in new_tags:
-                new_tags.remove("need_thumbnail")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_tags:
-                    new_tags.append(tag)
-
-            # Return tags to new representation
-            new_repre["tags"] = new_tags
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
-
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
-            )
-
-            self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
+        files_to_clean = []
+        # Gaps are filled once for all outputs
+        if output_definitions and self.input_is_sequence(repre):
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean = self.fill_sequence_gaps(
+                files=repre["files"],
+                staging_dir=src_repre_staging_dir,
+                start_frame=instance.data["frameStart"],
+                end_frame=instance.data["frameEnd"]
             )
 
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
-                )
-
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext,
-
-                # By adding `timecode` as data we can use it
-                # in the ffmpeg arguments for `--timecode` so that editorial
-                # like Resolve or Premiere can detect the start frame for e.g.
-                # review output files
-                "timecode": frame_to_timecode(
-                    frame=temp_data["frame_start_handle"],
-                    fps=float(instance.data["fps"])
-                )
-            })
-
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def,
+        try:
+            output_items = []
+            for _output_def in output_definitions:
+                output_item = self._prepare_output_item(
                     instance,
-                    new_repre,
-                    temp_data,
+                    repre,
+                    src_repre_staging_dir,
+                    _output_def,
                     fill_data,
-                    layer_name,
+                    layer_name
                 )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
-                        ),
-                        exc_info=True
-                    )
-                    return
-                raise NotImplementedError
+                if output_item is None:
+                    break
+                output_items.append(output_item)
+
+            # Deferred outputs are encoded after converted input files
+            #   and files filling gaps are removed
+            inputs_are_temporary = (
+                bool(files_to_clean)
+                or repre["stagingDir"] != src_repre_staging_dir
+            )
+            render_items = []
+            for output_item in output_items:
+                if (
+                    self.fuse_burnins
+                    and not inputs_are_temporary
+                    and "burnin" in output_item["new_repre"]["tags"]
+                ):
+                    self._defer_output_item(output_item)
+                else:
+                    render_items.append(output_item)
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+            for output_items_group in self._group_output_items(render_items):
+                ffmpeg_args = [
+                    subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+                ]
+                ffmpeg_args.extend(output_items_group[0]["input_args"])
+                for output_item in output_items_group:
+                    ffmpeg_args.extend(self._ffmpeg_output_args(
+                        output_item["video_filters"],
+                        output_item["audio_filters"],
+                        output_item["output_args"]
+                    ))
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+                subprcs_cmd = " ".join(ffmpeg_args)
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+                # run subprocess
+                self.log.debug("Executing: {}".format(subprcs_cmd))
+
+                run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+                # Store command of each output on its own, it is used
+                #   e.g. by burnins to get codec arguments of the output
+                for output_item in output_items_group:
+                    output_item["new_repre"]["ffmpeg_cmd"] = " ".join(
+                        self.ffmpeg_full_args(
+                            output_item["input_args"],
+                            output_item["video_filters"],
+                            output_item["audio_filters"],
+                            output_item["output_args"]
+                        )
+                    )
 
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
-
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
+            for f in files_to_clean:
+                os.unlink(f)
 
+        for output_item in output_items:
+            new_repre = output_item["new_repre"]
             # adding representation
             self.log.debug(
                 "Adding new representation: {}".format(new_repre)
@@ -489,6 +459,241 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _prepare_output_item(
+        self,
+        instance,
+        repre,
+        src_repre_staging_dir,
+        _output_def,
+        fill_data,
+        layer_name
+    ):
+        """Prepare new representation and ffmpeg arguments for an output.
+
+        Returns:
+            Union[dict[str, Any], None]: Output item with new representation,
+                ffmpeg input arguments and ffmpeg output arguments. None is
+                returned if output can't be rendered.
+        """
+
+        output_def = copy.deepcopy(_output_def)
+        # Make sure output definition has "tags" key
+        if "tags" not in output_def:
+            output_def["tags"] = []
+
+        if "burnins" not in output_def:
+            output_def["burnins"] = []
+
+        # Create copy of representation
+        new_repre = copy.deepcopy(repre)
+        new_tags = new_repre.get("tags") or []
+        # Make sure new representation has origin staging dir
+        #   - this is because source representation may change
+        #       it's staging dir because of ffmpeg conversion
+        new_repre["stagingDir"] = src_repre_staging_dir
+
+        # Remove "delete" tag from new repre if there is
+        if "delete" in new_tags:
+            new_tags.remove("delete")
+
+        if "need_thumbnail" in new_tags:
+            new_tags.remove("need_thumbnail")
+
+        # Add additional tags from output definition to representation
+        for tag in output_def["tags"]:
+            if tag not in new_tags:
+                new_tags.append(tag)
+
+        # Return tags to new representation
+        new_repre["tags"] = new_tags
+
+        # Add burnin link from output definition to representation
+        for burnin in output_def["burnins"]:
+            if burnin not in new_repre.get("burnins", []):
+                if not new_repre.get("burnins"):
+                    new_repre["burnins"] = []
+                new_repre["burnins"].append(str(burnin))
+
+        self.log.debug(
+            "Linked burnins: `{}`".format(new_repre.get("burnins"))
+        )
+
+        self.log.debug(
+            "New representation tags: `{}`".format(
+                new_repre.get("tags"))
+        )
+
+        temp_data = self.prepare_temp_data(instance, repre, output_def)
+
+        # create or update outputName
+        output_name = new_repre.get("outputName", "")
+        output_ext = new_repre["ext"]
+        if output_name:
+            output_name += "_"
+        output_name += output_def["filename_suffix"]
+        if temp_data["without_handles"]:
+            output_name += "_noHandles"
+
+        # add outputName to anatomy format fill_data
+        fill_data.update({
+            "output": output_name,
+            "ext": output_ext,
+
+            # By adding `timecode` as data we can use it
+            # in the ffmpeg arguments for `--timecode` so that editorial
+            # like Resolve or Premiere can detect the start frame for e.g.
+            # review output files
+            "timecode": frame_to_timecode(
+                frame=temp_data["frame_start_handle"],
+                fps=float(instance.data["fps"])
+            )
+        })
+
+        try:  # temporary until oiiotool is supported cross platform
+            (
+                input_args,
+                video_filters,
+                audio_filters,
+                output_args
+            ) = self._prepare_ffmpeg_arguments(
+                output_def,
+                instance,
+                new_repre,
+                temp_data,
+                fill_data,
+                layer_name,
+            )
+        except ZeroDivisionError:
+            # TODO recalculate width and height using OIIO before
+            #   conversion
+            if 'exr' in temp_data["origin_repre"]["ext"]:
+                self.log.warning(
+                    (
+                        "Unsupported compression on input files."
+                        " Skipping!!!"
+                    ),
+                    exc_info=True
+                )
+                return None
+            raise NotImplementedError
+
+        new_repre.update({
+            "fps": temp_data["fps"],
+            "name": "{}_{}".format(output_name, output_ext),
+            "outputName": output_name,
+            "outputDef": output_def,
+            "frameStartFtrack": temp_data["output_frame_start"],
+            "frameEndFtrack": temp_data["output_frame_end"],
+        })
+
+        # Force to pop these key if are in new repre
+        new_repre.pop("thumbnail", None)
+        if "clean_name" in new_repre.get("tags", []):
+            new_repre.pop("outputName")
+
+        output_args = self._split_output_filters(
+            video_filters, audio_filters, output_args
+        )
+        return {
+            "new_repre": new_repre,
+            "input_args": input_args,
+            "video_filters": video_filters,
+            "audio_filters": audio_filters,
+            "output_args": output_args,
+            "probe_path": temp_data["full_input_path_single_file"],
+        }
+
+    def _defer_output_item(self, output_item):
+        """Store ffmpeg arguments of an output to its representation.
+
+        Output is encoded later by 'ExtractBurnin' which adds burnin
+        filters to the video filters, so the output is encoded only once.
+        Outputs which are not processed by burnins are encoded by
+        'ExtractReviewDeferredOutputs'. Input files of the output must not
+        be temporary because they would not exist at that time.
+
+        Args:
+            output_item (dict[str, Any]): Prepared output item.
+        """
+        new_repre = output_item["new_repre"]
+        self.log.debug(
+            "Output \"{}\" will be encoded with burnins.".format(
+                new_repre["name"]
+            )
+        )
+        new_repre["reviewEncode"] = {
+            "input_args": output_item["input_args"],
+            "video_filters": output_item["video_filters"],
+            "audio_filters": output_item["audio_filters"],
+            "output_args": output_item["output_args"],
+            "probe_path": output_item["probe_path"],
+        }
+
+    def _group_output_items(self, output_items):
+        """Group outputs which can be encoded by single ffmpeg process.
+
+        Outputs with same input arguments are encoded by one ffmpeg
+        process when 'single_pass_encoding' is enabled, so the input is
+        decoded only once. Each output has its own filters and output
+        arguments in the command.
+
+        Outputs using complex filter graph are always encoded by their own
+        ffmpeg process. Complex filter graph is global option of ffmpeg, so
+        graphs of multiple outputs would be applied to all of them.
+
+        Args:
+            output_items (list[dict[str, Any]]): Prepared output items.
+
+        Returns:
+            list[list[dict[str, Any]]]: Output items grouped by ffmpeg
+                process.
+        """
+
+        if not self.single_pass_encoding:
+            return [[output_item] for output_item in output_items]
+
+        output_groups = []
+        groups_by_key = {}
+        for output_item in output_items:
+            if self._uses_filter_complex(output_item):
+                output_groups.append([output_item])
+                continue
+
+            key = tuple(output_item["input_args"])
+            output_items_group = groups_by_key.get(key)
+            if output_items_group is None:
+                output_items_group = []
+                groups_by_key[key] = output_items_group
+                output_groups.append(output_items_group)
+            output_items_group.append(output_item)
+
+        for output_items_group in output_groups:
+            if len(output_items_group) > 1:
+                self.log.debug(
+                    "Encoding {} outputs with single ffmpeg process.".format(
+                        len(output_items_group)
+                    )
+                )
+        return output_groups
+
+    def _uses_filter_complex(self, output_item):
+        """Output arguments contain complex filter graph.
+
+        Args:
+            output_item (dict[str, Any]): Prepared output item.
+
+        Returns:
+            bool: Output uses '-filter_complex' or '-lavfi'.
+        """
+        for arg in itertools.chain(
+            output_item["input_args"], output_item["output_args"]
+        ):
+            arg = arg.strip()
+            for identifier in ("-filter_complex", "-lavfi"):
+                if arg == identifier or arg.startswith(identifier + " "):
+                    return True
+        return False
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -620,6 +825,31 @@ class ExtractReview(pyblish.api.InstancePlugin):
             temp_data (dict): Base data for successful process.
         """
 
+        return self.ffmpeg_full_args(*self._prepare_ffmpeg_arguments(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        ))
+
+    def _prepare_ffmpeg_arguments(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares ffmpeg arguments parts for expected extraction.
+
+        Returns:
+            tuple[list[str], list[str], list[str], list[str]]: Input
+                arguments, video filters, audio filters and output arguments.
+        """
+
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
 
@@ -797,7 +1027,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -845,6 +1075,58 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        all_args.extend(
+            self._ffmpeg_output_args(video_filters, audio_filters, output_args)
+        )
+        return all_args
+
+    def _ffmpeg_output_args(self, video_filters, audio_filters, output_args):
+        """Arguments of single output with its filters.
+
+        Filters found in output arguments are moved to list they belong to.
+
+        Args:
+            video_filters (list): All collected video filters.
+            audio_filters (list): All collected audio filters.
+            output_args (list): All collected ffmpeg output arguments with
+                output filepath.
+
+        Returns:
+            list: Filters and output arguments of an output.
+        """
+        output_args = self._split_output_filters(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _split_output_filters(self, video_filters, audio_filters, output_args):
+        """Move filters found in output arguments to their filters list.
+
+        Args:
+            video_filters (list): All collected video filters.
+            audio_filters (list): All collected audio filters.
+            output_args (list): All collected ffmpeg output arguments with
+                output filepath.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -862,29 +1144,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
-        all_args = [
-            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
-        ]
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        This will take nearest frame file and link or copy it with so as to
+        fill gaps in sequence. Last existing file there is is used to for the
+        hole ahead. Methods defined in 'gap_fill_methods' are tried in order
+        so files are duplicated only if filesystem does not support links.
 
         Args:
             files (list): List of representation files.
@@ -920,6 +1189,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Calculate paths
         added_files = []
+        fill_methods = self._get_gap_fill_methods()
         col_format = col.format("{head}{padding}{tail}")
         for hole_frame, src_frame in hole_frame_to_nearest.items():
             hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
@@ -928,11 +1198,63 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            self._fill_gap_file(src_fpath, hole_fpath, fill_methods)
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _get_gap_fill_methods(self):
+        """Validated methods from 'gap_fill_methods'.
+
+        Unknown methods are skipped with a warning. Copy is used if there
+        is no valid method.
+
+        Returns:
+            list[str]: Methods to fill gaps in order.
+        """
+        available_methods = ("hardlink", "symlink", "copy")
+        fill_methods = []
+        for method in self.gap_fill_methods:
+            if method not in available_methods:
+                self.log.warning((
+                    "Unknown gap fill method '{}'. Available methods are {}."
+                ).format(method, ", ".join(available_methods)))
+                continue
+            if method not in fill_methods:
+                fill_methods.append(method)
+        return fill_methods or ["copy"]
+
+    def _fill_gap_file(self, src_fpath, dst_fpath, fill_methods):
+        """Create file filling a gap in sequence.
+
+        Methods that fail are removed from 'fill_methods' so they are not
+        tried again for next files.
+
+        Args:
+            src_fpath (str): Path to existing frame.
+            dst_fpath (str): Path to missing frame.
+            fill_methods (list[str]): Methods to try in order.
+        """
+
+        for method in tuple(fill_methods):
+            try:
+                if method == "hardlink":
+                    create_hard_link(src_fpath, dst_fpath)
+                elif method == "symlink":
+                    os.symlink(src_fpath, dst_fpath)
+                elif method == "copy":
+                    speedcopy.copyfile(src_fpath, dst_fpath)
+                return
+
+            except (OSError, NotImplementedError):
+                if method == "copy" or len(fill_methods) == 1:
+                    raise
+                self.log.debug(
+                    "Failed to fill gap using '{}'.".format(method),
+                    exc_info=True
+                )
+                fill_methods.remove(method)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
@@ -1661,6 +1983,48 @@ class ExtractReview(pyblish.api.InstancePlugin):
         return vf_back
 
 
+class ExtractReviewDeferredOutputs(pyblish.api.InstancePlugin):
+    """Encode review outputs which were not encoded with burnins.
+
+    'ExtractReview' with enabled 'fuse_burnins' does not encode outputs
+    with "burnin" tag and leaves the encoding to 'ExtractBurnin'. Outputs
+    which were not processed by burnins are encoded without them.
+    """
+
+    label = "Extract Review Deferred Outputs"
+    order = pyblish.api.ExtractorOrder + 0.0305
+    families = ["review"]
+
+    def process(self, instance):
+        for repre in instance.data.get("representations") or []:
+            encode_data = repre.pop("reviewEncode", None)
+            if not encode_data:
+                continue
+
+            ffmpeg_args = [
+                subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+            ]
+            ffmpeg_args.extend(encode_data["input_args"])
+            if encode_data["video_filters"]:
+                ffmpeg_args.append("-filter:v")
+                ffmpeg_args.append("\"{}\"".format(
+                    ",".join(encode_data["video_filters"])
+                ))
+
+            if encode_data["audio_filters"]:
+                ffmpeg_args.append("-filter:a")
+                ffmpeg_args.append("\"{}\"".format(
+                    ",".join(encode_data["audio_filters"])
+                ))
+            ffmpeg_args.extend(encode_data["output_args"])
+
+            subprcs_cmd = " ".join(ffmpeg_args)
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            repre["ffmpeg_cmd"] = subprcs_cmd
+
+
 @six.add_metaclass(ABCMeta)
 class _OverscanValue:
     def __repr__(self):
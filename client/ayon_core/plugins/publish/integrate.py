@@ -2,14 +2,18 @@ import os
 import logging
 import sys
 import copy
+import collections
 
 import clique
 import six
 import pyblish.api
+import pyblish.logic
 from ayon_api import (
     get_attributes_for_type,
+    get_products,
     get_product_by_name,
     get_version_by_name,
+    get_versions,
     get_representations,
 )
 from ayon_api.operations import (
@@ -20,7 +24,10 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import source_hash
+from ayon_core.lib import (
+    source_hash_from_stat,
+    collect_files_stats,
+)
 from ayon_core.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -83,6 +90,116 @@ def get_frame_padded(frame, padding):
     return "{frame:0{padding}d}".format(padding=padding, frame=frame)
 
 
+class BatchedOperations(object):
+    """Entity operations of multiple instances committed in chunks.
+
+    Has the same interface as 'OperationsSession' for entity operations.
+    Also holds existing entities queried for all instances at once,
+    entities prepared by already processed instances and file transactions
+    which are finalized after the operations are committed.
+
+    Args:
+        chunk_size (int): Maximum number of operations sent to server
+            in one request.
+
+    """
+
+    def __init__(self, chunk_size):
+        self._chunk_size = max(1, chunk_size)
+        self._sessions = []
+        # Project name, entity type and id of created entities by session
+        self._created_entities = []
+        self._operations_count = 0
+
+        # Existing entities, value is 'None' if entity does not exist
+        #   - entities prepared by processed instances are added, so
+        #       instances with the same product share the entity
+        self.existing_products = {}
+        self.existing_versions = {}
+        self.existing_repres_by_version_id = {}
+        # Ids of products created in batch
+        self.new_product_ids = set()
+        # File transactions of processed instances
+        self.file_transactions = []
+        # Integration of an instance failed
+        self.failed = False
+
+    def _get_session(self):
+        if (
+            not self._sessions
+            or self._operations_count >= self._chunk_size
+        ):
+            self._sessions.append(OperationsSession())
+            self._created_entities.append([])
+            self._operations_count = 0
+        self._operations_count += 1
+        return self._sessions[-1]
+
+    def create_entity(self, project_name, entity_type, data):
+        session = self._get_session()
+        self._created_entities[-1].append(
+            (project_name, entity_type, data["id"])
+        )
+        return session.create_entity(project_name, entity_type, data)
+
+    def update_entity(self, project_name, entity_type, entity_id, data):
+        return self._get_session().update_entity(
+            project_name, entity_type, entity_id, data
+        )
+
+    def delete_entity(self, project_name, entity_type, entity_id):
+        return self._get_session().delete_entity(
+            project_name, entity_type, entity_id
+        )
+
+    def to_data(self):
+        output = []
+        for session in self._sessions:
+            output.extend(session.to_data())
+        return output
+
+    def clear(self):
+        """Discard all queued operations."""
+        self._sessions = []
+        self._created_entities = []
+        self._operations_count = 0
+
+    def commit(self):
+        """Commit all queued operations in chunks.
+
+        Entities created by already committed chunks are removed when
+            commit of a chunk fails.
+        """
+        sessions = self._sessions
+        created_entities = self._created_entities
+        self.clear()
+        committed_count = 0
+        try:
+            for session in sessions:
+                session.commit()
+                committed_count += 1
+        except Exception:
+            self._remove_entities(created_entities[:committed_count])
+            raise
+
+    def _remove_entities(self, created_entities):
+        session = OperationsSession()
+        # Children are created after their parents
+        for items in reversed(created_entities):
+            for project_name, entity_type, entity_id in reversed(items):
+                session.delete_entity(project_name, entity_type, entity_id)
+
+        if not session.to_data():
+            return
+        try:
+            session.commit()
+        except Exception:
+            log.warning(
+                "Failed to remove entities of partially committed batch.",
+                exc_info=True
+            )
+
+
 class IntegrateAsset(pyblish.api.InstancePlugin):
     """Register publish in the database and transfer files to destinations.
 
@@ -129,6 +246,21 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "output"
     ]
 
+    # Number of parallel file transfers (1 transfers files one by one)
+    transfer_max_workers = 1
+    # Use processes instead of threads for parallel file transfers
+    transfer_use_processes = False
+    # Backend used to copy files ('default' or 'kernel')
+    transfer_copy_backend = FileTransaction.COPY_BACKEND_DEFAULT
+    # Number of directories scanned in parallel to collect files info
+    files_info_max_workers = 8
+    # Hardlink files which did not change from previous version
+    delta_integrate = False
+    # Commit entity operations of all instances in batches
+    batch_operations = False
+    # Maximum number of entity operations sent to server in one request
+    operations_chunk_size = 100
+
     def process(self, instance):
         # Instance should be integrated on a farm
         if instance.data.get("farm"):
@@ -151,15 +283,32 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["productType"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        batched_operations = None
+        if self.batch_operations:
+            batched_operations = self._get_batched_operations(
+                instance.context
+            )
+            # Batch is committed only if all instances are integrated
+            if batched_operations.failed:
+                raise KnownPublishError(
+                    "Skipping, integration of other instance failed."
+                )
+
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            use_processes=self.transfer_use_processes,
+            copy_backend=self.transfer_copy_backend,
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
             # Raise DuplicateDestinationError as KnownPublishError
             # and rollback the transactions
             file_transactions.rollback()
+            self._rollback_batched_operations(instance.context)
             six.reraise(KnownPublishError,
                         KnownPublishError(exc),
                         sys.exc_info()[2])
@@ -167,9 +316,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             # clean destination
             # todo: preferably we'd also rollback *any* changes to the database
             file_transactions.rollback()
+            self._rollback_batched_operations(instance.context)
             self.log.critical("Error when registering", exc_info=True)
             six.reraise(*sys.exc_info())
 
+        if batched_operations is not None:
+            # Transactions are finalized after batched operations
+            #   are committed by 'IntegrateBatchedOperations'
+            batched_operations.file_transactions.append(file_transactions)
+            return
+
         # Finalizing can't rollback safely so no use for moving it to
         # the try, except.
         file_transactions.finalize()
@@ -220,7 +376,17 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         template_name = self.get_template_name(instance)
 
-        op_session = OperationsSession()
+        batched_operations = None
+        if self.batch_operations:
+            # Operations of all instances are committed at once
+            #   by 'IntegrateBatchedOperations'
+            batched_operations = self._get_batched_operations(
+                instance.context
+            )
+            op_session = batched_operations
+        else:
+            op_session = OperationsSession()
+
         product_entity = self.prepare_product(
             instance, op_session, project_name
         )
@@ -234,12 +400,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Get existing representations (if any)
         existing_repres_by_name = {
             repre_entity["name"].lower(): repre_entity
-            for repre_entity in get_representations(
-                project_name,
-                version_ids=[version_entity["id"]]
+            for repre_entity in self._get_existing_representations(
+                instance.context, project_name, version_entity["id"]
             )
         }
 
+        # Files of previous version for delta integrate
+        previous_files_by_repre_name = {}
+        if self.delta_integrate:
+            previous_files_by_repre_name = self._get_previous_version_files(
+                project_name, version_entity, anatomy
+            )
+
         # Prepare all representations
         prepared_representations = []
         for repre in filtered_repres:
@@ -252,9 +424,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 instance_stagingdir,
                 instance)
 
-            for src, dst in prepared["transfers"]:
-                # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+            previous_files = previous_files_by_repre_name.get(
+                repre["name"].lower(), {}
+            )
+            prepared["source_hashes"] = self._add_repre_transfers(
+                file_transactions, prepared["transfers"], previous_files
+            )
 
             prepared_representations.append(prepared)
 
@@ -280,11 +455,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Transaction to reduce the chances of another publish trying to
         # publish to the same version number since that chance can greatly
         # increase if the file transaction takes a long time.
-        op_session.commit()
+        if batched_operations is None:
+            op_session.commit()
 
-        self.log.info((
-            "Product '{}' version {} written to database.."
-        ).format(product_entity["name"], version_entity["version"]))
+            self.log.info((
+                "Product '{}' version {} written to database.."
+            ).format(product_entity["name"], version_entity["version"]))
 
         # Process all file transfers of all integrations now
         self.log.debug("Integrating source files to destination ...")
@@ -313,6 +489,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             repre_files = self.get_files_info(
                 destinations, anatomy
             )
+            # Store source hashes of files for delta integrate of next
+            #   version
+            source_hashes = prepared["source_hashes"]
+            if source_hashes:
+                repre_entity["data"]["sourceHashes"] = {
+                    source_hashes[dst]: file_info["id"]
+                    for dst, file_info in zip(destinations, repre_files)
+                    if dst in source_hashes
+                }
+                if repre_update_data is not None:
+                    repre_update_data["data"] = repre_entity["data"]
+
             # Add the version resource file infos to each representation
             repre_files += resource_file_infos
             repre_entity["files"] = repre_files
@@ -347,8 +535,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                         project_name, "representation", existing_repres["id"]
                     )
 
-        self.log.debug("{}".format(op_session.to_data()))
-        op_session.commit()
+        if batched_operations is None:
+            self.log.debug("{}".format(op_session.to_data()))
+            op_session.commit()
 
         # Backwards compatibility used in hero integration.
         # todo: can we avoid the need to store this?
@@ -365,6 +554,299 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
         )
 
+    def _get_previous_version_files(
+        self, project_name, version_entity, anatomy
+    ):
+        """Published files of previous version for delta integrate.
+
+        Only files with source hash stored in representation data are
+        returned, source hashes are stored only by delta integrate.
+
+        Args:
+            project_name (str): Project name.
+            version_entity (dict[str, Any]): Integrated version entity.
+            anatomy (Anatomy): Project anatomy.
+
+        Returns:
+            dict[str, dict[str, tuple[str, int]]]: Path and size of
+                published files by source hash by lowered representation
+                name.
+
+        """
+        version_number = version_entity["version"]
+        previous_version = None
+        for version in get_versions(
+            project_name,
+            product_ids=[version_entity["productId"]],
+            fields={"id", "version"},
+            hero=False,
+        ):
+            if not 0 < version["version"] < version_number:
+                continue
+            if (
+                previous_version is None
+                or previous_version["version"] < version["version"]
+            ):
+                previous_version = version
+
+        if previous_version is None:
+            return {}
+
+        self.log.debug("Delta integrate from version v{:03d}".format(
+            previous_version["version"]
+        ))
+        output = {}
+        for repre_entity in get_representations(
+            project_name,
+            version_ids=[previous_version["id"]],
+            fields={"name", "files", "data"},
+        ):
+            source_hashes = (repre_entity.get("data") or {}).get(
+                "sourceHashes"
+            )
+            if not source_hashes:
+                continue
+            files_by_id = {
+                file_info["id"]: file_info
+                for file_info in repre_entity["files"]
+            }
+            files_by_hash = {}
+            for source_hash, file_id in source_hashes.items():
+                file_info = files_by_id.get(file_id)
+                if file_info is None:
+                    continue
+                files_by_hash[source_hash] = (
+                    anatomy.fill_root(file_info["path"]),
+                    file_info["size"]
+                )
+            output[repre_entity["name"].lower()] = files_by_hash
+        return output
+
+    def _add_repre_transfers(
+        self, file_transactions, transfers, previous_files
+    ):
+        """Add transfers of representation files to file transactions.
+
+        With delta integrate are files, which have the same source hash as
+        files of previous version, hardlinked from the previous version
+        instead of copied. Source file is copied if hardlink can't be
+        created.
+
+        Args:
+            file_transactions (FileTransaction): File transactions.
+            transfers (list[tuple[str, str]]): Source and destination paths.
+            previous_files (dict[str, tuple[str, int]]): Path and size of
+                previous version files by source hash.
+
+        Returns:
+            dict[str, str]: Source hashes by destination path. Empty if
+                delta integrate is disabled.
+
+        """
+        if not self.delta_integrate:
+            for src, dst in transfers:
+                file_transactions.add(src, dst)
+            return {}
+
+        stats_by_path = collect_files_stats(
+            [src for src, _ in transfers],
+            max_workers=self.files_info_max_workers
+        )
+        source_hashes = {}
+        linked_count = 0
+        for src, dst in transfers:
+            stat_result = stats_by_path[src]
+            source_hash = source_hash_from_stat(src, stat_result)
+            source_hashes[dst] = source_hash
+
+            previous_path, previous_size = previous_files.get(
+                source_hash, (None, None)
+            )
+            if (
+                previous_path is not None
+                and previous_size == stat_result.st_size
+                and os.path.isfile(previous_path)
+                and os.path.getsize(previous_path) == previous_size
+            ):
+                file_transactions.add(
+                    previous_path,
+                    dst,
+                    mode=FileTransaction.MODE_HARDLINK,
+                    fallback_src=src,
+                )
+                linked_count += 1
+            else:
+                file_transactions.add(src, dst)
+
+        if linked_count:
+            self.log.debug(
+                "Delta integrate: {} of {} files hardlinked".format(
+                    linked_count, len(transfers)
+                )
+            )
+        return source_hashes
+
+    def _get_batched_operations(self, context):
+        """Get batched operations of context.
+
+        Existing products, versions and representations of all instances
+            processed by this plugin are queried when called for the first
+            time.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            BatchedOperations: Batched operations.
+
+        """
+        batched_operations = context.data.get("integrateBatchedOperations")
+        if batched_operations is None:
+            batched_operations = BatchedOperations(self.operations_chunk_size)
+            context.data["integrateBatchedOperations"] = batched_operations
+            self._query_existing_entities(context, batched_operations)
+        return batched_operations
+
+    def _query_existing_entities(self, context, batched_operations):
+        """Query existing entities of all instances at once.
+
+        Only existing entities are queried, entities are created when
+            an instance is processed.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+            batched_operations (BatchedOperations): Batched operations.
+
+        """
+        project_name = context.data["projectName"]
+        existing_products = batched_operations.existing_products
+        version_numbers_by_key = collections.defaultdict(set)
+        for instance in pyblish.logic.instances_by_plugin(
+            context, self.__class__
+        ):
+            if (
+                not instance.data.get("publish", True)
+                or instance.data.get("farm")
+                or not instance.data.get("integrate", True)
+            ):
+                continue
+            key = (
+                instance.data["folderEntity"]["id"],
+                instance.data["productName"]
+            )
+            existing_products[key] = None
+            version_numbers_by_key[key].add(instance.data["version"])
+
+        if not existing_products:
+            return
+
+        folder_ids = {key[0] for key in existing_products}
+        product_names = {key[1] for key in existing_products}
+        for product_entity in get_products(
+            project_name,
+            folder_ids=folder_ids,
+            product_names=product_names,
+        ):
+            key = (product_entity["folderId"], product_entity["name"])
+            if key in existing_products:
+                existing_products[key] = product_entity
+
+        existing_versions = batched_operations.existing_versions
+        for key, product_entity in existing_products.items():
+            if product_entity is None:
+                continue
+            for version_number in version_numbers_by_key[key]:
+                existing_versions[(product_entity["id"], version_number)] = (
+                    None
+                )
+
+        if not existing_versions:
+            return
+
+        product_ids = {key[0] for key in existing_versions}
+        version_numbers = {key[1] for key in existing_versions}
+        for version_entity in get_versions(
+            project_name,
+            product_ids=product_ids,
+            versions=version_numbers,
+        ):
+            key = (version_entity["productId"], version_entity["version"])
+            if key in existing_versions:
+                existing_versions[key] = version_entity
+
+        existing_repres = batched_operations.existing_repres_by_version_id
+        version_ids = {
+            version_entity["id"]
+            for version_entity in existing_versions.values()
+            if version_entity is not None
+        }
+        for version_id in version_ids:
+            existing_repres[version_id] = []
+        if version_ids:
+            for repre_entity in get_representations(
+                project_name, version_ids=version_ids
+            ):
+                existing_repres[repre_entity["versionId"]].append(
+                    repre_entity
+                )
+
+    def _rollback_batched_operations(self, context):
+        """Discard batched operations after failed integration of instance.
+
+        Transferred files of already processed instances are rolled back,
+            so nothing of the batch is integrated.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        """
+        batched_operations = context.data.get("integrateBatchedOperations")
+        if batched_operations is None:
+            return
+
+        batched_operations.failed = True
+        batched_operations.clear()
+        file_transactions = batched_operations.file_transactions
+        batched_operations.file_transactions = []
+        for file_transaction in file_transactions:
+            file_transaction.rollback()
+
+    def _get_existing_product_entity(
+        self, context, project_name, folder_id, product_name
+    ):
+        batched_operations = context.data.get("integrateBatchedOperations")
+        key = (folder_id, product_name)
+        if (
+            batched_operations is not None
+            and key in batched_operations.existing_products
+        ):
+            return batched_operations.existing_products[key]
+        return get_product_by_name(project_name, product_name, folder_id)
+
+    def _get_existing_version_entity(
+        self, context, project_name, product_id, version_number
+    ):
+        batched_operations = context.data.get("integrateBatchedOperations")
+        key = (product_id, version_number)
+        if batched_operations is not None:
+            if key in batched_operations.existing_versions:
+                return batched_operations.existing_versions[key]
+            # Product is not on server yet
+            if product_id in batched_operations.new_product_ids:
+                return None
+        return get_version_by_name(project_name, version_number, product_id)
+
+    def _get_existing_representations(self, context, project_name, version_id):
+        batched_operations = context.data.get("integrateBatchedOperations")
+        if batched_operations is not None:
+            existing_repres = batched_operations.existing_repres_by_version_id
+            if version_id in existing_repres:
+                return existing_repres[version_id]
+        return list(get_representations(
+            project_name,
+            version_ids=[version_id]
+        ))
+
     def prepare_product(self, instance, op_session, project_name):
         folder_entity = instance.data["folderEntity"]
         product_name = instance.data["productName"]
@@ -372,8 +854,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         self.log.debug("Product: {}".format(product_name))
 
         # Get existing product if it exists
-        existing_product_entity = get_product_by_name(
-            project_name, product_name, folder_entity["id"]
+        existing_product_entity = self._get_existing_product_entity(
+            instance.context, project_name, folder_entity["id"], product_name
         )
 
         # Define product data
@@ -429,6 +911,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 update_data
             )
 
+        if isinstance(op_session, BatchedOperations):
+            key = (folder_entity["id"], product_name)
+            op_session.existing_products[key] = product_entity
+            if existing_product_entity is None:
+                op_session.new_product_ids.add(product_entity["id"])
+
         self.log.debug("Prepared product: {}".format(product_name))
         return product_entity
 
@@ -441,10 +929,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         if task_entity:
             task_id = task_entity["id"]
 
-        existing_version = get_version_by_name(
+        existing_version = self._get_existing_version_entity(
+            instance.context,
             project_name,
-            version_number,
-            product_entity["id"]
+            product_entity["id"],
+            version_number
         )
         version_id = None
         if existing_version:
@@ -484,6 +973,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 project_name, "version", version_entity
             )
 
+        if isinstance(op_session, BatchedOperations):
+            key = (product_entity["id"], version_number)
+            op_session.existing_versions[key] = version_entity
+            if existing_version is None:
+                op_session.existing_repres_by_version_id[
+                    version_entity["id"]
+                ] = []
+
         self.log.debug(
             "Prepared version: v{0:03d}".format(version_entity["version"])
         )
@@ -722,22 +1219,26 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            def _iter_template_data():
+                for index in destination_indexes:
+                    if is_udim:
+                        template_data["udim"] = index
+                    else:
+                        template_data["frame"] = index
+                    yield template_data
+
+            dst_filepaths = path_template_obj.format_many(
+                _iter_template_data(), strict=True
+            )
+            if not dst_filepaths:
+                raise KnownPublishError((
+                    "Template \"{}\" did not produce any destination"
+                    " for representation \"{}\"."
+                ).format(path_template_obj.template, repre["name"]))
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -957,6 +1458,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
     def get_files_info(self, filepaths, anatomy):
         """Prepare 'files' info portion for representations.
 
+        Files are stat-ed only once and the stat is used for both size
+        and hash of the file.
+
         Arguments:
             filepaths (Iterable[str]): List of transferred file paths.
             anatomy (Anatomy): Project anatomy.
@@ -965,29 +1469,39 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             list[dict[str, Any]]: Representation 'files' information.
 
         """
+        filepaths = list(filepaths)
+        stats_by_path = collect_files_stats(
+            filepaths, max_workers=self.files_info_max_workers
+        )
         file_infos = []
         for filepath in filepaths:
-            file_info = self.prepare_file_info(filepath, anatomy)
+            file_info = self.prepare_file_info(
+                filepath, anatomy, stats_by_path[filepath]
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy):
+    def prepare_file_info(self, path, anatomy, stat_result=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
             path (str): Destination url of published file.
             anatomy (Anatomy): Project anatomy part from instance.
+            stat_result (Optional[os.stat_result]): Already collected stat
+                of the file.
 
         Returns:
             dict[str, Any]: Representation file info dictionary.
 
         """
+        if stat_result is None:
+            stat_result = os.stat(path)
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": stat_result.st_size,
+            "hash": source_hash_from_stat(path, stat_result),
             "hash_type": "op3",
         }
 
@@ -1027,3 +1541,44 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 attributes[key] = get_attributes_for_type(key)
             context.data["ayonAttributes"] = attributes
         return attributes
+
+
+class IntegrateBatchedOperations(pyblish.api.ContextPlugin):
+    """Commit entity operations batched by 'IntegrateAsset'.
+
+    Products, versions and representations of all integrated instances
+    are committed at once and file transactions are finalized afterwards.
+    Transferred files are rolled back if the commit fails.
+
+    Operations are batched only if 'batch_operations' is enabled on
+    'IntegrateAsset'.
+    """
+
+    label = "Integrate Batched Operations"
+    # Must run before plugins which expect the entities on server
+    order = pyblish.api.IntegratorOrder + 0.001
+
+    def process(self, context):
+        batched_operations = context.data.get("integrateBatchedOperations")
+        if batched_operations is None or batched_operations.failed:
+            return
+
+        file_transactions = batched_operations.file_transactions
+        batched_operations.file_transactions = []
+        self.log.debug("{}".format(batched_operations.to_data()))
+        try:
+            batched_operations.commit()
+        except Exception:
+            batched_operations.failed = True
+            for file_transaction in file_transactions:
+                file_transaction.rollback()
+            raise
+
+        for file_transaction in file_transactions:
+            file_transaction.finalize()
+
+        self.log.info(
+            "Entities of {} instances written to database..".format(
+                len(file_transactions)
+            )
+        )
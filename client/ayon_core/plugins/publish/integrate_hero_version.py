@@ -12,7 +12,11 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import create_hard_link, source_hash
+from ayon_core.lib import (
+    create_hard_link,
+    source_hash_from_stat,
+    collect_files_stats,
+)
 from ayon_core.pipeline.publish import (
     get_publish_template_name,
     OptionalPyblishPluginMixin,
@@ -505,6 +509,9 @@ class IntegrateHeroVersion(
     def get_files_info(self, filepaths, anatomy):
         """Prepare 'files' info portion for representations.
 
+        Files are stat-ed only once and the stat is used for both size
+        and hash of the file.
+
         Arguments:
             filepaths (Iterable[str]): List of transferred file paths.
             anatomy (Anatomy): Project anatomy.
@@ -513,29 +520,37 @@ class IntegrateHeroVersion(
             list[dict[str, Any]]: Representation 'files' information.
 
         """
+        filepaths = list(filepaths)
+        stats_by_path = collect_files_stats(filepaths)
         file_infos = []
         for filepath in filepaths:
-            file_info = self.prepare_file_info(filepath, anatomy)
+            file_info = self.prepare_file_info(
+                filepath, anatomy, stats_by_path[filepath]
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy):
+    def prepare_file_info(self, path, anatomy, stat_result=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
             path (str): Destination url of published file.
             anatomy (Anatomy): Project anatomy part from instance.
+            stat_result (Optional[os.stat_result]): Already collected stat
+                of the file.
 
         Returns:
             dict[str, Any]: Representation file info dictionary.
 
         """
+        if stat_result is None:
+            stat_result = os.stat(path)
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": stat_result.st_size,
+            "hash": source_hash_from_stat(path, stat_result),
             "hash_type": "op3",
         }
 
@@ -5,11 +5,15 @@ that don't have access to OpenColorIO or their version of OpenColorIO is
 not compatible.
 """
 
+import os
+import sys
 import json
+import traceback
 from pathlib import Path
 
 import click
 
+from ayon_core.pipeline import colorspace
 from ayon_core.pipeline.colorspace import (
     has_compatible_ocio_package,
     get_display_view_colorspace_name,
@@ -211,6 +215,70 @@ def _get_display_view_colorspace_name(
     )
 
 
+@main.command(
+    name="serve",
+    help="answer queries from stdin until stdin is closed")
+@click.option(
+    "--token",
+    required=True,
+    help="prefix of response lines",
+    type=click.STRING)
+def _serve(token):
+    """Answer queries from stdin, one json request per line.
+
+    Request contains "command" and "kwargs" of the command. Response
+    line is prefixed with token and contains "result" or "error".
+    Results are cached by config path and its modification time.
+
+    Args:
+        token (str): prefix of response lines
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve --token <token>
+    """
+    # Use implementations directly, cache is handled here
+    commands = {
+        "get_ocio_config_colorspaces": (
+            colorspace._get_ocio_config_colorspaces
+        ),
+        "get_ocio_config_views": colorspace._get_ocio_config_views,
+        "get_config_version_data": colorspace._get_config_version_data,
+        "get_config_file_rules_colorspace_from_filepath": (
+            colorspace._get_config_file_rules_colorspace_from_filepath
+        ),
+        "get_display_view_colorspace_name": (
+            colorspace._get_display_view_colorspace_name
+        ),
+    }
+    cache = {}
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = {}
+        try:
+            request = json.loads(line)
+            command = request["command"]
+            kwargs = request.get("kwargs") or {}
+            config_path = kwargs["config_path"]
+            cache_key = (
+                command,
+                config_path,
+                os.path.getmtime(config_path),
+                json.dumps(kwargs, sort_keys=True),
+            )
+            if cache_key not in cache:
+                cache[cache_key] = commands[command](**kwargs)
+            response["result"] = cache[cache_key]
+
+        except Exception:
+            response["error"] = traceback.format_exc()
+
+        sys.stdout.write("{}:{}\n".format(token, json.dumps(response)))
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
     if not has_compatible_ocio_package():
         raise RuntimeError("OpenColorIO is not available.")
@@ -640,10 +640,86 @@ def burnins_from_data(
         "shot": "sh0010"
     }
     """
+    burnin = _prepare_burnins(
+        input_path, data, options, burnin_values, full_input_path,
+        first_frame
+    )
+
+    ffmpeg_args = []
+    if codec_data:
+        # Use codec definition from method arguments
+        ffmpeg_args = codec_data
+        ffmpeg_args.append("-g 1")
+
+    else:
+        ffmpeg_args.extend(
+            get_ffmpeg_format_args(burnin.ffprobe_data, source_ffmpeg_cmd)
+        )
+        ffmpeg_args.extend(
+            get_ffmpeg_codec_args(burnin.ffprobe_data, source_ffmpeg_cmd)
+        )
+        # Use arguments from source if are available source arguments
+        if source_ffmpeg_cmd:
+            copy_args = (
+                "-metadata",
+                "-metadata:s:v:0",
+            )
+            args = source_ffmpeg_cmd.split(" ")
+            for idx, arg in enumerate(args):
+                if arg in copy_args:
+                    ffmpeg_args.extend([arg, args[idx + 1]])
+
+    # Use group one (same as `-intra` argument, which is deprecated)
+    ffmpeg_args_str = " ".join(ffmpeg_args)
+    burnin.render(
+        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+    )
+
+
+def burnin_filters_from_data(
+    input_path, data, options=None, burnin_values=None,
+    full_input_path=None, video_stream=None
+):
+    """Prepare burnin filters without rendering them.
+
+    Filters can be added to video filters of other ffmpeg process so the
+    burnins are rendered within its encode. Arguments are same as for
+    'burnins_from_data'.
+
+    Args:
+        input_path (str): Path to input which will be used by ffmpeg.
+        data (dict): Data required for burnin settings.
+        options (dict): Options for burnins.
+        burnin_values (dict): Contain positioned values.
+        full_input_path (str): Path to file used to receive ffprobe data.
+        video_stream (dict): Values overriding data of video stream
+            from ffprobe e.g. resolution of filtered output.
+
+    Returns:
+        tuple[str, list[str]]: Filter string and paths to temporary files
+            used by filters, which must be removed after rendering.
+    """
+    burnin = _prepare_burnins(
+        input_path, data, options, burnin_values, full_input_path,
+        video_stream=video_stream
+    )
+    return burnin.filter_string, list(burnin.cleanup_paths)
+
+
+def _prepare_burnins(
+    input_path, data, options, burnin_values, full_input_path,
+    first_frame=None, video_stream=None
+):
     ffprobe_data = None
     if full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
+    if video_stream and ffprobe_data:
+        for stream in ffprobe_data.get("streams") or []:
+            if stream.get("codec_type") == "video":
+                stream.update(video_stream)
+                break
+
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
 
     frame_start = data.get("frame_start")
@@ -693,7 +769,6 @@ def burnins_from_data(
     if source_timecode is not None:
         data[SOURCE_TIMECODE_KEY[1:-1]] = SOURCE_TIMECODE_KEY
 
-    clean_up_paths = []
     for align_text, value in burnin_values.items():
         if not value:
             continue
@@ -779,37 +854,7 @@ def burnins_from_data(
 
         burnin.add_text(text, align, frame_start, frame_end)
 
-    ffmpeg_args = []
-    if codec_data:
-        # Use codec definition from method arguments
-        ffmpeg_args = codec_data
-        ffmpeg_args.append("-g 1")
-
-    else:
-        ffmpeg_args.extend(
-            get_ffmpeg_format_args(burnin.ffprobe_data, source_ffmpeg_cmd)
-        )
-        ffmpeg_args.extend(
-            get_ffmpeg_codec_args(burnin.ffprobe_data, source_ffmpeg_cmd)
-        )
-        # Use arguments from source if are available source arguments
-        if source_ffmpeg_cmd:
-            copy_args = (
-                "-metadata",
-                "-metadata:s:v:0",
-            )
-            args = source_ffmpeg_cmd.split(" ")
-            for idx, arg in enumerate(args):
-                if arg in copy_args:
-                    ffmpeg_args.extend([arg, args[idx + 1]])
-
-    # Use group one (same as `-intra` argument, which is deprecated)
-    ffmpeg_args_str = " ".join(ffmpeg_args)
-    burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
-    )
-    for path in clean_up_paths:
-        os.remove(path)
+    return burnin
 
 
 if __name__ == "__main__":
@@ -818,15 +863,33 @@ if __name__ == "__main__":
     with open(in_data_json_path, "r") as file_stream:
         in_data = json.load(file_stream)
 
-    burnins_from_data(
-        in_data["input"],
-        in_data["output"],
-        in_data["burnin_data"],
-        codec_data=in_data.get("codec"),
-        options=in_data.get("options"),
-        burnin_values=in_data.get("values"),
-        full_input_path=in_data.get("full_input_path"),
-        first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
-    )
+    # Only prepare filters which are rendered by other ffmpeg process
+    filters_output = in_data.get("filters_output")
+    if filters_output:
+        filter_string, cleanup_paths = burnin_filters_from_data(
+            in_data["input"],
+            in_data["burnin_data"],
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values"),
+            full_input_path=in_data.get("full_input_path"),
+            video_stream=in_data.get("video_stream")
+        )
+        with open(filters_output, "w") as file_stream:
+            json.dump(
+                {"filters": filter_string, "cleanup_paths": cleanup_paths},
+                file_stream
+            )
+
+    else:
+        burnins_from_data(
+            in_data["input"],
+            in_data["output"],
+            in_data["burnin_data"],
+            codec_data=in_data.get("codec"),
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values"),
+            full_input_path=in_data.get("full_input_path"),
+            first_frame=in_data.get("first_frame"),
+            source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        )
     print("* Burnin script has finished")
@@ -2,7 +2,7 @@ import os
 import json
 import logging
 import collections
-import copy
+import hashlib
 import time
 
 import ayon_api
@@ -10,11 +10,85 @@ import ayon_api
 log = logging.getLogger(__name__)
 
 
+def _read_only_error(*args, **kwargs):
+    raise TypeError(
+        "Settings are read-only. Use 'copy.deepcopy' to get"
+        " modifiable copy."
+    )
+
+
+class _ReadOnlyDict(dict):
+    """Dictionary of settings which can't be modified.
+
+    Deep copy of the object is a regular modifiable dictionary.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _read_only_error
+    clear = pop = popitem = setdefault = update = _read_only_error
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return _copy_settings(self)
+
+    def __reduce__(self):
+        return dict, (_copy_settings(self), )
+
+
+class _ReadOnlyList(list):
+    """List of settings which can't be modified.
+
+    Deep copy of the object is a regular modifiable list.
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only_error
+    append = extend = insert = pop = remove = _read_only_error
+    clear = sort = reverse = _read_only_error
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return _copy_settings(self)
+
+    def __reduce__(self):
+        return list, (_copy_settings(self), )
+
+
+def _freeze_settings(value):
+    """Convert settings to read-only objects."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict(
+            (key, _freeze_settings(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze_settings(item) for item in value)
+    return value
+
+
+def _copy_settings(value):
+    """Copy settings to modifiable objects.
+
+    Settings contain only json serializable types so the copy is much
+    faster than 'copy.deepcopy'.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _copy_settings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_settings(item) for item in value]
+    return value
+
+
 class CacheItem:
     lifetime = 10
 
     def __init__(self, value, outdate_time=None):
-        self._value = value
+        self._value = _freeze_settings(value)
         if outdate_time is None:
             outdate_time = time.time() + self.lifetime
         self._outdate_time = outdate_time
@@ -23,11 +97,22 @@ class CacheItem:
     def create_outdated(cls):
         return cls({}, 0)
 
-    def get_value(self):
-        return copy.deepcopy(self._value)
+    def get_value(self, read_only=False):
+        """Cached value.
+
+        Args:
+            read_only (Optional[bool]): Return read-only value without
+                copying it.
+
+        Returns:
+            Any: Cached value.
+        """
+        if read_only:
+            return self._value
+        return _copy_settings(self._value)
 
     def update_value(self, value):
-        self._value = value
+        self._value = _freeze_settings(value)
         self._outdate_time = time.time() + self.lifetime
 
     @property
@@ -35,6 +120,156 @@ class CacheItem:
         return time.time() > self._outdate_time
 
 
+class _SettingsDiskCache:
+    """Settings cache stored on disk shared across processes.
+
+    Used to avoid downloading the same settings by processes that start at
+    the same time e.g. farm jobs. Cache is used only if
+    'AYON_SETTINGS_CACHE_DIR' environment variable is set. Lifetime of
+    cached settings in seconds can be changed with
+    'AYON_SETTINGS_CACHE_LIFETIME' (default 60).
+
+    Server does not provide revision of settings, so cached values are
+    identified by server url, bundle, variant and project name and are
+    invalidated after their lifetime. Cache files are readable only by
+    the user who created them.
+    """
+
+    default_lifetime = 60
+    # How long to wait for other process downloading the same settings
+    lock_timeout = 30
+    lock_poll_interval = 0.2
+
+    @classmethod
+    def _get_cache_dir(cls):
+        return os.environ.get("AYON_SETTINGS_CACHE_DIR") or None
+
+    @classmethod
+    def _get_lifetime(cls):
+        try:
+            return float(os.environ["AYON_SETTINGS_CACHE_LIFETIME"])
+        except (KeyError, ValueError):
+            return cls.default_lifetime
+
+    @classmethod
+    def _get_path(cls, cache_dir, key):
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(cache_dir, "settings_{}.json".format(key_hash))
+
+    @classmethod
+    def _load(cls, path):
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+
+        if time.time() - stat_result.st_mtime > cls._get_lifetime():
+            return None
+
+        try:
+            with open(path, "r") as stream:
+                return json.load(stream)["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def _store(cls, path, value):
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            fd = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "w") as stream:
+                json.dump({"value": value}, stream)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            log.debug("Failed to store settings cache.", exc_info=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def _acquire_lock(cls, lock_path):
+        """Try to create lock file.
+
+        Returns:
+            bool: Lock was acquired.
+
+        Raises:
+            OSError: Lock file can't be created for other reason than
+                existing lock e.g. cache directory is read-only.
+        """
+        try:
+            os.close(os.open(
+                lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+            ))
+            return True
+        except FileExistsError:
+            pass
+
+        # Remove lock of process that probably crashed
+        try:
+            if time.time() - os.stat(lock_path).st_mtime > cls.lock_timeout:
+                os.remove(lock_path)
+        except OSError:
+            pass
+        return False
+
+    @classmethod
+    def get_value(cls, key, fetch_func):
+        """Get cached value or fetch it and store it to cache.
+
+        Args:
+            key (tuple[str, ...]): Key identifying the value.
+            fetch_func (Callable[[], Any]): Function to get the value
+                from server.
+
+        Returns:
+            Any: Settings value.
+        """
+        cache_dir = cls._get_cache_dir()
+        if not cache_dir:
+            return fetch_func()
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError:
+            return fetch_func()
+
+        path = cls._get_path(cache_dir, key)
+        value = cls._load(path)
+        if value is not None:
+            return value
+
+        lock_path = path + ".lock"
+        start = time.time()
+        while True:
+            try:
+                if cls._acquire_lock(lock_path):
+                    break
+            except OSError:
+                log.debug(
+                    "Failed to create settings cache lock.", exc_info=True
+                )
+                return fetch_func()
+            # Other process is downloading the same settings
+            time.sleep(cls.lock_poll_interval)
+            value = cls._load(path)
+            if value is not None:
+                return value
+            if time.time() - start > cls.lock_timeout:
+                return fetch_func()
+
+        try:
+            value = fetch_func()
+            cls._store(path, value)
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+        return value
+
+
 class _AyonSettingsCache:
     use_bundles = None
     variant = None
@@ -76,19 +311,41 @@ class _AyonSettingsCache:
         return os.environ["AYON_BUNDLE_NAME"]
 
     @classmethod
-    def get_value_by_project(cls, project_name):
+    def _get_disk_cache_key(cls, *args):
+        return (ayon_api.get_base_url(), cls._get_variant()) + args
+
+    @classmethod
+    def _get_settings_disk_cache_key(cls, *args):
+        # Settings contain overrides of current site, cache directory
+        #   can be shared by machines of different sites
+        return cls._get_disk_cache_key(
+            "settings", ayon_api.get_site_id(), *args
+        )
+
+    @classmethod
+    def get_value_by_project(cls, project_name, read_only=False):
         cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
         if cache_item.is_outdated:
             if cls._use_bundles():
-                value = ayon_api.get_addons_settings(
-                    bundle_name=cls._get_bundle_name(),
-                    project_name=project_name,
-                    variant=cls._get_variant()
+                bundle_name = cls._get_bundle_name()
+                variant = cls._get_variant()
+                value = _SettingsDiskCache.get_value(
+                    cls._get_settings_disk_cache_key(
+                        bundle_name, project_name
+                    ),
+                    lambda: ayon_api.get_addons_settings(
+                        bundle_name=bundle_name,
+                        project_name=project_name,
+                        variant=variant
+                    )
                 )
             else:
-                value = ayon_api.get_addons_settings(project_name)
+                value = _SettingsDiskCache.get_value(
+                    cls._get_settings_disk_cache_key(project_name),
+                    lambda: ayon_api.get_addons_settings(project_name)
+                )
             cache_item.update_value(value)
-        return cache_item.get_value()
+        return cache_item.get_value(read_only)
 
     @classmethod
     def _get_addon_versions_from_bundle(cls):
@@ -107,20 +364,28 @@ class _AyonSettingsCache:
         return {}
 
     @classmethod
-    def get_addon_versions(cls):
+    def get_addon_versions(cls, read_only=False):
         cache_item = _AyonSettingsCache.addon_versions
         if cache_item.is_outdated:
             if cls._use_bundles():
-                addons = cls._get_addon_versions_from_bundle()
+                addons = _SettingsDiskCache.get_value(
+                    cls._get_disk_cache_key(
+                        "addon_versions", cls._get_bundle_name()
+                    ),
+                    cls._get_addon_versions_from_bundle
+                )
             else:
-                settings_data = ayon_api.get_addons_settings(
-                    only_values=False,
-                    variant=cls._get_variant()
+                variant = cls._get_variant()
+                addons = _SettingsDiskCache.get_value(
+                    cls._get_disk_cache_key("addon_versions"),
+                    lambda: ayon_api.get_addons_settings(
+                        only_values=False,
+                        variant=variant
+                    )["versions"]
                 )
-                addons = settings_data["versions"]
             cache_item.update_value(addons)
 
-        return cache_item.get_value()
+        return cache_item.get_value(read_only)
 
 
 def get_site_local_overrides(project_name, site_name, local_settings=None):
@@ -139,27 +404,29 @@ def get_site_local_overrides(project_name, site_name, local_settings=None):
     return {}
 
 
-def get_ayon_settings(project_name=None):
+def get_ayon_settings(project_name=None, read_only=False):
     """AYON studio settings.
 
     Raw AYON settings values.
 
     Args:
         project_name (Optional[str]): Project name.
+        read_only (Optional[bool]): Return cached settings without copying
+            them. Returned settings can't be modified.
 
     Returns:
         dict[str, Any]: AYON settings.
     """
 
-    return _AyonSettingsCache.get_value_by_project(project_name)
+    return _AyonSettingsCache.get_value_by_project(project_name, read_only)
 
 
-def get_studio_settings(*args, **kwargs):
-    return _AyonSettingsCache.get_value_by_project(None)
+def get_studio_settings(*args, read_only=False, **kwargs):
+    return _AyonSettingsCache.get_value_by_project(None, read_only)
 
 
-def get_project_settings(project_name, *args, **kwargs):
-    return _AyonSettingsCache.get_value_by_project(project_name)
+def get_project_settings(project_name, *args, read_only=False, **kwargs):
+    return _AyonSettingsCache.get_value_by_project(project_name, read_only)
 
 
 def get_general_environments(studio_settings=None):
@@ -173,7 +440,7 @@ def get_general_environments(studio_settings=None):
 
     """
     if studio_settings is None:
-        studio_settings = get_ayon_settings()
+        studio_settings = get_ayon_settings(read_only=True)
     return json.loads(studio_settings["core"]["environments"])
 
 
@@ -189,7 +456,7 @@ def get_project_environments(project_name, project_settings=None):
 
     """
     if project_settings is None:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
     return json.loads(
         project_settings["core"]["project_environments"]
     )
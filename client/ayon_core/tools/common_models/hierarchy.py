@@ -215,15 +215,88 @@ def _get_folder_item_from_entity(entity):
     )
 
 
+class _ProjectTasksIndex:
+    """Task items of whole project indexed by folder id.
+
+    Time of last update of each task is stored so the index can be updated
+    only with tasks that changed.
+    """
+
+    def __init__(self):
+        self._task_items_by_id = {}
+        self._updated_at_by_id = {}
+        self._task_items_by_folder_id = {}
+
+    @property
+    def is_empty(self):
+        return not self._task_items_by_id
+
+    def get_task_items(self, folder_id):
+        return list(self._task_items_by_folder_id.get(folder_id, []))
+
+    def get_changed_task_ids(self, updated_at_by_id):
+        """Get ids of tasks that are new or changed.
+
+        Args:
+            updated_at_by_id (dict[str, str]): Time of last update by task id
+                from server.
+
+        Returns:
+            set[str]: Task ids.
+        """
+
+        return {
+            task_id
+            for task_id, updated_at in updated_at_by_id.items()
+            if self._updated_at_by_id.get(task_id) != updated_at
+        }
+
+    def update(self, tasks, task_ids=None):
+        """Update index with task entities.
+
+        Args:
+            tasks (Iterable[dict[str, Any]]): Task entities that changed.
+            task_ids (Optional[Iterable[str]]): All task ids in project.
+                Tasks that are not in the ids are removed from index.
+        """
+
+        if task_ids is not None:
+            task_ids = set(task_ids)
+            for task_id in set(self._task_items_by_id) - task_ids:
+                self._task_items_by_id.pop(task_id)
+                self._updated_at_by_id.pop(task_id)
+
+        for task in tasks:
+            task_id = task["id"]
+            self._updated_at_by_id[task_id] = task["updatedAt"]
+            self._task_items_by_id[task_id] = (
+                _get_task_items_from_tasks([task])[0]
+            )
+
+        task_items_by_folder_id = collections.defaultdict(list)
+        for task_item in self._task_items_by_id.values():
+            task_items_by_folder_id[task_item.parent_id].append(task_item)
+        self._task_items_by_folder_id = dict(task_items_by_folder_id)
+
+
 class HierarchyModel(object):
     """Model for project hierarchy items.
 
     Hierarchy items are folders and tasks. Folders can have as parent another
     folder or project. Tasks can have as parent only folder.
+
+    Tasks are queried per folder by default. With 'index_project_tasks' are
+    all tasks of a project queried at once and then only changed tasks are
+    queried when cache is outdated.
+
+    Args:
+        controller (AbstractHierarchyController): Controller.
+        index_project_tasks (Optional[bool]): Query all tasks of project
+            at once.
     """
     lifetime = 60  # A minute
 
-    def __init__(self, controller):
+    def __init__(self, controller, index_project_tasks=False):
         self._folders_items = NestedCacheItem(
             levels=1, default_factory=dict, lifetime=self.lifetime)
         self._folders_by_id = NestedCacheItem(
@@ -233,9 +306,16 @@ class HierarchyModel(object):
             levels=2, default_factory=dict, lifetime=self.lifetime)
         self._tasks_by_id = NestedCacheItem(
             levels=2, default_factory=dict, lifetime=self.lifetime)
+        self._project_tasks_index = NestedCacheItem(
+            levels=1,
+            default_factory=_ProjectTasksIndex,
+            lifetime=self.lifetime
+        )
 
         self._folders_refreshing = set()
         self._tasks_refreshing = set()
+        self._project_tasks_refreshing = set()
+        self._index_project_tasks = index_project_tasks
         self._controller = controller
 
     def reset(self):
@@ -244,6 +324,7 @@ class HierarchyModel(object):
 
         self._task_items.reset()
         self._tasks_by_id.reset()
+        self._project_tasks_index.reset()
 
     def refresh_project(self, project_name):
         """Force to refresh folder items for a project.
@@ -403,11 +484,68 @@ class HierarchyModel(object):
         if not project_name or not folder_id:
             return []
 
+        if self._index_project_tasks:
+            tasks_index = self._get_project_tasks_index(
+                project_name, folder_id, sender
+            )
+            return tasks_index.get_task_items(folder_id)
+
         task_cache = self._task_items[project_name][folder_id]
         if not task_cache.is_valid:
             self._refresh_tasks_cache(project_name, folder_id, sender)
         return task_cache.get_data()
 
+    def get_task_items_by_folder_ids(self, project_name, folder_ids, sender):
+        """Get task items for multiple folders.
+
+        Tasks of folders that are not cached are queried at once.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            sender (Union[str, None]): Who requested the task items.
+
+        Returns:
+            dict[str, list[TaskItem]]: Task items by folder id.
+        """
+
+        folder_ids = {folder_id for folder_id in folder_ids if folder_id}
+        if not project_name or not folder_ids:
+            return {}
+
+        if self._index_project_tasks:
+            tasks_index = self._get_project_tasks_index(
+                project_name, None, sender
+            )
+            return {
+                folder_id: tasks_index.get_task_items(folder_id)
+                for folder_id in folder_ids
+            }
+
+        project_cache = self._task_items[project_name]
+        folder_ids_to_query = {
+            folder_id
+            for folder_id in folder_ids
+            if not project_cache[folder_id].is_valid
+        }
+        if folder_ids_to_query:
+            task_items_by_folder_id = {
+                folder_id: []
+                for folder_id in folder_ids_to_query
+            }
+            for task_item in self._query_tasks_by_folder_ids(
+                project_name, folder_ids_to_query
+            ):
+                task_items_by_folder_id[task_item.parent_id].append(task_item)
+
+            for folder_id, task_items in task_items_by_folder_id.items():
+                project_cache[folder_id] = task_items
+
+        return {
+            folder_id: project_cache[folder_id].get_data()
+            for folder_id in folder_ids
+        }
+
     def get_folder_entities(self, project_name, folder_ids):
         """Get folder entities by ids.
 
@@ -566,9 +704,56 @@ class HierarchyModel(object):
             self._task_items[project_name][folder_id] = task_items
 
     def _query_tasks(self, project_name, folder_id):
+        return self._query_tasks_by_folder_ids(project_name, [folder_id])
+
+    def _query_tasks_by_folder_ids(self, project_name, folder_ids):
         tasks = list(ayon_api.get_tasks(
             project_name,
-            folder_ids=[folder_id],
+            folder_ids=folder_ids,
             fields={"id", "name", "label", "folderId", "type"}
         ))
         return _get_task_items_from_tasks(tasks)
+
+    def _get_project_tasks_index(self, project_name, folder_id, sender):
+        cache = self._project_tasks_index[project_name]
+        if not cache.is_valid:
+            self._refresh_project_tasks_index(project_name, folder_id, sender)
+        return cache.get_data()
+
+    def _refresh_project_tasks_index(self, project_name, folder_id, sender):
+        if project_name in self._project_tasks_refreshing:
+            return
+
+        cache = self._project_tasks_index[project_name]
+        tasks_index = cache.get_data()
+        fields = {"id", "name", "label", "folderId", "type", "updatedAt"}
+        self._project_tasks_refreshing.add(project_name)
+        try:
+            with self._task_refresh_event_manager(
+                project_name, folder_id, sender
+            ):
+                if tasks_index.is_empty:
+                    tasks_index.update(
+                        ayon_api.get_tasks(project_name, fields=fields)
+                    )
+                else:
+                    # Query only time of last update and query full data
+                    #   only for changed tasks
+                    updated_at_by_id = {
+                        task["id"]: task["updatedAt"]
+                        for task in ayon_api.get_tasks(
+                            project_name, fields={"id", "updatedAt"}
+                        )
+                    }
+                    changed_ids = tasks_index.get_changed_task_ids(
+                        updated_at_by_id
+                    )
+                    tasks = []
+                    if changed_ids:
+                        tasks = ayon_api.get_tasks(
+                            project_name, task_ids=changed_ids, fields=fields
+                        )
+                    tasks_index.update(tasks, updated_at_by_id.keys())
+                cache.update_data(tasks_index)
+        finally:
+            self._project_tasks_refreshing.discard(project_name)
@@ -17,7 +17,9 @@ class BaseLauncherController(
 
         self._selection_model = LauncherSelectionModel(self)
         self._projects_model = ProjectsModel(self)
-        self._hierarchy_model = HierarchyModel(self)
+        self._hierarchy_model = HierarchyModel(
+            self, index_project_tasks=True
+        )
         self._actions_model = ActionsModel(self)
 
     @property
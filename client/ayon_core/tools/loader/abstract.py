@@ -554,6 +554,39 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def iter_product_items(self, project_name, folder_ids):
+        """Product items for folder ids in pages.
+
+        Products are yielded in pages as they're received from server
+            and the iteration can be done in a worker thread. The method
+            itself must be called in main thread. Refresh events are not
+            triggered.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+
+        Returns:
+            Iterator[list[ProductItem]]: Pages of product items.
+        """
+
+        pass
+
+    @abstractmethod
+    def prefetch_neighbour_product_items(self, project_name, folder_ids):
+        """Prefetch product items of folders next to passed folders.
+
+        Product items and thumbnails of sibling folders are cached
+            in background, so they're available once user selects them.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Selected folder ids.
+        """
+
+        pass
+
     @abstractmethod
     def get_product_item(self, project_name, product_id):
         """Receive single product item.
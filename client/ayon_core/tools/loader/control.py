@@ -1,5 +1,6 @@
 import logging
 import uuid
+import collections
 
 import ayon_api
 
@@ -95,6 +96,10 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         host (Optional[AbstractHost]): Host object. Defaults to None.
     """
 
+    # Number of sibling folders on each side of selected folder which
+    #   products are prefetched
+    prefetch_neighbours_count = 2
+
     def __init__(self, host=None):
         self._log = None
         self._host = host
@@ -192,6 +197,49 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         return self._products_model.get_product_items(
             project_name, folder_ids, sender)
 
+    def iter_product_items(self, project_name, folder_ids):
+        # Host and models are not thread safe, get data needed for product
+        #   items in this thread
+        loaded_product_ids = self.get_loaded_product_ids()
+        folder_items = self.get_folder_items(project_name)
+        product_type_items = self.get_product_type_items(project_name)
+        return self._products_model.iter_product_items(
+            project_name,
+            folder_ids,
+            loaded_product_ids,
+            folder_items,
+            product_type_items,
+        )
+
+    def prefetch_neighbour_product_items(self, project_name, folder_ids):
+        if not project_name or not folder_ids:
+            return
+
+        folder_items = self.get_folder_items(project_name)
+        folder_ids_by_parent_id = collections.defaultdict(list)
+        for folder_item in sorted(
+            folder_items.values(), key=lambda item: item.label.lower()
+        ):
+            folder_ids_by_parent_id[folder_item.parent_id].append(
+                folder_item.entity_id
+            )
+
+        neighbour_ids = set()
+        for folder_id in folder_ids:
+            folder_item = folder_items.get(folder_id)
+            if folder_item is None:
+                continue
+            sibling_ids = folder_ids_by_parent_id[folder_item.parent_id]
+            idx = sibling_ids.index(folder_id)
+            start_idx = max(0, idx - self.prefetch_neighbours_count)
+            end_idx = idx + self.prefetch_neighbours_count + 1
+            neighbour_ids.update(sibling_ids[start_idx:end_idx])
+
+        neighbour_ids -= set(folder_ids)
+        self._products_model.prefetch_product_items(
+            project_name, neighbour_ids
+        )
+
     def get_product_item(self, project_name, product_id):
         return self._products_model.get_product_item(
             project_name, product_id
@@ -1,3 +1,5 @@
+import logging
+import threading
 import collections
 import contextlib
 
@@ -7,6 +9,7 @@ from ayon_api.operations import OperationsSession
 
 from ayon_core.lib import NestedCacheItem
 from ayon_core.style import get_default_entity_icon_color
+from ayon_core.pipeline.thumbnails import get_thumbnail_path
 from ayon_core.tools.loader.abstract import (
     ProductTypeItem,
     ProductItem,
@@ -15,6 +18,18 @@ from ayon_core.tools.loader.abstract import (
 )
 
 PRODUCTS_MODEL_SENDER = "products.model"
+# Maximum number of version ids used in one representations query
+REPRE_QUERY_CHUNK_SIZE = 500
+# Number of products in one page of product items
+PRODUCTS_PAGE_SIZE = 200
+# Maximum number of prefetched version thumbnails per folder
+PREFETCH_THUMBNAILS_LIMIT = 20
+
+
+def _chunk_ids(ids, chunk_size=REPRE_QUERY_CHUNK_SIZE):
+    ids = list(ids)
+    for idx in range(0, len(ids), chunk_size):
+        yield ids[idx:idx + chunk_size]
 
 
 def version_item_from_entity(version):
@@ -147,9 +162,19 @@ class ProductsModel:
     """
 
     lifetime = 60  # In seconds (minute by default)
+    # Maximum number of waiting prefetch requests
+    prefetch_queue_size = 4
 
     def __init__(self, controller):
         self._controller = controller
+        self._log = None
+
+        # Lock for cache changes because of prefetch in a thread
+        self._lock = threading.RLock()
+        self._prefetch_queue = collections.deque(
+            maxlen=self.prefetch_queue_size
+        )
+        self._prefetch_thread = None
 
         # Mapping helpers
         # NOTE - mapping must be cleaned up with cache cleanup
@@ -164,17 +189,28 @@ class ProductsModel:
             levels=2, default_factory=dict, lifetime=self.lifetime)
         self._repre_items_cache = NestedCacheItem(
             levels=2, default_factory=dict, lifetime=self.lifetime)
+        self._repre_count_cache = NestedCacheItem(
+            levels=2, default_factory=int, lifetime=self.lifetime)
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
 
     def reset(self):
         """Reset model with all cached data."""
 
-        self._product_item_by_id.clear()
-        self._version_item_by_id.clear()
-        self._product_folder_ids_mapping.clear()
+        with self._lock:
+            self._prefetch_queue.clear()
+            self._product_item_by_id.clear()
+            self._version_item_by_id.clear()
+            self._product_folder_ids_mapping.clear()
 
-        self._product_type_items_cache.reset()
-        self._product_items_cache.reset()
-        self._repre_items_cache.reset()
+            self._product_type_items_cache.reset()
+            self._product_items_cache.reset()
+            self._repre_items_cache.reset()
+            self._repre_count_cache.reset()
 
     def get_product_type_items(self, project_name):
         """Product type items for project.
@@ -234,6 +270,98 @@ class ProductsModel:
             output.extend(cache.get_data().values())
         return output
 
+    def iter_product_items(
+        self,
+        project_name,
+        folder_ids,
+        loaded_product_ids=None,
+        folder_items=None,
+        product_type_items=None,
+    ):
+        """Product items for project and folder ids in pages.
+
+        Cached product items are yielded as first page, products of folders
+            which are not cached are queried and yielded in pages of
+            'PRODUCTS_PAGE_SIZE' products as they're received from server.
+
+        Refresh events are not triggered so the method can be used from
+            a worker thread. In that case 'loaded_product_ids',
+            'folder_items' and 'product_type_items' must be passed, because
+            host and controller are not thread safe.
+
+        Args:
+            project_name (Union[str, None]): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            loaded_product_ids (Optional[set[str]]): Product ids loaded
+                in host.
+            folder_items (Optional[dict[str, FolderItem]]): Folder items
+                of project by id.
+            product_type_items (Optional[list[ProductTypeItem]]): Product
+                type items of project.
+
+        Yields:
+            list[ProductItem]: Page of product items.
+        """
+
+        if not project_name or not folder_ids:
+            return
+
+        with self._lock:
+            items_by_folder_id, folder_ids_to_update = (
+                self._product_items_cache[project_name].get_valid_data(
+                    folder_ids
+                )
+            )
+        output = []
+        for product_items in items_by_folder_id.values():
+            output.extend(product_items.values())
+        if output:
+            yield output
+
+        for product_items_by_id in self._iter_refreshed_product_items(
+            project_name,
+            folder_ids_to_update,
+            loaded_product_ids,
+            folder_items,
+            product_type_items,
+        ):
+            yield list(product_items_by_id.values())
+
+    def prefetch_product_items(self, project_name, folder_ids):
+        """Query product items of folders in background thread.
+
+        Product items and thumbnails of folders, which are likely to be
+            selected next, are cached before they're requested. Refresh
+            events are not triggered.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
+        if not project_name or not folder_ids:
+            return
+
+        # Host and controller are not thread safe, get all data needed
+        #   for product items in this thread
+        loaded_product_ids = self._controller.get_loaded_product_ids()
+        folder_items = self._controller.get_folder_items(project_name)
+        product_type_items = self.get_product_type_items(project_name)
+        with self._lock:
+            self._prefetch_queue.append((
+                project_name,
+                set(folder_ids),
+                loaded_product_ids,
+                folder_items,
+                product_type_items,
+            ))
+            if self._prefetch_thread is not None:
+                return
+            self._prefetch_thread = threading.Thread(
+                target=self._prefetch_worker, daemon=True
+            )
+            self._prefetch_thread.start()
+
     def get_product_item(self, project_name, product_id):
         """Get product item based on passed product id.
 
@@ -301,29 +429,30 @@ class ProductsModel:
         if not any((project_name, version_ids)):
             return output
 
-        invalid_version_ids = set()
         project_cache = self._repre_items_cache[project_name]
-        for version_id in version_ids:
-            version_cache = project_cache[version_id]
-            if version_cache.is_valid:
-                output.extend(version_cache.get_data().values())
-            else:
-                invalid_version_ids.add(version_id)
-
+        repre_items_by_version_id, invalid_version_ids = (
+            project_cache.get_valid_data(version_ids)
+        )
         if invalid_version_ids:
             self.refresh_representation_items(
                 project_name, invalid_version_ids, sender
             )
+            for version_id in invalid_version_ids:
+                version_cache = project_cache[version_id]
+                repre_items_by_version_id[version_id] = (
+                    version_cache.get_data()
+                )
 
-        for version_id in invalid_version_ids:
-            version_cache = project_cache[version_id]
-            output.extend(version_cache.get_data().values())
-
+        for repre_items in repre_items_by_version_id.values():
+            output.extend(repre_items.values())
         return output
 
     def get_versions_repre_count(self, project_name, version_ids, sender):
         """Get representation count for passed version ids.
 
+        Counts are taken from cached representation items if available,
+        otherwise only version ids of representations are queried.
+
         Args:
             project_name (str): Project name.
             version_ids (Iterable[str]): Version ids.
@@ -337,24 +466,26 @@ class ProductsModel:
         if not any((project_name, version_ids)):
             return output
 
-        invalid_version_ids = set()
-        project_cache = self._repre_items_cache[project_name]
-        for version_id in version_ids:
-            version_cache = project_cache[version_id]
-            if version_cache.is_valid:
-                output[version_id] = len(version_cache.get_data())
-            else:
-                invalid_version_ids.add(version_id)
-
-        if invalid_version_ids:
-            self.refresh_representation_items(
-                project_name, invalid_version_ids, sender
-            )
+        repre_items_by_version_id, missing_version_ids = (
+            self._repre_items_cache[project_name].get_valid_data(version_ids)
+        )
+        for version_id, repre_items in repre_items_by_version_id.items():
+            output[version_id] = len(repre_items)
 
-        for version_id in invalid_version_ids:
-            version_cache = project_cache[version_id]
-            output[version_id] = len(version_cache.get_data())
+        if not missing_version_ids:
+            return output
 
+        count_cache = self._repre_count_cache[project_name]
+        count_by_version_id, missing_version_ids = (
+            count_cache.get_valid_data(missing_version_ids)
+        )
+        output.update(count_by_version_id)
+        if missing_version_ids:
+            count_by_version_id = self._query_versions_repre_count(
+                project_name, missing_version_ids
+            )
+            count_cache.update_data_many(count_by_version_id)
+            output.update(count_by_version_id)
         return output
 
     def change_products_group(self, project_name, product_ids, group_name):
@@ -453,6 +584,7 @@ class ProductsModel:
         versions,
         folder_items=None,
         product_type_items=None,
+        loaded_product_ids=None,
     ):
         if folder_items is None:
             folder_items = self._controller.get_folder_items(project_name)
@@ -460,7 +592,8 @@ class ProductsModel:
         if product_type_items is None:
             product_type_items = self.get_product_type_items(project_name)
 
-        loaded_product_ids = self._controller.get_loaded_product_ids()
+        if loaded_product_ids is None:
+            loaded_product_ids = self._controller.get_loaded_product_ids()
 
         versions_by_product_id = collections.defaultdict(list)
         for version in versions:
@@ -597,44 +730,190 @@ class ProductsModel:
         if not project_name or not folder_ids:
             return
 
-        self._clear_product_version_items(project_name, folder_ids)
-
-        project_mapping = self._product_folder_ids_mapping[project_name]
-        product_item_by_id = self._product_item_by_id[project_name]
-        version_item_by_id = self._version_item_by_id[project_name]
-
-        for folder_id in folder_ids:
-            project_mapping[folder_id] = set()
-
         with self._product_refresh_event_manager(
             project_name, folder_ids, sender
         ):
+            for _ in self._iter_refreshed_product_items(
+                project_name, folder_ids
+            ):
+                pass
+
+    def _iter_refreshed_product_items(
+        self,
+        project_name,
+        folder_ids,
+        loaded_product_ids=None,
+        folder_items=None,
+        product_type_items=None,
+    ):
+        """Query product items in pages and store them in cache.
+
+        Product items are stored to cache once all pages are received.
+
+        Args:
+            project_name (str): Name of project.
+            folder_ids (Iterable[str]): Folder ids which are being refreshed.
+            loaded_product_ids (Optional[set[str]]): Product ids loaded
+                in host.
+            folder_items (Optional[dict[str, FolderItem]]): Folder items
+                of project by id.
+            product_type_items (Optional[list[ProductTypeItem]]): Product
+                type items of project.
+
+        Yields:
+            dict[str, ProductItem]: Page of product items by id.
+        """
+
+        if not project_name or not folder_ids:
+            return
+
+        if folder_items is None:
             folder_items = self._controller.get_folder_items(project_name)
-            items_by_folder_id = {
-                folder_id: {}
-                for folder_id in folder_ids
-            }
-            product_items_by_id = self._query_product_items_by_ids(
+        if product_type_items is None:
+            product_type_items = self.get_product_type_items(project_name)
+        if loaded_product_ids is None:
+            loaded_product_ids = self._controller.get_loaded_product_ids()
+
+        items_by_folder_id = {
+            folder_id: {}
+            for folder_id in folder_ids
+        }
+        # Add 'status' to fields -> fixed in ayon-python-api 1.0.4
+        version_fields = ayon_api.get_default_fields_for_type("version")
+        version_fields.add("status")
+
+        for products in self._iter_products_pages(project_name, folder_ids):
+            versions = ayon_api.get_versions(
                 project_name,
-                folder_ids=folder_ids,
-                folder_items=folder_items
+                product_ids={product["id"] for product in products},
+                fields=version_fields
+            )
+            product_items_by_id = self._create_product_items(
+                project_name,
+                products,
+                versions,
+                folder_items=folder_items,
+                product_type_items=product_type_items,
+                loaded_product_ids=loaded_product_ids,
             )
             for product_id, product_item in product_items_by_id.items():
-                folder_id = product_item.folder_id
                 items_by_folder_id[product_item.folder_id][product_id] = (
                     product_item
                 )
+            if product_items_by_id:
+                yield product_items_by_id
 
-                project_mapping[folder_id].add(product_id)
-                product_item_by_id[product_id] = product_item
-                for version_id, version_item in (
-                    product_item.version_items.items()
-                ):
-                    version_item_by_id[version_id] = version_item
+        self._store_product_items(project_name, items_by_folder_id)
+
+    def _iter_products_pages(self, project_name, folder_ids):
+        page = []
+        for product in ayon_api.get_products(
+            project_name, folder_ids=folder_ids
+        ):
+            page.append(product)
+            if len(page) == PRODUCTS_PAGE_SIZE:
+                yield page
+                page = []
+
+        if page:
+            yield page
+
+    def _store_product_items(self, project_name, items_by_folder_id):
+        """Store product items of folders in cache.
 
-            project_cache = self._product_items_cache[project_name]
+        Args:
+            project_name (str): Name of project.
+            items_by_folder_id (dict[str, dict[str, ProductItem]]): Product
+                items by id for each refreshed folder.
+        """
+
+        with self._lock:
+            self._clear_product_version_items(
+                project_name, items_by_folder_id.keys()
+            )
+
+            project_mapping = self._product_folder_ids_mapping[project_name]
+            product_item_by_id = self._product_item_by_id[project_name]
+            version_item_by_id = self._version_item_by_id[project_name]
             for folder_id, product_items in items_by_folder_id.items():
-                project_cache[folder_id].update_data(product_items)
+                project_mapping[folder_id] = set(product_items.keys())
+                for product_id, product_item in product_items.items():
+                    product_item_by_id[product_id] = product_item
+                    for version_id, version_item in (
+                        product_item.version_items.items()
+                    ):
+                        version_item_by_id[version_id] = version_item
+
+            self._product_items_cache[project_name].update_data_many(
+                items_by_folder_id
+            )
+
+    def _prefetch_worker(self):
+        while True:
+            with self._lock:
+                if not self._prefetch_queue:
+                    self._prefetch_thread = None
+                    return
+                (
+                    project_name,
+                    folder_ids,
+                    loaded_product_ids,
+                    folder_items,
+                    product_type_items,
+                ) = self._prefetch_queue.popleft()
+                _, folder_ids = (
+                    self._product_items_cache[project_name].get_valid_data(
+                        folder_ids
+                    )
+                )
+
+            if not folder_ids:
+                continue
+
+            try:
+                version_items = []
+                for product_items_by_id in self._iter_refreshed_product_items(
+                    project_name,
+                    folder_ids,
+                    loaded_product_ids,
+                    folder_items,
+                    product_type_items,
+                ):
+                    for product_item in product_items_by_id.values():
+                        if product_item.version_items:
+                            version_items.append(
+                                max(product_item.version_items.values())
+                            )
+                self._prefetch_thumbnails(
+                    project_name, folder_ids, version_items
+                )
+
+            except Exception:
+                self.log.debug(
+                    "Prefetch of product items failed.", exc_info=True
+                )
+
+    def _prefetch_thumbnails(self, project_name, folder_ids, version_items):
+        """Download thumbnails to disk cache.
+
+        Called from prefetch thread, so thumbnails are not received
+            using controller which caches them in memory.
+        """
+
+        thumbnail_ids = {
+            folder["thumbnailId"]
+            for folder in ayon_api.get_folders(
+                project_name,
+                folder_ids=folder_ids,
+                fields=["id", "thumbnailId"]
+            )
+        }
+        limit = PREFETCH_THUMBNAILS_LIMIT * len(folder_ids)
+        for version_item in version_items[:limit]:
+            thumbnail_ids.add(version_item.thumbnail_id)
+        thumbnail_ids.discard(None)
+        for thumbnail_id in thumbnail_ids:
+            get_thumbnail_path(project_name, thumbnail_id)
 
     @contextlib.contextmanager
     def _product_refresh_event_manager(
@@ -695,12 +974,28 @@ class ProductsModel:
             PRODUCTS_MODEL_SENDER
         )
 
+    def _query_versions_repre_count(self, project_name, version_ids):
+        count_by_version_id = {
+            version_id: 0
+            for version_id in version_ids
+        }
+        for chunk_ids in _chunk_ids(version_ids):
+            for representation in ayon_api.get_representations(
+                project_name,
+                version_ids=chunk_ids,
+                fields=["id", "versionId"]
+            ):
+                count_by_version_id[representation["versionId"]] += 1
+        return count_by_version_id
+
     def _refresh_representation_items(self, project_name, version_ids):
-        representations = list(ayon_api.get_representations(
-            project_name,
-            version_ids=version_ids,
-            fields=["id", "name", "versionId"]
-        ))
+        representations = []
+        for chunk_ids in _chunk_ids(version_ids):
+            representations.extend(ayon_api.get_representations(
+                project_name,
+                version_ids=chunk_ids,
+                fields=["id", "name", "versionId"]
+            ))
 
         version_items_by_id = self._get_version_items_by_id(
             project_name, version_ids
@@ -717,7 +1012,11 @@ class ProductsModel:
             "name": "fa.file-o",
             "color": get_default_entity_icon_color(),
         }
-        repre_items_by_version_id = collections.defaultdict(dict)
+        # Versions without representations are cached too
+        repre_items_by_version_id = {
+            version_id: {}
+            for version_id in version_ids
+        }
         for representation in representations:
             version_id = representation["versionId"]
             version_item = version_items_by_id.get(version_id)
@@ -736,7 +1035,10 @@ class ProductsModel:
             )
             repre_items_by_version_id[version_id][repre_id] = repre_item
 
-        project_cache = self._repre_items_cache[project_name]
-        for version_id, repre_items in repre_items_by_version_id.items():
-            version_cache = project_cache[version_id]
-            version_cache.update_data(repre_items)
+        self._repre_items_cache[project_name].update_data_many(
+            repre_items_by_version_id
+        )
+        self._repre_count_cache[project_name].update_data_many({
+            version_id: len(repre_items)
+            for version_id, repre_items in repre_items_by_version_id.items()
+        })
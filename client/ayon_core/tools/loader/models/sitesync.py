@@ -55,7 +55,7 @@ class SiteSyncModel:
             lifetime=self.status_lifetime
         )
 
-        manager = AddonsManager()
+        manager = AddonsManager(lazy=True)
         self._sitesync_addon = manager.get("sitesync")
 
     def reset(self):
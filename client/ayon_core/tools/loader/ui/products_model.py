@@ -1,3 +1,4 @@
+import uuid
 import collections
 
 import qtawesome
@@ -40,6 +41,65 @@ SYNC_ACTIVE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 29
 SYNC_REMOTE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 30
 
 
+class ProductItemsThread(QtCore.QThread):
+    """Thread receiving pages of product items.
+
+    Each page is emitted with 'page_received' signal as soon as it is
+    received. Iterator of pages must not use controller because it is
+    not thread safe.
+
+    Args:
+        thread_id (str): Thread id.
+        pages (Iterator[list[ProductItem]]): Pages of product items.
+    """
+
+    page_received = QtCore.Signal(str, object)
+    refresh_finished = QtCore.Signal(str)
+
+    def __init__(self, thread_id, pages):
+        super(ProductItemsThread, self).__init__()
+        self._id = thread_id
+        self._pages = pages
+        self._stopped = False
+        self._exception = None
+        self.finished.connect(self._on_finish_callback)
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def failed(self):
+        return self._exception is not None
+
+    def stop(self):
+        """Stop receiving of pages.
+
+        Thread finishes after page which is currently received.
+        """
+
+        self._stopped = True
+
+    def run(self):
+        try:
+            for product_items in self._pages:
+                if self._stopped:
+                    break
+                self.page_received.emit(self._id, product_items)
+
+        except Exception as exc:
+            self._exception = exc
+
+        finally:
+            # Make sure iterator is closed in this thread
+            close = getattr(self._pages, "close", None)
+            if close is not None:
+                close()
+
+    def _on_finish_callback(self):
+        self.refresh_finished.emit(self._id)
+
+
 class ProductsModel(QtGui.QStandardItemModel):
     refreshed = QtCore.Signal()
     version_changed = QtCore.Signal()
@@ -115,6 +175,11 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._items_by_id = {}
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
+        # Product items which are not merged by path
+        self._top_items_by_path = {}
+        # Product types of group and merged items
+        self._product_types_by_group_name = collections.defaultdict(set)
+        self._product_types_by_merged_path = collections.defaultdict(set)
 
         # product item objects (they have version information)
         self._product_items_by_id = {}
@@ -126,6 +191,11 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._last_project_name = None
         self._last_folder_ids = []
         self._last_project_statuses = {}
+        self._active_site_icon = None
+        self._remote_site_icon = None
+
+        self._refresh_threads = {}
+        self._current_refresh_thread = None
 
     def get_product_item_indexes(self):
         return [
@@ -267,6 +337,9 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._items_by_id = {}
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
+        self._top_items_by_path = {}
+        self._product_types_by_group_name.clear()
+        self._product_types_by_merged_path.clear()
         self._product_items_by_id = {}
         self._reset_merge_color = True
 
@@ -291,16 +364,20 @@ class ProductsModel(QtGui.QStandardItemModel):
             self._group_items_by_name[group_name] = model_item
         return model_item
 
-    def _get_merged_model_item(self, path, count, hex_color):
+    def _get_merged_model_item(self, path, product_name, count):
         model_item = self._merged_items_by_id.get(path)
         if model_item is None:
+            (merged_color_hex, merged_color_qt) = self._get_next_color()
+            merged_color = qtawesome.icon(
+                "fa.circle", color=merged_color_qt)
             model_item = QtGui.QStandardItem()
             model_item.setData(1, GROUP_TYPE_ROLE)
-            model_item.setData(hex_color, MERGED_COLOR_ROLE)
+            model_item.setData(merged_color_hex, MERGED_COLOR_ROLE)
+            model_item.setData(merged_color, QtCore.Qt.DecorationRole)
             model_item.setEditable(False)
             model_item.setColumnCount(self.columnCount())
             self._merged_items_by_id[path] = model_item
-        label = "{} ({})".format(path, count)
+        label = "{} ({})".format(product_name, count)
         model_item.setData(label, QtCore.Qt.DisplayRole)
         return model_item
 
@@ -409,11 +486,34 @@ class ProductsModel(QtGui.QStandardItemModel):
     def get_last_project_name(self):
         return self._last_project_name
 
+    def is_refreshing(self):
+        return self._current_refresh_thread is not None
+
     def refresh(self, project_name, folder_ids):
+        """Refresh product items of folders.
+
+        Product items are received in a thread and added to the model
+            by pages, 'refreshed' signal is emitted when all pages were
+            added.
+
+        Args:
+            project_name (Union[str, None]): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
         self._clear()
 
         self._last_project_name = project_name
         self._last_folder_ids = folder_ids
+
+        if self._current_refresh_thread is not None:
+            self._current_refresh_thread.stop()
+            self._current_refresh_thread = None
+
+        if not project_name or not folder_ids:
+            self.refreshed.emit()
+            return
+
         status_items = self._controller.get_project_status_items(project_name)
         self._last_project_statuses = {
             status_item.name: status_item
@@ -426,137 +526,206 @@ class ProductsModel(QtGui.QStandardItemModel):
         remote_site_icon_def = self._controller.get_remote_site_icon_def(
             project_name
         )
-        active_site_icon = get_qt_icon(active_site_icon_def)
-        remote_site_icon = get_qt_icon(remote_site_icon_def)
+        self._active_site_icon = get_qt_icon(active_site_icon_def)
+        self._remote_site_icon = get_qt_icon(remote_site_icon_def)
 
-        product_items = self._controller.get_product_items(
-            project_name,
-            folder_ids,
-            sender=PRODUCTS_MODEL_SENDER_NAME
+        thread = ProductItemsThread(
+            uuid.uuid4().hex,
+            self._controller.iter_product_items(project_name, folder_ids),
         )
-        product_items_by_id = {
-            product_item.product_id: product_item
-            for product_item in product_items
-        }
-        last_version_id_by_product_id = {}
+        self._current_refresh_thread = thread
+        self._refresh_threads[thread.id] = thread
+        thread.page_received.connect(self._on_page_received)
+        thread.refresh_finished.connect(self._on_refresh_thread_finished)
+        thread.start()
+
+    def _get_versions_data(self, project_name, product_items):
+        """Data of last versions of product items.
+
+        Args:
+            project_name (str): Project name.
+            product_items (list[ProductItem]): Product items.
+
+        Returns:
+            tuple[dict[str, int], dict[str, tuple[int, int]]]: Number
+                of representations and site sync availability by
+                version id.
+        """
+
+        version_ids = set()
         for product_item in product_items:
-            versions = list(product_item.version_items.values())
-            versions.sort()
-            last_version = versions[-1]
-            last_version_id_by_product_id[product_item.product_id] = (
-                last_version.version_id
-            )
+            last_version = max(product_item.version_items.values())
+            version_ids.add(last_version.version_id)
+
+        if not version_ids:
+            return {}, {}
 
-        version_ids = set(last_version_id_by_product_id.values())
-        repre_count_by_version_id = self._controller.get_versions_representation_count(
-            project_name, version_ids
+        repre_count_by_version_id = (
+            self._controller.get_versions_representation_count(
+                project_name, version_ids
+            )
         )
         sync_availability_by_version_id = (
             self._controller.get_version_sync_availability(
                 project_name, version_ids
             )
         )
+        return repre_count_by_version_id, sync_availability_by_version_id
 
-        # Prepare product groups
-        product_name_matches_by_group = collections.defaultdict(dict)
-        for product_item in product_items_by_id.values():
-            group_name = None
-            if self._grouping_enabled:
-                group_name = product_item.group_name
+    def _on_page_received(self, thread_id, page):
+        if (
+            self._current_refresh_thread is None
+            or thread_id != self._current_refresh_thread.id
+        ):
+            return
 
-            product_name = product_item.product_name
-            group = product_name_matches_by_group[group_name]
-            if product_name not in group:
-                group[product_name] = [product_item]
-                continue
-            group[product_name].append(product_item)
+        # Products without versions can't be shown
+        product_items = [
+            product_item
+            for product_item in page
+            if product_item.version_items
+        ]
+        # Controller is not thread safe, data of versions are received
+        #   on page receive in main thread
+        repre_count_by_version_id, sync_availability_by_version_id = (
+            self._get_versions_data(
+                self._last_project_name, product_items
+            )
+        )
+        self._add_product_items(
+            product_items,
+            repre_count_by_version_id,
+            sync_availability_by_version_id,
+        )
+
+    def _on_refresh_thread_finished(self, thread_id):
+        self._refresh_threads.pop(thread_id, None)
+        if (
+            self._current_refresh_thread is None
+            or thread_id != self._current_refresh_thread.id
+        ):
+            return
 
-        group_names = set(product_name_matches_by_group.keys())
+        self._current_refresh_thread = None
+        self.refreshed.emit()
+
+    def _add_product_items(
+        self,
+        product_items,
+        repre_count_by_version_id,
+        sync_availability_by_version_id,
+    ):
+        """Add page of product items to the model.
+
+        Product items with the same name (in the same group) are merged
+            under merged item, also with items added with previous pages.
+
+        Args:
+            product_items (list[ProductItem]): Product items to add.
+            repre_count_by_version_id (dict[str, int]): Number of
+                representations by version id.
+            sync_availability_by_version_id (dict[str, tuple[int, int]]):
+                Site sync availability by version id.
+        """
 
         root_item = self.invisibleRootItem()
-        new_root_items = []
-        merged_paths = set()
-        for group_name in group_names:
-            key_parts = []
-            if group_name:
-                key_parts.append(group_name)
+        # New child items by parent item (None is root item)
+        new_items_by_parent_id = collections.OrderedDict()
 
-            groups = product_name_matches_by_group[group_name]
-            merged_product_items = {}
-            top_items = []
-            group_product_types = set()
-            for product_name, product_items in groups.items():
-                group_product_types |= {p.product_type for p in product_items}
-                if len(product_items) == 1:
-                    top_items.append(product_items[0])
-                else:
-                    path = "/".join(key_parts + [product_name])
-                    merged_paths.add(path)
-                    merged_product_items[path] = (
-                        product_name,
-                        product_items,
-                    )
+        def _add_new_item(parent, item):
+            parent_id = id(parent)
+            if parent_id not in new_items_by_parent_id:
+                new_items_by_parent_id[parent_id] = (parent, [])
+            new_items_by_parent_id[parent_id][1].append(item)
+
+        changed_merged_paths = set()
+        for product_item in product_items:
+            group_name = None
+            if self._grouping_enabled:
+                group_name = product_item.group_name
 
+            key_parts = []
             parent_item = None
             if group_name:
+                key_parts.append(group_name)
+                is_new_group = group_name not in self._group_items_by_name
                 parent_item = self._get_group_model_item(group_name)
+                if is_new_group:
+                    _add_new_item(None, parent_item)
+                group_product_types = (
+                    self._product_types_by_group_name[group_name]
+                )
+                group_product_types.add(product_item.product_type)
                 parent_item.setData(
                     "|".join(group_product_types), PRODUCT_TYPE_ROLE)
 
-            new_items = []
-            if parent_item is not None and parent_item.row() < 0:
-                new_root_items.append(parent_item)
-
-            for product_item in top_items:
-                item = self._get_product_model_item(
-                    product_item,
-                    active_site_icon,
-                    remote_site_icon,
-                    repre_count_by_version_id,
-                    sync_availability_by_version_id,
-                )
-                new_items.append(item)
+            item = self._get_product_model_item(
+                product_item,
+                self._active_site_icon,
+                self._remote_site_icon,
+                repre_count_by_version_id,
+                sync_availability_by_version_id,
+            )
+
+            product_name = product_item.product_name
+            path = "/".join(key_parts + [product_name])
+            merged_item = self._merged_items_by_id.get(path)
+            if merged_item is None:
+                top_item = self._top_items_by_path.get(path)
+                if top_item is None:
+                    self._top_items_by_path[path] = item
+                    _add_new_item(parent_item, item)
+                    continue
+
+                # Second product with the same name, merge them
+                self._top_items_by_path.pop(path)
+                pending = new_items_by_parent_id.get(id(parent_item))
+                pending_items = pending[1] if pending else []
+                for idx, pending_item in enumerate(pending_items):
+                    if pending_item is top_item:
+                        pending_items.pop(idx)
+                        break
+                else:
+                    top_parent = top_item.parent() or root_item
+                    top_parent.takeRow(top_item.row())
 
-            for path_info in merged_product_items.values():
-                product_name, product_items = path_info
-                (merged_color_hex, merged_color_qt) = self._get_next_color()
-                merged_color = qtawesome.icon(
-                    "fa.circle", color=merged_color_qt)
                 merged_item = self._get_merged_model_item(
-                    product_name, len(product_items), merged_color_hex)
-                merged_item.setData(merged_color, QtCore.Qt.DecorationRole)
-                new_items.append(merged_item)
-
-                merged_product_types = set()
-                new_merged_items = []
-                for product_item in product_items:
-                    item = self._get_product_model_item(
-                        product_item,
-                        active_site_icon,
-                        remote_site_icon,
-                        repre_count_by_version_id,
-                        sync_availability_by_version_id,
-                    )
-                    new_merged_items.append(item)
-                    merged_product_types.add(product_item.product_type)
-
-                merged_item.setData(
-                    "|".join(merged_product_types), PRODUCT_TYPE_ROLE)
-                if new_merged_items:
-                    merged_item.appendRows(new_merged_items)
-
-            if not new_items:
-                continue
-
-            if parent_item is None:
-                new_root_items.extend(new_items)
+                    path, product_name, 0
+                )
+                _add_new_item(parent_item, merged_item)
+                _add_new_item(merged_item, top_item)
+                top_product_item = self._product_items_by_id[
+                    top_item.data(PRODUCT_ID_ROLE)
+                ]
+                self._product_types_by_merged_path[path].add(
+                    top_product_item.product_type
+                )
+
+            _add_new_item(merged_item, item)
+            changed_merged_paths.add((path, product_name))
+            merged_product_types = self._product_types_by_merged_path[path]
+            merged_product_types.add(product_item.product_type)
+            merged_item.setData(
+                "|".join(merged_product_types), PRODUCT_TYPE_ROLE)
+
+        # Update count of changed merged items
+        for path, product_name in changed_merged_paths:
+            merged_item = self._merged_items_by_id[path]
+            _, new_items = new_items_by_parent_id[id(merged_item)]
+            self._get_merged_model_item(
+                path, product_name, merged_item.rowCount() + len(new_items)
+            )
+
+        new_root_items = []
+        for parent, items in new_items_by_parent_id.values():
+            if parent is None:
+                new_root_items.extend(items)
             else:
-                parent_item.appendRows(new_items)
+                parent.appendRows(items)
 
         if new_root_items:
             root_item.appendRows(new_root_items)
 
-        self.refreshed.emit()
     # ---------------------------------
     #   This implementation does not call '_clear' at the start
     #       but is more complex and probably slower
@@ -413,6 +413,10 @@ class ProductsWidget(QtWidgets.QWidget):
         self._selected_folder_ids = event["folder_ids"]
         self._refresh_model()
         self._update_folders_label_visible()
+        # Prepare products of neighbour folders in background
+        self._controller.prefetch_neighbour_product_items(
+            project_name, self._selected_folder_ids
+        )
 
     def _update_folders_label_visible(self):
         folders_label_hidden = len(self._selected_folder_ids) <= 1
@@ -1724,10 +1724,21 @@ class PublisherController(BasePublisherController):
             folder_path: set()
             for folder_path in folder_paths
         }
-        project_name = self.project_name
-        for folder_item in folder_items.values():
-            task_items = self._hierarchy_model.get_task_items(
-                project_name, folder_item.entity_id, None
+        folder_items = [
+            folder_item
+            for folder_item in folder_items.values()
+            if folder_item is not None
+        ]
+        task_items_by_folder_id = (
+            self._hierarchy_model.get_task_items_by_folder_ids(
+                self.project_name,
+                {folder_item.entity_id for folder_item in folder_items},
+                None
+            )
+        )
+        for folder_item in folder_items:
+            task_items = task_items_by_folder_id.get(
+                folder_item.entity_id, []
             )
             output[folder_item.path] = {
                 task_item.name
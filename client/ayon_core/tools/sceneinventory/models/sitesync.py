@@ -126,7 +126,7 @@ class SiteSyncModel:
     def _cache_sitesync_addon(self):
         if self._sitesync_addon is not NOT_SET:
             return self._sitesync_addon
-        manager = AddonsManager()
+        manager = AddonsManager(lazy=True)
         sitesync_addon = manager.get("sitesync")
         sync_enabled = sitesync_addon is not None and sitesync_addon.enabled
         self._sitesync_addon = sitesync_addon
@@ -8,7 +8,7 @@ import qtawesome
 from ayon_core import style
 from ayon_core.pipeline import (
     HeroVersionType,
-    update_container,
+    update_containers,
     remove_container,
     discover_inventory_actions,
 )
@@ -913,15 +913,31 @@ class SceneInventoryView(QtWidgets.QTreeView):
             item_ids
         )
         try:
-            for item_id, item_version in zip(item_ids, versions):
-                container = containers_by_id[item_id]
-                try:
-                    update_container(container, item_version)
-                except AssertionError:
-                    log.warning("Update failed", exc_info=True)
+            update_results = update_containers(
+                [containers_by_id[item_id] for item_id in item_ids],
+                list(versions),
+                project_name=self._controller.get_current_project_name()
+            )
+            unexpected_error = None
+            for item_id, item_version, update_result in zip(
+                item_ids, versions, update_results
+            ):
+                error = update_result.error
+                if error is None:
+                    continue
+                log.warning(
+                    "Update failed",
+                    exc_info=(type(error), error, error.__traceback__)
+                )
+                if isinstance(error, AssertionError):
                     self._show_version_error_dialog(
                         item_version, [item_id]
                     )
+                elif unexpected_error is None:
+                    unexpected_error = error
+
+            if unexpected_error is not None:
+                raise unexpected_error
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
@@ -194,7 +194,7 @@ class BaseWorkfileController(
         return SelectionModel(self)
 
     def _create_hierarchy_model(self):
-        return HierarchyModel(self)
+        return HierarchyModel(self, index_project_tasks=True)
 
     @property
     def event_system(self):
@@ -495,6 +495,23 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    single_pass_encoding: bool = SettingsField(
+        False,
+        title="Single pass encoding",
+        description=(
+            "Encode outputs with same input by single ffmpeg process"
+            " so the input is decoded only once."
+        )
+    )
+    fuse_burnins: bool = SettingsField(
+        False,
+        title="Burnins in review encode",
+        description=(
+            "Outputs with \"burnin\" tag are encoded with burnins"
+            " by 'Extract burnins' so the output is encoded only once."
+            " Not used for inputs which are converted or have filled gaps."
+        )
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -737,6 +754,75 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+def _integrate_copy_backend_enum():
+    return [
+        {"value": "default", "label": "Default"},
+        {"value": "kernel", "label": "Kernel copy (Linux)"},
+    ]
+
+
+class IntegrateAssetModel(BaseSettingsModel):
+    _isGroup = True
+    transfer_max_workers: int = SettingsField(
+        1,
+        title="Parallel file transfers",
+        ge=1,
+        description=(
+            "Number of files transferred at the same time during"
+            " integration. Value 1 transfers files one by one."
+        )
+    )
+    transfer_use_processes: bool = SettingsField(
+        False,
+        title="Use processes for parallel transfers",
+        description=(
+            "Transfer files in separate processes instead of threads."
+        )
+    )
+    transfer_copy_backend: str = SettingsField(
+        "default",
+        title="Copy backend",
+        enum_resolver=_integrate_copy_backend_enum,
+        description=(
+            "Kernel copy uses reflinks, 'copy_file_range' or 'sendfile'"
+            " on Linux and falls back to default copy if not supported."
+        )
+    )
+    files_info_max_workers: int = SettingsField(
+        8,
+        title="Parallel files info collection",
+        ge=1,
+        description=(
+            "Number of directories scanned at the same time to collect"
+            " size and hash of integrated files."
+        )
+    )
+    delta_integrate: bool = SettingsField(
+        False,
+        title="Delta integrate",
+        description=(
+            "Hardlink files that did not change (same source file name,"
+            " modification time and size) from previous version instead"
+            " of copying them. Published files must be on a filesystem"
+            " which supports hardlinks."
+        )
+    )
+    batch_operations: bool = SettingsField(
+        False,
+        title="Batch server operations",
+        description=(
+            "Commit products, versions and representations of all"
+            " instances at once after all of them are integrated."
+        )
+    )
+    operations_chunk_size: int = SettingsField(
+        100,
+        title="Operations chunk size",
+        ge=1,
+        description="Maximum number of operations sent in one request."
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
@@ -828,6 +914,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -945,6 +1035,8 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractReview": {
         "enabled": True,
+        "single_pass_encoding": False,
+        "fuse_burnins": False,
         "profiles": [
             {
                 "product_types": [],
@@ -1120,6 +1212,15 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_max_workers": 1,
+        "transfer_use_processes": False,
+        "transfer_copy_backend": "default",
+        "files_info_max_workers": 8,
+        "delta_integrate": False,
+        "batch_operations": False,
+        "operations_chunk_size": 100
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
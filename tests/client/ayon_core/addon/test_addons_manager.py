@@ -0,0 +1,212 @@
+import os
+import sys
+import types
+import logging
+
+import pytest
+
+from ayon_core.addon import base
+from ayon_core.addon.base import AddonsManager, AYONAddon
+
+
+class _TestAddon(AYONAddon):
+    version = "1.0.0"
+    # Records of 'connect_with_addons' calls
+    connections = None
+
+    def initialize(self, settings):
+        self.connections.append((self.name, "initialize"))
+
+    def connect_with_addons(self, enabled_addons):
+        self.connections.append((
+            self.name,
+            sorted(addon.name for addon in enabled_addons)
+        ))
+
+
+def _create_addon_class(name, connections):
+    return type(
+        "{}Addon".format(name.capitalize()),
+        (_TestAddon, ),
+        {"name": name, "connections": connections}
+    )
+
+
+@pytest.fixture
+def clean_modules(monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    module_names = set(sys.modules)
+    yield
+    for module_name in set(sys.modules) - module_names:
+        sys.modules.pop(module_name)
+
+
+@pytest.fixture
+def addons_env(monkeypatch, tmp_path):
+    """Addon modules as they are after 'load_addons'.
+
+    Module 'manifest_addons' is known from discovery manifest and contains
+    'first' and 'second' addons. Module 'other_addons' is not in manifest
+    and contains 'other' addon.
+    """
+    connections = []
+    manifest_module = types.ModuleType("manifest_addons")
+    manifest_module.FirstAddon = _create_addon_class("first", connections)
+    manifest_module.SecondAddon = _create_addon_class("second", connections)
+    other_module = types.ModuleType("other_addons")
+    other_module.OtherAddon = _create_addon_class("other", connections)
+
+    openpype_modules = base._ModuleClass("openpype_modules")
+    openpype_modules["manifest_addons"] = manifest_module
+    openpype_modules["other_addons"] = other_module
+    monkeypatch.setitem(sys.modules, "openpype_modules", openpype_modules)
+
+    manifest = base._AddonsManifest(str(tmp_path / "manifest.json"))
+    manifest.set_entry(
+        "manifest",
+        "1.0.0",
+        str(tmp_path),
+        "manifest_addons",
+        module_path=str(tmp_path),
+    )
+    manifest.set_addon_classes(
+        "manifest_addons",
+        [("FirstAddon", "first"), ("SecondAddon", "second")]
+    )
+    monkeypatch.setattr(base._LoadCache, "manifest", manifest)
+
+    load_calls = []
+    monkeypatch.setattr(
+        base, "load_addons", lambda **kwargs: load_calls.append(kwargs)
+    )
+    return connections, load_calls
+
+
+def test_manager_connects_all_addons(addons_env):
+    connections, load_calls = addons_env
+
+    manager = AddonsManager(settings={})
+
+    assert load_calls == [{"lazy": False}]
+    all_names = ["first", "other", "second"]
+    assert sorted(manager.addons_by_name) == all_names
+    connected = [item for item in connections if item[1] != "initialize"]
+    assert sorted(connected) == [(name, all_names) for name in all_names]
+
+
+def test_lazy_manager_connects_lazy_addon(addons_env):
+    connections, load_calls = addons_env
+
+    manager = AddonsManager(settings={}, lazy=True)
+
+    assert load_calls == [{"lazy": True}]
+    # Only addon which is not in manifest is initialized
+    assert connections == [("other", "initialize")]
+
+    # Addon fetched first is connected with all addons
+    first_addon = manager.get_enabled_addon("first")
+    assert first_addon.name == "first"
+    all_names = ["first", "other", "second"]
+    connected = [item for item in connections if item[1] != "initialize"]
+    assert sorted(connected) == [(name, all_names) for name in all_names]
+    assert ("second", "initialize") in connections
+
+    # Addons are not connected again
+    connections_count = len(connections)
+    assert manager.get("second").name == "second"
+    assert sorted(manager.addons_by_name) == all_names
+    assert len(connections) == connections_count
+
+
+def test_lazy_addon_without_connection(addons_env):
+    connections, load_calls = addons_env
+
+    manager = AddonsManager(settings={}, initialize=False, lazy=True)
+    manager.initialize_addons()
+
+    # Addons are not connected, only requested addon is initialized
+    assert manager.get("first").name == "first"
+    assert connections == [
+        ("other", "initialize"),
+        ("first", "initialize"),
+    ]
+
+
+def _prepare_addon_dir(monkeypatch, tmp_path, module_name):
+    addon_dir = tmp_path / "test_addon_1.0.0"
+    module_dir = addon_dir / module_name
+    module_dir.mkdir(parents=True)
+    # Module creates marker file on import
+    (module_dir / "__init__.py").write_text(
+        "open({!r}, 'w').close()\n"
+        "VALUE = 1\n".format(str(tmp_path / "imported"))
+    )
+    monkeypatch.setenv("AYON_ADDONS_DIR", str(tmp_path))
+    monkeypatch.setattr(base, "_get_ayon_bundle_data", lambda: {})
+    monkeypatch.setattr(
+        base,
+        "_get_ayon_addons_information",
+        lambda bundle_info: [{"name": "test_addon", "version": "1.0.0"}]
+    )
+    manifest = base._AddonsManifest(str(tmp_path / "manifest.json"))
+    manifest.set_entry(
+        "test_addon",
+        "1.0.0",
+        str(addon_dir),
+        "test_addon",
+        module_name,
+        str(module_dir),
+    )
+    return manifest
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_addons_import_mode(monkeypatch, tmp_path, clean_modules, lazy):
+    module_name = "ayon_test_addon_{}".format("lazy" if lazy else "eager")
+    manifest = _prepare_addon_dir(monkeypatch, tmp_path, module_name)
+    openpype_modules = base._ModuleClass("test_openpype_modules")
+
+    base._load_ayon_addons(
+        openpype_modules,
+        "test_openpype_modules",
+        manifest,
+        lazy,
+        logging.getLogger("test"),
+    )
+
+    module = openpype_modules["test_addon"]
+    marker_path = tmp_path / "imported"
+    # Lazy module is executed on first access to any attribute
+    assert marker_path.exists() is not lazy
+
+    assert module.VALUE == 1
+    assert module.__name__ == module_name
+    assert marker_path.exists()
+
+
+def test_manifest_entry_invalidated_by_module_change(monkeypatch, tmp_path):
+    module_name = "ayon_test_addon_changed"
+    manifest = _prepare_addon_dir(monkeypatch, tmp_path, module_name)
+    addon_dir = str(tmp_path / "test_addon_1.0.0")
+    init_path = tmp_path / "test_addon_1.0.0" / module_name / "__init__.py"
+
+    assert manifest.get_entry("test_addon", "1.0.0", addon_dir) is not None
+
+    # Change of module file does not change mtime of addon directory
+    stat = init_path.stat()
+    init_path.write_text("VALUE = 2\n")
+    os.utime(init_path, (stat.st_atime, stat.st_mtime + 10))
+    assert manifest.get_entry("test_addon", "1.0.0", addon_dir) is None
+
+    # Added python file in module invalidates entry too
+    manifest.set_entry(
+        "test_addon",
+        "1.0.0",
+        addon_dir,
+        "test_addon",
+        module_name,
+        str(init_path.parent),
+    )
+    assert manifest.get_entry("test_addon", "1.0.0", addon_dir) is not None
+    (init_path.parent / "addon.py").write_text("VALUE = 3\n")
+    assert manifest.get_entry("test_addon", "1.0.0", addon_dir) is None
@@ -0,0 +1,57 @@
+import pytest
+
+from ayon_core.lib import cache as cache_module
+from ayon_core.lib.cache import NestedCacheItem
+
+
+def test_get_valid_data_does_not_create_items():
+    cache = NestedCacheItem(levels=2, default_factory=dict)
+    project_cache = cache["project"]
+    project_cache["a"] = {"id": "a"}
+
+    data, missing = project_cache.get_valid_data(["a", "b", "c"])
+
+    assert data == {"a": {"id": "a"}}
+    assert missing == {"b", "c"}
+    assert project_cache.cached_count() == 1
+
+
+def test_update_data_many():
+    cache = NestedCacheItem(levels=2, default_factory=int)
+    project_cache = cache["project"]
+
+    project_cache.update_data_many({"a": 1, "b": 0})
+
+    data, missing = project_cache.get_valid_data(["a", "b", "c"])
+    # Falsy values are valid data too
+    assert data == {"a": 1, "b": 0}
+    assert missing == {"c"}
+
+
+def test_outdated_items_are_missing(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    cache = NestedCacheItem(levels=1, default_factory=int, lifetime=10)
+    cache.update_data_many({"a": 1, "b": 2})
+
+    now += 5
+    cache.update_data_many({"b": 3})
+    now += 6
+    data, missing = cache.get_valid_data(["a", "b"])
+
+    assert data == {"b": 3}
+    assert missing == {"a"}
+
+    # Outdated items can be filled again
+    cache.update_data_many({"a": 4})
+    assert cache.get_valid_data(["a", "b"]) == ({"a": 4, "b": 3}, set())
+
+
+def test_many_methods_require_last_level():
+    cache = NestedCacheItem(levels=2)
+
+    with pytest.raises(AttributeError):
+        cache.get_valid_data(["a"])
+
+    with pytest.raises(AttributeError):
+        cache.update_data_many({"a": 1})
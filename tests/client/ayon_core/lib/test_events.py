@@ -0,0 +1,101 @@
+import gc
+
+from ayon_core.lib.events import EventSystem, weakref_partial
+
+
+class _Listener(object):
+    def __init__(self, name, output):
+        self._name = name
+        self._output = output
+
+    def on_event(self, event):
+        self._output.append((self._name, event.topic))
+
+
+def test_callbacks_order():
+    output = []
+    event_system = EventSystem()
+    listeners = [
+        _Listener("late", output),
+        _Listener("first", output),
+        _Listener("wildcard", output),
+        _Listener("all", output),
+    ]
+    event_system.add_callback("a.b", listeners[0].on_event, order=200)
+    event_system.add_callback("a.b", listeners[1].on_event)
+    event_system.add_callback("a.*", listeners[2].on_event)
+    event_system.add_callback("*", listeners[3].on_event, order=0)
+
+    event_system.emit("a.b", {}, "test")
+    assert [item[0] for item in output] == [
+        "all", "first", "wildcard", "late"
+    ]
+
+    output[:] = []
+    event_system.emit("b.c", {}, "test")
+    assert output == [("all", "b.c")]
+
+
+def test_order_change_and_added_callbacks():
+    output = []
+    event_system = EventSystem()
+    first = _Listener("first", output)
+    second = _Listener("second", output)
+    callback = event_system.add_callback("topic", first.on_event)
+    event_system.emit("topic", {}, "test")
+
+    # Cached callbacks are updated after order change and registration
+    callback.order = 300
+    event_system.add_callback("topic", second.on_event)
+    output[:] = []
+    event_system.emit("topic", {}, "test")
+    assert [item[0] for item in output] == ["second", "first"]
+
+
+def test_destroyed_callbacks_are_removed():
+    output = []
+    event_system = EventSystem()
+    listener = _Listener("listener", output)
+    other = _Listener("other", output)
+    event_system.add_callback("topic", listener.on_event)
+    event_system.add_callback("topic.*", weakref_partial(listener.on_event))
+    event_system.add_callback("other", other.on_event)
+    event_system.emit("topic", {}, "test")
+    assert len(event_system._registered_callbacks) == 3
+
+    del listener
+    gc.collect()
+
+    # Emitting of other topic removes destroyed callbacks on cache miss
+    event_system.emit("topic.sub", {}, "test")
+    event_system.emit("topic", {}, "test")
+    assert event_system._registered_callbacks[0].topic == "other"
+    assert len(event_system._registered_callbacks) == 1
+
+
+def test_deregistered_callback_is_not_called():
+    output = []
+    event_system = EventSystem()
+    listener = _Listener("listener", output)
+    callback = event_system.add_callback("topic", listener.on_event)
+    event_system.emit("topic", {}, "test")
+
+    callback.deregister()
+    event_system.emit("topic", {}, "test")
+    assert len(output) == 1
+    assert not event_system._registered_callbacks
+
+
+def test_topic_cache_is_bounded():
+    output = []
+    event_system = EventSystem()
+    event_system.topic_cache_size = 10
+    listener = _Listener("listener", output)
+    event_system.add_callback("topic.*", listener.on_event)
+
+    for idx in range(100):
+        event_system.emit("topic.{}".format(idx), {}, "test")
+
+    assert len(output) == 100
+    assert len(event_system._callbacks_by_topic) == 10
+    assert "topic.99" in event_system._callbacks_by_topic
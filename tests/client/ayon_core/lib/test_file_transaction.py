@@ -0,0 +1,234 @@
+import os
+import sys
+import errno
+
+import pytest
+
+from ayon_core.lib import file_transaction
+from ayon_core.lib.file_transaction import FileTransaction, kernel_copyfile
+
+
+def _create_files(root, count):
+    paths = []
+    for idx in range(count):
+        path = os.path.join(root, "file_{}.txt".format(idx))
+        with open(path, "w") as stream:
+            stream.write("x" * (idx + 1))
+        paths.append(path)
+    return paths
+
+
+def _read(path):
+    with open(path, "r") as stream:
+        return stream.read()
+
+
+@pytest.mark.parametrize(
+    "max_workers, use_processes",
+    [(1, False), (4, False), (4, True)]
+)
+def test_transfer_files(tmp_path, max_workers, use_processes):
+    src_paths = _create_files(str(tmp_path), 10)
+    dst_root = tmp_path / "dst" / "nested"
+    progress = []
+
+    transaction = FileTransaction(
+        max_workers=max_workers,
+        use_processes=use_processes,
+        progress_callback=lambda *args: progress.append(args),
+    )
+    for src_path in src_paths:
+        transaction.add(
+            src_path, str(dst_root / os.path.basename(src_path))
+        )
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(src_paths)
+    for src_path in src_paths:
+        dst_path = str(dst_root / os.path.basename(src_path))
+        assert _read(dst_path) == _read(src_path)
+
+    # Progress is reported for each file with total count and bytes
+    assert len(progress) == len(src_paths)
+    processed = [item[1] for item in progress]
+    assert processed == list(range(1, len(src_paths) + 1))
+    assert all(item[2] == len(src_paths) for item in progress)
+    assert progress[-1][3] == sum(range(1, len(src_paths) + 1))
+
+
+def test_progress_callback_error_does_not_fail(tmp_path):
+    src_paths = _create_files(str(tmp_path), 2)
+
+    def callback(*args):
+        raise RuntimeError("Callback failed")
+
+    transaction = FileTransaction(max_workers=2, progress_callback=callback)
+    for src_path in src_paths:
+        transaction.add(src_path, src_path + ".dst")
+    transaction.process()
+
+    assert len(transaction.transferred) == 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_rollback_partial_failure(tmp_path, max_workers):
+    src_paths = _create_files(str(tmp_path), 6)
+    existing_path = str(tmp_path / "existing.txt")
+    with open(existing_path, "w") as stream:
+        stream.write("original")
+
+    transaction = FileTransaction(max_workers=max_workers)
+    dst_paths = []
+    for src_path in src_paths:
+        dst_path = str(tmp_path / "dst" / os.path.basename(src_path))
+        dst_paths.append(dst_path)
+        transaction.add(src_path, dst_path)
+    transaction.add(src_paths[0], existing_path)
+    transaction.add(
+        str(tmp_path / "missing.txt"), str(tmp_path / "dst" / "missing.txt")
+    )
+
+    with pytest.raises(OSError):
+        transaction.process()
+
+    # Only successfully transferred files are marked as transferred
+    for path in transaction.transferred:
+        assert os.path.exists(path)
+    assert str(tmp_path / "dst" / "missing.txt") not in (
+        transaction.transferred
+    )
+    assert transaction.backups == [existing_path + ".bak"]
+
+    transaction.rollback()
+
+    for dst_path in dst_paths:
+        assert not os.path.exists(dst_path)
+    assert _read(existing_path) == "original"
+    assert not os.path.exists(existing_path + ".bak")
+
+
+def test_hardlink_mode(tmp_path):
+    src_path = _create_files(str(tmp_path), 1)[0]
+    dst_path = str(tmp_path / "dst" / "linked.txt")
+
+    transaction = FileTransaction()
+    transaction.add(src_path, dst_path, mode=FileTransaction.MODE_HARDLINK)
+    transaction.process()
+
+    assert os.stat(src_path).st_ino == os.stat(dst_path).st_ino
+
+
+@pytest.fixture
+def kernel_copy_env(monkeypatch, tmp_path):
+    """Kernel copy methods which record calls and raise given errors.
+
+    Methods which have error set write partial data to destination
+    before they raise it.
+    """
+    if not sys.platform.startswith("linux"):
+        pytest.skip("Kernel copy is available only on Linux")
+
+    import fcntl
+
+    monkeypatch.setattr(file_transaction, "_unsupported_kernel_copies", {})
+    calls = []
+    errors = {}
+
+    def _wrap(name, func, dst_fd_index):
+        def _method(*args):
+            # Method is called in loop until whole file is copied
+            if not calls or calls[-1] != name:
+                calls.append(name)
+            error = errors.get(name)
+            if error is None:
+                return func(*args)
+            os.write(args[dst_fd_index], b"partial data of failed copy")
+            raise OSError(error, os.strerror(error))
+        return _method
+
+    def _ioctl(dst_fd, request, src_fd):
+        calls.append("reflink")
+        error = errors.get("reflink", errno.EOPNOTSUPP)
+        os.write(dst_fd, b"partial data of failed copy")
+        raise OSError(error, os.strerror(error))
+
+    monkeypatch.setattr(fcntl, "ioctl", _ioctl)
+    monkeypatch.setattr(
+        os,
+        "copy_file_range",
+        _wrap("copy_file_range", os.copy_file_range, 1),
+        raising=False
+    )
+    monkeypatch.setattr(os, "sendfile", _wrap("sendfile", os.sendfile, 0))
+
+    shutil_copyfile = file_transaction.shutil.copyfile
+
+    def _copyfile(src, dst):
+        calls.append("copyfile")
+        # 'shutil.copyfile' uses 'sendfile' on Linux
+        errors.clear()
+        shutil_copyfile(src, dst)
+        del calls[calls.index("copyfile") + 1:]
+
+    monkeypatch.setattr(file_transaction.shutil, "copyfile", _copyfile)
+
+    src = tmp_path / "src.txt"
+    src.write_bytes(b"source")
+    return str(src), str(tmp_path / "dst.txt"), calls, errors
+
+
+def test_kernel_copy_fallbacks(kernel_copy_env):
+    src, dst, calls, errors = kernel_copy_env
+    errors["copy_file_range"] = errno.EXDEV
+    errors["sendfile"] = errno.EOPNOTSUPP
+
+    kernel_copyfile(src, dst)
+
+    assert calls == ["reflink", "copy_file_range", "sendfile", "copyfile"]
+    # Data written by failed attempts are not left in destination
+    with open(dst, "rb") as stream:
+        assert stream.read() == b"source"
+
+
+def test_kernel_copy_truncates_failed_attempt(kernel_copy_env):
+    src, dst, calls, errors = kernel_copy_env
+    errors["copy_file_range"] = errno.EXDEV
+
+    kernel_copyfile(src, dst)
+
+    assert calls == ["reflink", "copy_file_range", "sendfile"]
+    with open(dst, "rb") as stream:
+        assert stream.read() == b"source"
+
+
+def test_kernel_copy_unsupported_memo(kernel_copy_env, tmp_path):
+    src, dst, calls, errors = kernel_copy_env
+    errors["copy_file_range"] = errno.EXDEV
+
+    kernel_copyfile(src, dst)
+    device = os.stat(src).st_dev
+    assert file_transaction._unsupported_kernel_copies == {
+        (device, device): {"reflink", "copy_file_range"}
+    }
+
+    # Unsupported methods are not tried again between the same devices
+    del calls[:]
+    other_dst = str(tmp_path / "other_dst.txt")
+    kernel_copyfile(src, other_dst)
+    assert calls == ["sendfile"]
+    with open(other_dst, "rb") as stream:
+        assert stream.read() == b"source"
+
+
+def test_kernel_copy_reraises_other_errors(kernel_copy_env):
+    src, dst, calls, errors = kernel_copy_env
+    errors["reflink"] = errno.EBADF
+
+    with pytest.raises(OSError) as exc_info:
+        kernel_copyfile(src, dst)
+
+    assert exc_info.value.errno == errno.EBADF
+    assert calls == ["reflink"]
+    # Method is not remembered as unsupported
+    assert not any(file_transaction._unsupported_kernel_copies.values())
@@ -0,0 +1,149 @@
+import os
+
+import pytest
+
+from ayon_core.lib.transcoding import MediaProbeCache
+
+
+class _Probe(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"streams": [{"width": 1920, "call": self.calls}]}
+
+
+def _write(path, content):
+    with open(path, "w") as stream:
+        stream.write(content)
+    return path
+
+
+def test_cache_hit_returns_copy(tmp_path):
+    path = _write(str(tmp_path / "input.mov"), "data")
+    cache = MediaProbeCache()
+    probe = _Probe()
+
+    first = cache.get_value("ffprobe", path, (), probe)
+    first["streams"][0]["width"] = 0
+    second = cache.get_value("ffprobe", path, (), probe)
+
+    assert probe.calls == 1
+    assert second["streams"][0]["width"] == 1920
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_cache_key_contains_args_and_file_state(tmp_path):
+    path = _write(str(tmp_path / "input.exr"), "data")
+    cache = MediaProbeCache()
+    probe = _Probe()
+
+    cache.get_value("oiiotool", path, (False, ), probe)
+    cache.get_value("oiiotool", path, (True, ), probe)
+    assert probe.calls == 2
+
+    # Changed file is probed again
+    _write(path, "changed data")
+    stat_result = os.stat(path)
+    os.utime(path, (stat_result.st_atime, stat_result.st_mtime + 10))
+    cache.get_value("oiiotool", path, (False, ), probe)
+    assert probe.calls == 3
+
+
+def test_missing_file_is_not_cached(tmp_path):
+    path = str(tmp_path / "missing.mov")
+    cache = MediaProbeCache()
+    probe = _Probe()
+
+    cache.get_value("ffprobe", path, (), probe)
+    cache.get_value("ffprobe", path, (), probe)
+
+    assert probe.calls == 2
+    assert cache.get_stats()["uncached"] == 2
+
+
+def test_probe_error_is_not_cached(tmp_path):
+    path = _write(str(tmp_path / "input.mov"), "data")
+    cache = MediaProbeCache()
+
+    def failing_probe():
+        raise RuntimeError("Probe failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get_value("ffprobe", path, (), failing_probe)
+
+    probe = _Probe()
+    cache.get_value("ffprobe", path, (), probe)
+    assert probe.calls == 1
+    assert cache.get_stats()["items"] == 1
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    paths = [
+        _write(str(tmp_path / "input_{}.mov".format(idx)), "data")
+        for idx in range(3)
+    ]
+    cache = MediaProbeCache(max_items=2)
+    probe = _Probe()
+
+    cache.get_value("ffprobe", paths[0], (), probe)
+    cache.get_value("ffprobe", paths[1], (), probe)
+    # Use first item so the second is the least recently used
+    cache.get_value("ffprobe", paths[0], (), probe)
+    cache.get_value("ffprobe", paths[2], (), probe)
+    assert probe.calls == 3
+
+    cache.get_value("ffprobe", paths[0], (), probe)
+    assert probe.calls == 3
+    cache.get_value("ffprobe", paths[1], (), probe)
+    assert probe.calls == 4
+    assert cache.get_stats()["evictions"] == 2
+
+
+def test_persistent_dir_resume(tmp_path):
+    path = _write(str(tmp_path / "input.mov"), "data")
+    persistent_dir = str(tmp_path / "cache")
+    probe = _Probe()
+
+    MediaProbeCache(persistent_dir=persistent_dir).get_value(
+        "ffprobe", path, (), probe
+    )
+
+    # New cache (e.g. other process) loads the result from disk
+    cache = MediaProbeCache(persistent_dir=persistent_dir)
+    value = cache.get_value("ffprobe", path, (), probe)
+    assert probe.calls == 1
+    assert value["streams"][0]["call"] == 1
+    assert cache.get_stats()["disk_hits"] == 1
+
+
+def test_persistent_dir_invalid_file(tmp_path):
+    path = _write(str(tmp_path / "input.mov"), "data")
+    persistent_dir = tmp_path / "cache"
+    probe = _Probe()
+
+    MediaProbeCache(persistent_dir=str(persistent_dir)).get_value(
+        "ffprobe", path, (), probe
+    )
+    for filename in os.listdir(str(persistent_dir)):
+        _write(str(persistent_dir / filename), "{invalid json")
+
+    # Invalid stored result is ignored and file is probed again
+    cache = MediaProbeCache(persistent_dir=str(persistent_dir))
+    value = cache.get_value("ffprobe", path, (), probe)
+    assert probe.calls == 2
+    assert value["streams"][0]["call"] == 2
+
+
+def test_disabled_cache(tmp_path):
+    path = _write(str(tmp_path / "input.mov"), "data")
+    cache = MediaProbeCache()
+    cache.enabled = False
+    probe = _Probe()
+
+    cache.get_value("ffprobe", path, (), probe)
+    cache.get_value("ffprobe", path, (), probe)
+    assert probe.calls == 2
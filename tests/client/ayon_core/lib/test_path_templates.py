@@ -0,0 +1,96 @@
+import pytest
+
+from ayon_core.lib import path_templates
+from ayon_core.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+    FormattingPart,
+)
+
+TEMPLATE = "{root}/{folder[name]}<_{variant}>/v{version:0>3}.{frame:0>4}"
+
+
+def _data(frame, **kwargs):
+    data = {
+        "root": "/projects",
+        "folder": {"name": "sh010"},
+        "version": 1,
+        "frame": frame,
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_format_many_same_as_format():
+    template = StringTemplate(TEMPLATE)
+    data_items = [
+        _data(1001),
+        _data(1002, variant="main"),
+    ]
+
+    results = template.format_many(data_items)
+
+    assert results == [
+        "/projects/sh010/v001.1001",
+        "/projects/sh010_main/v001.1002",
+    ]
+    for result, data in zip(results, data_items):
+        expected = template.format(data)
+        assert result.solved == expected.solved
+        assert result.used_values == expected.used_values
+        assert sorted(result.missing_keys) == sorted(expected.missing_keys)
+
+
+def test_format_many_empty():
+    assert StringTemplate(TEMPLATE).format_many([]) == []
+
+
+def test_format_many_missing_keys():
+    template = StringTemplate(TEMPLATE)
+    data = _data(1001)
+    data.pop("version")
+
+    result = template.format_many([data])[0]
+    assert not result.solved
+    assert "version" in result.missing_keys
+
+    with pytest.raises(TemplateUnsolved):
+        template.format_many([_data(1001), data], strict=True)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_format_many_missing_optional_keys(strict):
+    template = StringTemplate(TEMPLATE)
+
+    # Missing key of optional part does not make result unsolved
+    result = template.format_many([_data(1001)], strict=strict)[0]
+    assert result == "/projects/sh010/v001.1001"
+    assert result.solved
+
+
+def test_template_parts_are_shared():
+    path_templates._get_template_parts.cache_clear()
+
+    first = StringTemplate(TEMPLATE)
+    second = StringTemplate(TEMPLATE)
+
+    assert first._parts is second._parts
+    cache_info = path_templates._get_template_parts.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+    # Formatting does not change shared parts
+    first.format(_data(1001, variant="main"))
+    assert second.format(_data(1002)) == "/projects/sh010/v001.1002"
+
+
+def test_formatting_part_key():
+    part = FormattingPart("{folder[name]:0>4}")
+
+    assert part._key == "folder[name]:0>4"
+    assert part._existence_check == "folder[name]"
+    assert part._key_subdict == ("folder", "name")
+
+    result = path_templates.TemplatePartResult()
+    part.format({"folder": {"name": "sh"}}, result)
+    assert result.output == "00sh"
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from ayon_core.lib import (
+    collect_files_stats,
+    source_hash,
+    source_hash_from_stat,
+)
+
+
+def _create_files(root):
+    """Create files of different sizes in multiple directories."""
+    paths = []
+    for dir_idx in range(3):
+        dirpath = os.path.join(root, "dir_{}".format(dir_idx))
+        os.makedirs(dirpath)
+        for file_idx in range(3):
+            path = os.path.join(dirpath, "file_{}.txt".format(file_idx))
+            with open(path, "w") as stream:
+                stream.write("x" * (dir_idx * 10 + file_idx + 1))
+            paths.append(path)
+    # File in unrelated directory which is not collected
+    with open(os.path.join(root, "dir_0", "other.txt"), "w") as stream:
+        stream.write("other")
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_collect_files_stats(tmp_path, max_workers):
+    filepaths = _create_files(str(tmp_path))
+
+    stats = collect_files_stats(filepaths, max_workers=max_workers)
+
+    assert list(stats) == filepaths
+    for filepath, stat_result in stats.items():
+        expected = os.stat(filepath)
+        assert stat_result.st_size == expected.st_size
+        assert stat_result.st_mtime == expected.st_mtime
+        assert (
+            source_hash_from_stat(filepath, stat_result, "extra")
+            == source_hash(filepath, "extra")
+        )
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+@pytest.mark.parametrize("dirname", ["dir_1", "missing_dir"])
+def test_collect_files_stats_missing_file(tmp_path, max_workers, dirname):
+    filepaths = _create_files(str(tmp_path))
+    filepaths.append(os.path.join(str(tmp_path), dirname, "missing.txt"))
+
+    with pytest.raises(OSError):
+        collect_files_stats(filepaths, max_workers=max_workers)
@@ -0,0 +1,123 @@
+import pytest
+
+from ayon_core.lib import profiles_filtering
+from ayon_core.lib.profiles_filtering import (
+    ProfilesFilter,
+    filter_profiles,
+)
+
+PROFILES = [
+    {"hosts": [], "task_types": [], "name": "default"},
+    {"hosts": ["maya"], "task_types": [], "name": "maya"},
+    {"hosts": ["maya"], "task_types": ["Anim.*"], "name": "maya_anim"},
+    {"hosts": ["nuke", "hiero"], "task_types": ["Comp"], "name": "comp"},
+]
+
+
+def _name(profile):
+    if profile is None:
+        return None
+    return profile["name"]
+
+
+@pytest.mark.parametrize(
+    "host, task_type, expected",
+    [
+        # Exact value match has priority over empty filter
+        ("maya", "Layout", "maya"),
+        # Regex value
+        ("maya", "Animation", "maya_anim"),
+        ("maya", "Anim", "maya_anim"),
+        # Regex must match whole value
+        ("maya", "PreAnimation", "maya"),
+        # Exact value must match whole value and case
+        ("nuke", "Comp", "comp"),
+        ("hiero", "Comp", "comp"),
+        ("nuke", "Compositing", "default"),
+        ("nuke", "comp", "default"),
+        ("houdini", "Comp", "default"),
+        # Not set value does not match profile with filter
+        (None, "Comp", "default"),
+        ("maya", None, "maya"),
+    ]
+)
+def test_filter_profiles(host, task_type, expected):
+    key_values = {"hosts": host, "task_types": task_type}
+    profiles_filter = ProfilesFilter(PROFILES)
+    profile = filter_profiles(PROFILES, key_values)
+    assert _name(profile) == expected
+    # Run twice to check cached result
+    assert profiles_filter.filter(key_values) is profile
+    assert profiles_filter.filter(key_values) is profile
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        # Values with regex characters are regexes
+        ("model.high", "regex"),
+        ("modelXhigh", "regex"),
+        ("fx(1)", "none"),
+        ("fx1", "regex"),
+        ("a+b", "none"),
+        ("aab", "regex"),
+        # Values without regex characters are exact values
+        ("lookdev-v2", "exact"),
+        ("lookdev_v2", "none"),
+        ("Layout 2", "exact"),
+        # Wildcard matches any value but scores as not set filter
+        ("anything", "wildcard"),
+    ]
+)
+def test_regex_and_exact_values(value, expected):
+    profiles = [
+        {"task_types": ["model.high", "fx(1)", "a+b"], "name": "regex"},
+        {"task_types": ["lookdev-v2", "Layout 2"], "name": "exact"},
+        {"task_types": ["*"], "name": "wildcard"},
+    ]
+    key_values = {"task_types": value}
+    profile = filter_profiles(profiles, key_values)
+    if expected == "none":
+        # Only wildcard profile matches
+        assert _name(profile) == "wildcard"
+    else:
+        assert _name(profile) == expected
+    assert ProfilesFilter(profiles).filter(key_values) is profile
+
+
+def test_single_value_and_keys_order():
+    profiles = [
+        {"hosts": "maya", "task_types": [], "name": "host"},
+        {"hosts": [], "task_types": "Comp", "name": "task"},
+        {"hosts": ["nuke"], "task_types": ["Comp"], "name": "both"},
+    ]
+    key_values = {"hosts": "maya", "task_types": "Comp"}
+    # Profiles with same score are resolved by order of keys
+    assert _name(filter_profiles(profiles, key_values)) == "host"
+    assert _name(filter_profiles(
+        profiles, key_values, keys_order=["task_types"]
+    )) == "task"
+    assert _name(filter_profiles(
+        profiles, {"hosts": "nuke", "task_types": "Comp"}
+    )) == "both"
+    assert filter_profiles(
+        profiles, {"hosts": "houdini", "task_types": "FX"}
+    ) is None
+    assert filter_profiles([], key_values) is None
+
+
+def test_results_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(
+        profiles_filtering, "_PROFILES_RESULTS_CACHE_SIZE", 5
+    )
+    profiles_filter = ProfilesFilter(PROFILES)
+    for idx in range(20):
+        profile = profiles_filter.filter(
+            {"hosts": "host_{}".format(idx), "task_types": "Comp"}
+        )
+        assert _name(profile) == "default"
+
+    assert len(profiles_filter._results_cache) == 5
+    assert _name(
+        profiles_filter.filter({"hosts": "maya", "task_types": "Animation"})
+    ) == "maya_anim"
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from ayon_core.lib import python_module_tools
+from ayon_core.lib.python_module_tools import (
+    modules_from_path,
+    clear_modules_from_path_cache,
+)
+
+PLUGIN_CONTENT = """
+class CollectPlugin(object):
+    enabled = True
+    value = {value}
+    families = ["render"]
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(monkeypatch):
+    monkeypatch.delenv("AYON_PLUGINS_DISCOVERY_FROZEN", raising=False)
+    clear_modules_from_path_cache()
+    yield
+    clear_modules_from_path_cache()
+
+
+def _write_plugin(dirpath, value, filename="collect_plugin.py"):
+    filepath = dirpath / filename
+    filepath.write_text(PLUGIN_CONTENT.format(value=value))
+    # Make sure modification time changes
+    stat = os.stat(filepath)
+    os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+    return filepath
+
+
+def _get_plugin(dirpath):
+    modules, crashed = modules_from_path(str(dirpath), use_cache=True)
+    assert crashed == []
+    assert len(modules) == 1
+    return modules[0][1].CollectPlugin
+
+
+def test_cached_modules_are_recreated(tmp_path, monkeypatch):
+    _write_plugin(tmp_path, 1)
+    compile_calls = []
+    compile_filepath = python_module_tools._compile_filepath
+
+    def _compile(*args, **kwargs):
+        compile_calls.append(args)
+        return compile_filepath(*args, **kwargs)
+
+    monkeypatch.setattr(python_module_tools, "_compile_filepath", _compile)
+
+    plugin = _get_plugin(tmp_path)
+    # Settings applied to plugin class
+    plugin.enabled = False
+    plugin.families.append("review")
+
+    new_plugin = _get_plugin(tmp_path)
+    assert new_plugin is not plugin
+    assert new_plugin.enabled is True
+    assert new_plugin.families == ["render"]
+    # Class held from previous discovery keeps its attributes
+    assert plugin.enabled is False
+    assert plugin.families == ["render", "review"]
+    assert len(compile_calls) == 1
+
+    # Changed file is compiled again
+    _write_plugin(tmp_path, 20)
+    assert _get_plugin(tmp_path).value == 20
+    assert len(compile_calls) == 2
+
+
+def test_crashed_file(tmp_path):
+    filepath = tmp_path / "broken_plugin.py"
+    filepath.write_text("raise ValueError('broken')\n")
+
+    modules, crashed = modules_from_path(str(tmp_path), use_cache=True)
+    assert modules == []
+    assert [item[0] for item in crashed] == [str(filepath)]
+    assert crashed[0][1][0] is ValueError
+
+    # Crashed file is imported again
+    _write_plugin(tmp_path, 1, filepath.name)
+    assert _get_plugin(tmp_path).value == 1
+
+
+def test_frozen_mode(tmp_path, monkeypatch):
+    monkeypatch.setenv("AYON_PLUGINS_DISCOVERY_FROZEN", "1")
+    _write_plugin(tmp_path, 1)
+    plugin = _get_plugin(tmp_path)
+    plugin.enabled = False
+
+    # Changes of files are not checked but modules are still recreated
+    _write_plugin(tmp_path, 2)
+    new_plugin = _get_plugin(tmp_path)
+    assert new_plugin is not plugin
+    assert new_plugin.enabled is True
+    assert new_plugin.value == 1
@@ -0,0 +1,91 @@
+import pytest
+
+from ayon_core.lib.transcoding import _get_oiio_conversion_inputs
+
+
+def _sequence(template, frames):
+    return [template % frame for frame in frames]
+
+
+def test_conversion_inputs_without_batches():
+    input_paths = _sequence("/render/beauty.%04d.exr", range(1001, 1004))
+
+    assert _get_oiio_conversion_inputs(input_paths, 1) == [
+        (None, input_path) for input_path in input_paths
+    ]
+
+
+@pytest.mark.parametrize(
+    "frames_per_batch, expected",
+    [
+        (4, [("1001-1004", "/render/beauty.%d.exr"),
+             ("1005-1008", "/render/beauty.%d.exr"),
+             ("1009-1010", "/render/beauty.%d.exr")]),
+        (20, [("1001-1010", "/render/beauty.%d.exr")]),
+        (3, [("1001-1003", "/render/beauty.%d.exr"),
+             ("1004-1006", "/render/beauty.%d.exr"),
+             ("1007-1009", "/render/beauty.%d.exr"),
+             (None, "/render/beauty.1010.exr")]),
+    ]
+)
+def test_conversion_inputs_batch_size(frames_per_batch, expected):
+    input_paths = _sequence("/render/beauty.%04d.exr", range(1001, 1011))
+
+    assert _get_oiio_conversion_inputs(
+        input_paths, frames_per_batch
+    ) == expected
+
+
+def test_conversion_inputs_keep_padding():
+    input_paths = _sequence("/render/beauty.%04d.exr", range(8, 12))
+
+    assert _get_oiio_conversion_inputs(input_paths, 10) == [
+        ("8-11", "/render/beauty.%04d.exr"),
+    ]
+
+
+def test_conversion_inputs_sequence_with_gaps():
+    input_paths = _sequence(
+        "/render/beauty.%04d.exr",
+        [1001, 1002, 1003, 1005, 1007, 1008]
+    )
+
+    assert _get_oiio_conversion_inputs(input_paths, 10) == [
+        ("1001-1003", "/render/beauty.%d.exr"),
+        (None, "/render/beauty.1005.exr"),
+        ("1007-1008", "/render/beauty.%d.exr"),
+    ]
+
+
+def test_conversion_inputs_percent_in_filename():
+    # Path with '%' can't be used as oiiotool frame template
+    input_paths = _sequence("/render/beauty_100%%.%04d.exr", [1001, 1002])
+
+    assert _get_oiio_conversion_inputs(input_paths, 10) == [
+        (None, "/render/beauty_100%.1001.exr"),
+        (None, "/render/beauty_100%.1002.exr"),
+    ]
+
+
+def test_conversion_inputs_negative_frames():
+    input_paths = [
+        "/render/beauty.-002.exr",
+        "/render/beauty.-001.exr",
+        "/render/beauty.0000.exr",
+        "/render/beauty.0001.exr",
+    ]
+
+    # Negative frames are converted one by one
+    assert _get_oiio_conversion_inputs(input_paths, 10) == [
+        (None, "/render/beauty.-002.exr"),
+        (None, "/render/beauty.-001.exr"),
+        ("0-1", "/render/beauty.%04d.exr"),
+    ]
+
+
+def test_conversion_inputs_single_files():
+    input_paths = ["/render/beauty.exr", "/render/beauty.1001.exr"]
+
+    assert _get_oiio_conversion_inputs(input_paths, 10) == [
+        (None, input_path) for input_path in input_paths
+    ]
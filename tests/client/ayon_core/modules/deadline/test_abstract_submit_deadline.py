@@ -0,0 +1,186 @@
+import json
+import time
+import threading
+import collections
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from ayon_core.modules.deadline import abstract_submit_deadline
+from ayon_core.modules.deadline.abstract_submit_deadline import (
+    AbstractSubmitDeadline,
+    DeadlineClient,
+)
+
+
+class _DeadlineHandler(BaseHTTPRequestHandler):
+    """Deadline Webservice 'jobs' end-point.
+
+    Behavior of each request is defined by first item of server 'actions'
+    ('ok' if empty), or by "action" key of submitted payload.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status, data):
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _handle(self, payload=None):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path, payload))
+            action = "ok"
+            if server.actions:
+                action = server.actions.popleft()
+        if payload:
+            action = payload.get("action", action)
+            time.sleep(payload.get("delay", 0))
+
+        if action == "disconnect":
+            # Request was received but response is never sent
+            self.close_connection = True
+            self.connection.close()
+        elif action == "unavailable":
+            self._respond(503, {"error": "Unavailable"})
+        elif action == "error":
+            self._respond(400, {"error": "Invalid job"})
+        elif payload is None:
+            self._respond(200, {})
+        else:
+            self._respond(200, {"_id": payload["JobInfo"]["Name"]})
+
+    def do_GET(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self._handle(json.loads(self.rfile.read(length)))
+
+
+@pytest.fixture
+def server():
+    server = HTTPServer(("127.0.0.1", 0), _DeadlineHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.actions = collections.deque()
+    server.url = "http://127.0.0.1:{}".format(server.server_port)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = DeadlineClient(max_retries=2, backoff_factor=0)
+    monkeypatch.setattr(
+        abstract_submit_deadline, "_deadline_client", client
+    )
+    return client
+
+
+def _payload(name, **kwargs):
+    payload = {"JobInfo": {"Name": name}, "PluginInfo": {}, "AuxFiles": []}
+    payload.update(kwargs)
+    return payload
+
+
+def test_get_is_retried(server, client):
+    server.actions.extend(["unavailable", "disconnect"])
+
+    response = client.get(server.url + "/api/jobs")
+
+    assert response.status_code == 200
+    assert len(server.requests) == 3
+
+
+def test_post_is_not_retried_after_sent(server, client):
+    server.actions.append("unavailable")
+    response = client.post(server.url + "/api/jobs", json=_payload("job"))
+    assert response.status_code == 503
+    assert len(server.requests) == 1
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.post(
+            server.url + "/api/jobs",
+            json=_payload("job", action="disconnect")
+        )
+    assert len(server.requests) == 2
+
+
+def test_post_is_retried_if_not_sent(client, monkeypatch):
+    # Find port where nothing is listening
+    free_server = HTTPServer(("127.0.0.1", 0), _DeadlineHandler)
+    url = "http://127.0.0.1:{}/api/jobs".format(free_server.server_port)
+    free_server.server_close()
+    sleeps = []
+    monkeypatch.setattr(abstract_submit_deadline.time, "sleep", sleeps.append)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.post(url, json=_payload("job"))
+    assert len(sleeps) == 2
+
+
+class _SubmitDeadline(AbstractSubmitDeadline):
+    submission_max_workers = 4
+
+    def get_job_info(self):
+        return None
+
+    def get_plugin_info(self):
+        return None
+
+
+class _Instance:
+    def __init__(self):
+        self.data = {}
+
+
+@pytest.fixture
+def plugin(server, client):
+    plugin = _SubmitDeadline()
+    plugin._instance = _Instance()
+    plugin._deadline_url = server.url
+    return plugin
+
+
+def test_submit_many_keeps_order(server, plugin):
+    # Earlier jobs are answered later
+    payloads = [
+        _payload("job_{}".format(idx), delay=0.05 * (4 - idx))
+        for idx in range(5)
+    ]
+
+    job_ids = plugin.submit_many(payloads, None, True)
+
+    assert job_ids == ["job_{}".format(idx) for idx in range(5)]
+    assert plugin._instance.data["deadlineSubmissionJob"] == {"_id": "job_4"}
+
+
+def test_submit_many_deletes_submitted_jobs(server, plugin):
+    payloads = [
+        _payload("job_0"),
+        _payload("job_1", action="error"),
+        _payload("job_2"),
+    ]
+
+    with pytest.raises(abstract_submit_deadline.KnownPublishError):
+        plugin.submit_many(payloads, None, True)
+
+    delete_requests = [
+        request[1] for request in server.requests if request[0] == "DELETE"
+    ]
+    assert delete_requests == ["/api/jobs?JobID=job_0%2Cjob_2"]
+    assert "deadlineSubmissionJob" not in plugin._instance.data
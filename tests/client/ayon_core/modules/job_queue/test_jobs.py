@@ -0,0 +1,192 @@
+import json
+import asyncio
+
+import pytest
+
+from ayon_core.modules.job_queue.job_server.jobs import JobQueue
+from ayon_core.modules.job_queue.job_server.job_queue_route import (
+    JobQueueResource,
+)
+
+
+class _Worker:
+    def __init__(self, host_name, worker_id):
+        self.host_name = host_name
+        self.id = worker_id
+        self.current_job = None
+
+    def is_idle(self):
+        return self.current_job is None
+
+    def set_current_job(self, job):
+        if job is self.current_job:
+            return
+        self.current_job = job
+        if job is not None:
+            job.set_worker(self)
+
+
+def _finish_current_job(job_queue, worker):
+    job = worker.current_job
+    job_queue.finish_job(job.id, True, None, {"name": job.data["name"]})
+    return job.data["name"]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "db" / "jobs.db")
+
+
+def test_jobs_by_priority(db_path):
+    job_queue = JobQueue(db_path)
+    job_queue.create_jobs([
+        ("maya", {"name": "low"}),
+        ("maya", {"name": "high_1", "priority": 10}),
+        ("maya", {"name": "normal", "priority": 0}),
+        ("maya", {"name": "high_2", "priority": 10}),
+        ("nuke", {"name": "nuke", "priority": 20}),
+    ])
+    worker = _Worker("maya", "worker_1")
+    job_queue.add_worker(worker)
+
+    names = []
+    for _ in range(4):
+        job_queue.assign_jobs()
+        names.append(_finish_current_job(job_queue, worker))
+
+    assert names == ["high_1", "high_2", "low", "normal"]
+
+
+def test_removed_worker_job_is_first(db_path):
+    job_queue = JobQueue(db_path)
+    job_queue.create_jobs([
+        ("maya", {"name": "first"}),
+        ("maya", {"name": "second"}),
+    ])
+    worker = _Worker("maya", "worker_1")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    assert worker.current_job.state == "started"
+
+    job_queue.remove_worker(worker)
+    worker = _Worker("maya", "worker_2")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+
+    assert _finish_current_job(job_queue, worker) == "first"
+
+
+def test_jobs_are_restored(db_path):
+    job_queue = JobQueue(db_path)
+    done_job, started_job, waiting_job, deleted_job = job_queue.create_jobs([
+        ("maya", {"name": "done"}),
+        ("maya", {"name": "started"}),
+        ("maya", {"name": "waiting"}),
+        ("maya", {"name": "deleted"}),
+    ])
+    worker = _Worker("maya", "worker_1")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    _finish_current_job(job_queue, worker)
+    job_queue.assign_jobs()
+    assert worker.current_job is started_job
+    job_queue.remove_job(deleted_job.id)
+
+    # Server restart
+    job_queue = JobQueue(db_path)
+
+    # Only waiting job is queued again
+    assert [job.id for job in job_queue.get_jobs()] == [waiting_job.id]
+    assert job_queue.get_job_status(done_job.id)["result"] == {
+        "name": "done"
+    }
+    status = job_queue.get_job_status(started_job.id)
+    assert status["state"] == "error"
+    assert status["done"] is True
+    assert status["message"]
+    assert job_queue.get_job_status(deleted_job.id)["state"] == "deleted"
+
+    worker = _Worker("maya", "worker_2")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    assert _finish_current_job(job_queue, worker) == "waiting"
+
+    # Job started after restart is not restored again
+    job_queue = JobQueue(db_path)
+    assert not job_queue.get_jobs()
+    assert job_queue.get_job_status(waiting_job.id)["state"] == "done"
+
+
+def test_invalid_priority(db_path):
+    job_queue = JobQueue(db_path)
+    for priority in ("high", 1.5, True):
+        with pytest.raises(ValueError):
+            job_queue.create_jobs([
+                ("maya", {"name": "valid"}),
+                ("maya", {"name": "invalid", "priority": priority}),
+            ])
+
+    assert not job_queue.get_jobs()
+    assert not JobQueue(db_path).get_jobs()
+
+
+class _ServerManager:
+    def add_route(self, *args):
+        pass
+
+
+class _Request:
+    def __init__(self, data):
+        self._data = data
+
+    async def json(self):
+        return self._data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"host_name": "maya"},
+        [{"host_name": "maya"}, "maya"],
+        [{"host_name": "maya"}, {"host_name": "maya", "priority": "high"}],
+    ]
+)
+def test_invalid_bulk_request(data):
+    job_queue = JobQueue()
+    resource = JobQueueResource(job_queue, _ServerManager())
+
+    response = asyncio.run(resource.post_jobs(_Request(data)))
+
+    assert response.status == 400
+    assert not job_queue.get_jobs()
+
+
+def test_job_request_priority():
+    job_queue = JobQueue()
+    resource = JobQueueResource(job_queue, _ServerManager())
+
+    response = asyncio.run(resource.post_job(
+        _Request({"host_name": "maya", "priority": "high"})
+    ))
+    assert response.status == 400
+    assert not job_queue.get_jobs()
+
+    response = asyncio.run(resource.post_job(
+        _Request({"host_name": "maya", "priority": 2})
+    ))
+    assert response.status == 201
+    assert [job.id for job in job_queue.get_jobs()] == [response.text]
+
+
+def test_bulk_request(db_path):
+    job_queue = JobQueue(db_path)
+    resource = JobQueueResource(job_queue, _ServerManager())
+
+    response = asyncio.run(resource.post_jobs(_Request([
+        {"host_name": "maya", "priority": 1},
+        {"host_name": "nuke"},
+    ])))
+
+    assert response.status == 201
+    job_ids = json.loads(response.body)
+    assert [job.id for job in job_queue.get_jobs()] == job_ids
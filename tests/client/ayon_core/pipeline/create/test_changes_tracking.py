@@ -0,0 +1,188 @@
+from ayon_core.lib.attribute_definitions import BoolDef, NumberDef
+from ayon_core.pipeline.create.context import (
+    CreatedInstance,
+    TrackChangesItem,
+)
+
+
+class CollectTest:
+    """Minimal publish plugin with attribute definitions."""
+
+    @classmethod
+    def convert_attribute_values(cls, attribute_values):
+        return attribute_values
+
+    @classmethod
+    def get_attribute_defs(cls):
+        return [BoolDef("enabled", default=True)]
+
+
+def _create_instance():
+    instance = CreatedInstance(
+        "test",
+        "testMain",
+        {
+            "folderPath": "/folder",
+            "task": "modeling",
+            "extra": {"nested": {"value": 1}, "items": [1, 2]},
+            "removable": "value",
+            "creator_attributes": {"frames": 10, "review": False},
+            "publish_attributes": {"CollectTest": {"enabled": True}},
+        },
+        creator_identifier="test.creator",
+        creator_label="Test",
+        group_label="Test",
+        creator_attr_defs=[
+            NumberDef("frames", default=1),
+            BoolDef("review", default=False),
+        ],
+    )
+    instance.set_publish_plugins([CollectTest])
+    instance.mark_as_stored()
+    return instance
+
+
+def _expected_changes(instance):
+    """Changes calculated the same way as before snapshots were used."""
+
+    return TrackChangesItem(instance.origin_data, instance.data_to_store())
+
+
+def _assert_same_changes(changes, expected):
+    assert changes.changed == expected.changed
+    assert changes.changed_keys == expected.changed_keys
+    assert changes.removed_keys == expected.removed_keys
+    assert changes.old_value == expected.old_value
+    assert changes.new_value == expected.new_value
+    for key in expected.available_keys:
+        assert changes[key].changes == expected[key].changes
+
+
+def test_stored_instance_has_no_changes():
+    instance = _create_instance()
+
+    changes = instance.changes()
+
+    assert not changes.changed
+    assert changes.changed_keys == set()
+    _assert_same_changes(changes, _expected_changes(instance))
+
+
+def test_nested_in_place_edit():
+    instance = _create_instance()
+
+    instance["extra"]["nested"]["value"] = 2
+    instance["extra"]["items"].append(3)
+    changes = instance.changes()
+
+    assert changes.changed_keys == {"extra"}
+    assert changes["extra"].changed_keys == {"nested", "items"}
+    assert changes["extra"]["nested"]["value"].old_value == 1
+    assert changes["extra"]["nested"]["value"].new_value == 2
+    _assert_same_changes(changes, _expected_changes(instance))
+
+    # Previous result must not be affected by later edits
+    instance["extra"]["nested"]["value"] = 3
+    assert changes["extra"]["nested"]["value"].new_value == 2
+    assert instance.changes()["extra"]["nested"]["value"].new_value == 3
+
+    # Values returned from changes are copies
+    changes.new_value["extra"]["nested"]["value"] = 100
+    assert instance["extra"]["nested"]["value"] == 3
+
+
+def test_removed_keys():
+    instance = _create_instance()
+
+    instance.pop("removable")
+    instance["added"] = {"key": "value"}
+    changes = instance.changes()
+
+    assert changes.removed_keys == {"removable"}
+    assert changes.changed_keys == {"removable", "added"}
+    assert changes["removable"].old_value == "value"
+    assert changes["removable"].new_value is None
+    _assert_same_changes(changes, _expected_changes(instance))
+
+    instance.mark_as_stored()
+    changes = instance.changes()
+    assert not changes.changed
+    assert "removable" not in changes.available_keys
+    assert "removable" not in instance.origin_data
+    assert instance.origin_data["added"] == {"key": "value"}
+
+
+def test_attribute_values_changes():
+    instance = _create_instance()
+
+    instance.creator_attributes["frames"] = 20
+    instance.publish_attributes["CollectTest"]["enabled"] = False
+    changes = instance.changes()
+
+    assert changes.changed_keys == {
+        "creator_attributes", "publish_attributes"
+    }
+    assert changes["creator_attributes"].changes == {"frames": (10, 20)}
+    assert (
+        changes["publish_attributes"]["CollectTest"].changes
+        == {"enabled": (True, False)}
+    )
+    _assert_same_changes(changes, _expected_changes(instance))
+
+    instance.mark_as_stored()
+    assert not instance.changes().changed
+    assert instance.origin_data["creator_attributes"]["frames"] == 20
+    assert (
+        instance.origin_data["publish_attributes"]
+        == {"CollectTest": {"enabled": False}}
+    )
+
+    # Popped value falls back to default of attribute definition
+    instance.creator_attributes.pop("frames")
+    changes = instance.changes()
+    assert changes["creator_attributes"].changes == {"frames": (20, 1)}
+    _assert_same_changes(changes, _expected_changes(instance))
+
+    # Reset of publish attributes
+    instance.publish_attributes.pop("CollectTest")
+    changes = instance.changes()
+    assert (
+        changes["publish_attributes"]["CollectTest"].changes
+        == {"enabled": (False, True)}
+    )
+    _assert_same_changes(changes, _expected_changes(instance))
+
+
+def test_changes_after_deserialize_on_remote():
+    instance = _create_instance()
+    instance["extra"]["nested"]["value"] = 2
+    instance.pop("removable")
+
+    remote = CreatedInstance.deserialize_on_remote(
+        instance.serialize_for_remote()
+    )
+
+    assert remote.data_to_store() == instance.data_to_store()
+    changes = remote.changes()
+    assert changes.changed_keys == {"extra", "removable"}
+    assert changes.removed_keys == {"removable"}
+    assert changes["extra"]["nested"]["value"].new_value == 2
+    _assert_same_changes(changes, _expected_changes(remote))
+
+    remote["extra"]["nested"]["value"] = 5
+    remote.creator_attributes["frames"] = 30
+    remote.publish_attributes["CollectTest"]["enabled"] = False
+    changes = remote.changes()
+    assert changes["extra"]["nested"]["value"].new_value == 5
+    assert changes["creator_attributes"].changes == {"frames": (10, 30)}
+    assert (
+        changes["publish_attributes"]["CollectTest"].changes
+        == {"enabled": (True, False)}
+    )
+    _assert_same_changes(changes, _expected_changes(remote))
+
+    remote.mark_as_stored()
+    assert not remote.changes().changed
+    # Original instance is not affected by remote changes
+    assert instance["extra"]["nested"]["value"] == 2
+    assert instance.creator_attributes["frames"] == 10
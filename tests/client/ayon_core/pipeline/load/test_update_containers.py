@@ -0,0 +1,264 @@
+import collections
+
+import pytest
+
+import ayon_core.pipeline
+from ayon_core.pipeline.load import utils
+from ayon_core.pipeline.load.utils import HeroVersionType
+
+PROJECT_NAME = "test_project"
+
+
+class _FakeServer(object):
+    """Fake of 'ayon_api' functions used by 'update_containers'."""
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.folders = [{"id": "folder1", "name": "sh010"}]
+        self.products = [
+            {"id": "product1", "folderId": "folder1", "name": "modelMain"},
+            {"id": "product2", "folderId": "folder1", "name": "rigMain"},
+            {"id": "product3", "folderId": "folder1", "name": "camMain"},
+        ]
+        self.versions = [
+            {"id": "version1", "productId": "product1", "version": 1},
+            {"id": "version2", "productId": "product1", "version": 2},
+            {"id": "version3", "productId": "product2", "version": 1},
+            {
+                "id": "version4",
+                "productId": "product3",
+                "version": 1,
+                "active": False,
+            },
+        ]
+        self.hero_versions = [
+            {"id": "hero1", "productId": "product1", "version": -2},
+        ]
+        self.representations = [
+            {"id": "repre1", "versionId": "version1", "name": "abc"},
+            {"id": "repre2", "versionId": "version2", "name": "abc"},
+            {"id": "repre3", "versionId": "version3", "name": "ma"},
+            {"id": "repre4", "versionId": "hero1", "name": "abc"},
+            {"id": "repre5", "versionId": "version4", "name": "abc"},
+        ]
+
+    def get_project(self, project_name):
+        self.calls["get_project"] += 1
+        return {"name": project_name}
+
+    def get_folders(self, project_name, folder_ids=None):
+        self.calls["get_folders"] += 1
+        return [f for f in self.folders if f["id"] in folder_ids]
+
+    def get_products(self, project_name, product_ids=None):
+        self.calls["get_products"] += 1
+        return [p for p in self.products if p["id"] in product_ids]
+
+    def get_versions(
+        self,
+        project_name,
+        version_ids=None,
+        product_ids=None,
+        versions=None,
+        hero=True,
+        fields=None,
+    ):
+        self.calls["get_versions"] += 1
+        output = []
+        for version in self.versions:
+            if version_ids is not None and version["id"] not in version_ids:
+                continue
+            if (
+                product_ids is not None
+                and version["productId"] not in product_ids
+            ):
+                continue
+            if versions is not None and version["version"] not in versions:
+                continue
+            output.append(version)
+        return output
+
+    def get_last_versions(self, project_name, product_ids):
+        self.calls["get_last_versions"] += 1
+        # Products without matching last version have 'None' value
+        output = {product_id: None for product_id in product_ids}
+        for version in self.versions:
+            product_id = version["productId"]
+            if product_id not in product_ids or not version.get(
+                "active", True
+            ):
+                continue
+            last = output.get(product_id)
+            if last is None or last["version"] < version["version"]:
+                output[product_id] = version
+        return output
+
+    def get_hero_versions(self, project_name, product_ids=None):
+        self.calls["get_hero_versions"] += 1
+        return [
+            version
+            for version in self.hero_versions
+            if version["productId"] in product_ids
+        ]
+
+    def get_representations(
+        self,
+        project_name,
+        representation_ids=None,
+        representation_names=None,
+        version_ids=None,
+    ):
+        self.calls["get_representations"] += 1
+        output = []
+        for repre in self.representations:
+            if (
+                representation_ids is not None
+                and repre["id"] not in representation_ids
+            ):
+                continue
+            if (
+                representation_names is not None
+                and repre["name"] not in representation_names
+            ):
+                continue
+            if version_ids is not None and repre["versionId"] not in (
+                version_ids
+            ):
+                continue
+            output.append(repre)
+        return output
+
+
+class FakeLoader(object):
+    updated = []
+
+    def update(self, container, context):
+        if container.get("fail"):
+            raise RuntimeError("Update failed")
+        self.updated.append(
+            (container["objectName"], context["representation"]["id"])
+        )
+        return context["version"]["id"]
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    fake_server = _FakeServer()
+    for attr_name in (
+        "get_project",
+        "get_folders",
+        "get_products",
+        "get_versions",
+        "get_last_versions",
+        "get_hero_versions",
+        "get_representations",
+    ):
+        monkeypatch.setattr(
+            utils.ayon_api, attr_name, getattr(fake_server, attr_name)
+        )
+
+    filepath = tmp_path / "file.abc"
+    filepath.write_text("data")
+    monkeypatch.setattr(
+        utils, "get_representation_path", lambda *args: str(filepath)
+    )
+    monkeypatch.setattr(
+        utils,
+        "_get_loaders_by_identifier",
+        lambda: {"FakeLoader": FakeLoader}
+    )
+    monkeypatch.setattr(
+        ayon_core.pipeline, "registered_root", lambda: str(tmp_path)
+    )
+    monkeypatch.setattr(
+        ayon_core.pipeline, "get_current_project_name", lambda: PROJECT_NAME
+    )
+    FakeLoader.updated = []
+    return fake_server
+
+
+def _container(name, repre_id, loader="FakeLoader", **kwargs):
+    container = {
+        "objectName": name,
+        "representation": repre_id,
+        "loader": loader,
+    }
+    container.update(kwargs)
+    return container
+
+
+def test_update_containers_batched(server):
+    containers = [
+        _container("a", "repre1"),
+        _container("b", "repre1"),
+        _container("c", "repre3"),
+        _container("d", "repre1"),
+    ]
+    results = utils.update_containers(
+        containers,
+        [-1, 1, -1, HeroVersionType(-1)],
+        project_name=PROJECT_NAME
+    )
+
+    assert [result.error for result in results] == [None] * 4
+    assert [result.result for result in results] == [
+        "version2", "version1", "version3", "hero1"
+    ]
+    assert FakeLoader.updated == [
+        ("a", "repre2"), ("b", "repre1"), ("c", "repre3"), ("d", "repre4")
+    ]
+    # Entities are queried once for all containers
+    assert server.calls["get_representations"] == 2
+    assert server.calls["get_last_versions"] == 1
+    assert server.calls["get_products"] == 1
+
+
+def test_update_containers_errors_do_not_stop_update(server):
+    containers = [
+        _container("missing_repre", "unknown"),
+        _container("failing", "repre1", fail=True),
+        _container("missing_loader", "repre1", loader="Unknown"),
+        _container("missing_version", "repre3"),
+        _container("valid", "repre3"),
+    ]
+    results = utils.update_containers(
+        containers,
+        [-1, -1, -1, 5, -1],
+        project_name=PROJECT_NAME
+    )
+
+    assert [result.container for result in results] == containers
+    assert isinstance(results[0].error, AssertionError)
+    assert isinstance(results[1].error, RuntimeError)
+    assert isinstance(results[2].error, utils.LoaderNotFoundError)
+    assert isinstance(results[3].error, ValueError)
+    assert results[4].error is None
+    assert FakeLoader.updated == [("valid", "repre3")]
+
+
+def test_update_containers_without_last_version(server):
+    containers = [
+        _container("no_last_version", "repre5"),
+        _container("valid", "repre1"),
+    ]
+    results = utils.update_containers(containers, project_name=PROJECT_NAME)
+
+    assert isinstance(results[0].error, ValueError)
+    assert str(results[0].error) == "Failed to find matching version"
+    assert results[1].error is None
+    assert FakeLoader.updated == [("valid", "repre2")]
+
+    with pytest.raises(ValueError):
+        utils.update_container(_container("no_last_version", "repre5"))
+
+
+def test_update_container_raises_error(server):
+    with pytest.raises(RuntimeError):
+        utils.update_container(_container("failing", "repre1", fail=True))
+
+
+def test_update_containers_versions_mismatch(server):
+    with pytest.raises(ValueError):
+        utils.update_containers(
+            [_container("a", "repre1")], [1, 2], project_name=PROJECT_NAME
+        )
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from ayon_core.pipeline import colorspace
+
+
+class _WrapperProcess:
+    def __init__(self, error):
+        self._error = error
+
+    def query(self, command, kwargs):
+        raise self._error
+
+
+def _run_single_process(*args, **kwargs):
+    args = list(args)
+    output_path = args[args.index("--output_path") + 1]
+    with open(output_path, "w") as stream:
+        json.dump({"command": args[2]}, stream)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        colorspace._OCIOWrapperProcessError("Process ended"),
+        RuntimeError("OCIO wrapper command failed"),
+    ]
+)
+def test_wrapped_query_fallback(monkeypatch, error):
+    monkeypatch.setattr(
+        colorspace._OCIOWrapperProcess,
+        "get_instance",
+        lambda: _WrapperProcess(error)
+    )
+    monkeypatch.setattr(
+        colorspace, "run_ayon_launcher_process", _run_single_process
+    )
+
+    output = colorspace._get_wrapped_with_subprocess(
+        "get_ocio_config_views", config_path="config.ocio"
+    )
+
+    assert output == {"command": "get_ocio_config_views"}
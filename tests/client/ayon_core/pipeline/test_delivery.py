@@ -0,0 +1,129 @@
+import os
+
+import pytest
+
+from ayon_core.pipeline import delivery
+from ayon_core.pipeline.delivery import DeliveryPlan
+
+
+def _write(path, content):
+    with open(path, "w") as stream:
+        stream.write(content)
+
+
+def _read(path):
+    with open(path, "r") as stream:
+        return stream.read()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    paths = []
+    for idx in range(5):
+        path = str(src_dir / "file_{}.txt".format(idx))
+        _write(path, "x" * (idx + 1))
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def no_hardlinks(monkeypatch):
+    def _create_hard_link(src_path, dst_path):
+        raise OSError("Hardlinks are not supported")
+
+    monkeypatch.setattr(delivery, "create_hard_link", _create_hard_link)
+
+
+def _create_plan(sources, dst_dir):
+    plan = DeliveryPlan(max_workers=3)
+    dst_paths = []
+    for src_path in sources:
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        plan.add(src_path, dst_path)
+        # Same destination is planned only once
+        plan.add(src_path, dst_path)
+        dst_paths.append(dst_path)
+    return plan, dst_paths
+
+
+def test_process(tmp_path, sources):
+    dst_dir = str(tmp_path / "dst" / "nested")
+    plan, dst_paths = _create_plan(sources, dst_dir)
+    assert plan.files_count == len(sources)
+    assert plan.total_size == sum(range(1, len(sources) + 1))
+
+    progresses = []
+    report_items = plan.process(
+        lambda progress: progresses.append(
+            (progress.processed_count, progress.processed_size)
+        )
+    )
+
+    assert not report_items
+    for src_path, dst_path in zip(sources, dst_paths):
+        assert _read(dst_path) == _read(src_path)
+    assert [item[0] for item in progresses] == list(
+        range(1, len(sources) + 1)
+    )
+    assert progresses[-1][1] == plan.total_size
+
+
+def test_copy_keeps_modification_time(tmp_path, sources, no_hardlinks):
+    plan, dst_paths = _create_plan(sources, str(tmp_path / "dst"))
+
+    plan.process()
+
+    for src_path, dst_path in zip(sources, dst_paths):
+        assert _read(dst_path) == _read(src_path)
+        assert os.stat(dst_path).st_ino != os.stat(src_path).st_ino
+        assert abs(
+            os.path.getmtime(dst_path) - os.path.getmtime(src_path)
+        ) < 1
+        assert not os.path.exists(dst_path + ".delivery_tmp")
+
+
+def test_resume(tmp_path, sources, no_hardlinks):
+    dst_dir = str(tmp_path / "dst")
+    plan, dst_paths = _create_plan(sources, dst_dir)
+    plan.process()
+
+    # Interrupted delivery: missing file, temporary file of unfinished
+    #   copy and file with different content
+    os.remove(dst_paths[0])
+    _write(dst_paths[0] + ".delivery_tmp", "partial")
+    _write(dst_paths[1], "changed content")
+
+    plan, dst_paths = _create_plan(sources, dst_dir)
+    last_progress = []
+    report_items = plan.process(last_progress.append)
+
+    assert not report_items
+    progress = last_progress[-1]
+    assert progress.processed_count == len(sources)
+    assert progress.skipped_count == len(sources) - 2
+    assert progress.transferred_size == (
+        os.path.getsize(sources[0]) + os.path.getsize(sources[1])
+    )
+    for src_path, dst_path in zip(sources, dst_paths):
+        assert _read(dst_path) == _read(src_path)
+    assert not os.path.exists(dst_paths[0] + ".delivery_tmp")
+
+
+def test_failed_files_are_reported(tmp_path, sources):
+    plan, dst_paths = _create_plan(sources, str(tmp_path / "dst"))
+    # Source removed after it was planned
+    os.remove(sources[2])
+
+    last_progress = []
+    report_items = plan.process(last_progress.append)
+
+    assert list(report_items) == ["Failed to copy files"]
+    messages = report_items["Failed to copy files"]
+    assert len(messages) == 1
+    assert sources[2] in messages[0]
+    # Other files are delivered
+    assert last_progress[-1].processed_count == len(sources)
+    for idx, dst_path in enumerate(dst_paths):
+        assert os.path.exists(dst_path) is (idx != 2)
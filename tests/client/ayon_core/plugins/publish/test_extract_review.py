@@ -0,0 +1,272 @@
+import os
+
+import pytest
+
+from ayon_core.plugins.publish import extract_review
+from ayon_core.plugins.publish.extract_review import ExtractReview
+
+
+class _Instance:
+    def __init__(self, repre):
+        self.data = {
+            "anatomyData": {},
+            "frameStart": 1001,
+            "frameEnd": 1003,
+            "representations": [repre],
+        }
+
+
+@pytest.fixture
+def review_env(tmp_path, monkeypatch):
+    """ExtractReview with one "burnin" output of "exr" representation.
+
+    Preparation of output arguments is replaced by input path of the
+    representation and ffmpeg calls only record existence of input file.
+    """
+    staging_dir = tmp_path / "staging"
+    staging_dir.mkdir()
+    filenames = []
+    for frame in (1001, 1002, 1003):
+        filename = "render.{}.exr".format(frame)
+        (staging_dir / filename).write_text("frame")
+        filenames.append(filename)
+    repre = {
+        "name": "exr",
+        "ext": "exr",
+        "files": filenames,
+        "stagingDir": str(staging_dir),
+        "tags": ["review"],
+    }
+
+    plugin = ExtractReview()
+    plugin.fuse_burnins = True
+    output_def = {"filename_suffix": "h264", "tags": ["burnin"]}
+    monkeypatch.setattr(
+        plugin, "_get_outputs_for_instance", lambda instance: [output_def]
+    )
+    monkeypatch.setattr(
+        plugin,
+        "_get_outputs_per_representations",
+        lambda instance, outputs: [(repre, outputs)]
+    )
+    monkeypatch.setattr(
+        plugin, "_single_frame_filter", lambda paths, outputs: outputs
+    )
+
+    def _prepare_output_item(instance, repre, *args):
+        input_path = os.path.join(repre["stagingDir"], repre["files"][0])
+        return {
+            "new_repre": {"name": "h264", "tags": ["burnin"]},
+            "input_args": ["-i", input_path],
+            "video_filters": [],
+            "audio_filters": [],
+            "output_args": ["output.mp4"],
+            "probe_path": input_path,
+        }
+
+    monkeypatch.setattr(plugin, "_prepare_output_item", _prepare_output_item)
+
+    encoded_inputs = []
+
+    def _run_subprocess(cmd, *args, **kwargs):
+        input_path = cmd.split(" -i ")[1].split(" ")[0]
+        encoded_inputs.append((input_path, os.path.exists(input_path)))
+
+    for attr_name, value in (
+        ("get_publish_instance_label", lambda instance: "instance"),
+        ("get_review_layer_name", lambda path: None),
+        ("get_ffmpeg_tool_args", lambda tool_name: ["ffmpeg"]),
+        ("add_repre_files_for_cleanup", lambda instance, repre: None),
+        ("should_convert_for_ffmpeg", lambda path: False),
+        ("run_subprocess", _run_subprocess),
+    ):
+        monkeypatch.setattr(extract_review, attr_name, value)
+
+    instance = _Instance(repre)
+    return plugin, instance, encoded_inputs
+
+
+def _get_new_repre(instance):
+    return instance.data["representations"][-1]
+
+
+def test_output_is_deferred(review_env):
+    plugin, instance, encoded_inputs = review_env
+
+    plugin.main_process(instance)
+
+    new_repre = _get_new_repre(instance)
+    assert new_repre["name"] == "h264"
+    encode_data = new_repre["reviewEncode"]
+    assert os.path.exists(encode_data["probe_path"])
+    assert encoded_inputs == []
+
+
+def test_converted_input_is_not_deferred(review_env, tmp_path, monkeypatch):
+    plugin, instance, encoded_inputs = review_env
+    transcode_dir = str(tmp_path / "transcode")
+
+    def _convert_input_paths_for_ffmpeg(input_paths, output_dir, *a, **kw):
+        for input_path in input_paths:
+            output_path = os.path.join(
+                output_dir, os.path.basename(input_path)
+            )
+            with open(output_path, "w") as stream:
+                stream.write("converted")
+
+    def _get_transcode_temp_directory():
+        os.makedirs(transcode_dir)
+        return transcode_dir
+
+    for attr_name, value in (
+        ("should_convert_for_ffmpeg", lambda path: True),
+        ("get_transcode_temp_directory", _get_transcode_temp_directory),
+        ("convert_input_paths_for_ffmpeg", _convert_input_paths_for_ffmpeg),
+    ):
+        monkeypatch.setattr(extract_review, attr_name, value)
+
+    plugin.main_process(instance)
+
+    new_repre = _get_new_repre(instance)
+    assert "reviewEncode" not in new_repre
+    assert "ffmpeg_cmd" in new_repre
+    # Converted input was encoded before it was removed
+    assert encoded_inputs == [
+        (os.path.join(transcode_dir, "render.1001.exr"), True)
+    ]
+    assert not os.path.exists(transcode_dir)
+
+
+def test_gap_filled_input_is_not_deferred(review_env):
+    plugin, instance, encoded_inputs = review_env
+    repre = instance.data["representations"][0]
+    gap_path = os.path.join(repre["stagingDir"], repre["files"].pop(1))
+    os.remove(gap_path)
+
+    plugin.main_process(instance)
+
+    new_repre = _get_new_repre(instance)
+    assert "reviewEncode" not in new_repre
+    assert len(encoded_inputs) == 1
+    # File filling the gap is removed after encoding
+    assert not os.path.exists(gap_path)
+
+
+@pytest.fixture
+def single_pass_env(review_env, monkeypatch):
+    """ExtractReview with single pass encoding of prepared output items.
+
+    Output items are taken from 'output_items' list in order of output
+    definitions and ffmpeg commands are recorded.
+    """
+    plugin, instance, _ = review_env
+    plugin.fuse_burnins = False
+    plugin.single_pass_encoding = True
+
+    output_items = []
+    monkeypatch.setattr(
+        plugin,
+        "_get_outputs_for_instance",
+        lambda instance: [{} for _ in output_items]
+    )
+    # Iterator reflects items added to the list by the test
+    items_iter = iter(output_items)
+    monkeypatch.setattr(
+        plugin, "_prepare_output_item", lambda *args: next(items_iter)
+    )
+
+    commands = []
+    monkeypatch.setattr(
+        extract_review,
+        "run_subprocess",
+        lambda cmd, *args, **kwargs: commands.append(cmd)
+    )
+    return plugin, instance, output_items, commands
+
+
+def _output_item(name, input_args, output_args, video_filters=None):
+    return {
+        "new_repre": {"name": name, "tags": []},
+        "input_args": list(input_args),
+        "video_filters": list(video_filters or []),
+        "audio_filters": [],
+        "output_args": list(output_args),
+        "probe_path": "input.exr",
+    }
+
+
+def test_single_pass_groups_outputs_with_same_input(single_pass_env):
+    plugin, instance, output_items, commands = single_pass_env
+    output_items.extend([
+        _output_item("h264", ["-i input.exr"], ["-y", "h264.mp4"]),
+        _output_item(
+            "prores",
+            ["-i input.exr"],
+            ["-y", "prores.mov"],
+            video_filters=["scale=1920:1080"]
+        ),
+        _output_item("other", ["-i other.exr"], ["-y", "other.mp4"]),
+    ])
+
+    plugin.main_process(instance)
+
+    assert commands == [
+        "ffmpeg -i input.exr -y h264.mp4"
+        " -filter:v \"scale=1920:1080\" -y prores.mov",
+        "ffmpeg -i other.exr -y other.mp4",
+    ]
+    # Each output stores command with only its own arguments
+    new_repres = instance.data["representations"][1:]
+    assert [repre["ffmpeg_cmd"] for repre in new_repres] == [
+        "ffmpeg -i input.exr -y h264.mp4",
+        "ffmpeg -i input.exr -filter:v \"scale=1920:1080\" -y prores.mov",
+        commands[1],
+    ]
+
+
+def test_single_pass_does_not_group_filter_complex(single_pass_env):
+    plugin, instance, output_items, commands = single_pass_env
+    audio_instance = _Instance({})
+    audio_instance.data["audio"] = [
+        {"offset": 1001, "filename": "audio1.wav"},
+        {"offset": 1001, "filename": "audio2.wav"},
+    ]
+    audio_in_args, _, audio_out_args = plugin.audio_args(
+        audio_instance, {"fps": 25.0}, 1.0
+    )
+    input_args = ["-i input.exr"] + audio_in_args
+    output_items.extend([
+        _output_item(
+            "h264", input_args, audio_out_args + ["-y", "h264.mp4"]
+        ),
+        _output_item(
+            "prores", input_args, audio_out_args + ["-y", "prores.mov"]
+        ),
+        _output_item("mjpeg", input_args, ["-y", "mjpeg.mov"]),
+        _output_item("dnxhd", input_args, ["-y", "dnxhd.mov"]),
+    ])
+
+    plugin.main_process(instance)
+
+    assert len(commands) == 3
+    for command in commands:
+        assert command.count("-filter_complex") <= 1
+    assert commands[0].endswith("-filter_complex amerge -ac 2 -y h264.mp4")
+    assert commands[1].endswith("-filter_complex amerge -ac 2 -y prores.mov")
+    assert commands[2].endswith("-y mjpeg.mov -y dnxhd.mov")
+
+
+def test_outputs_are_not_grouped_by_default(single_pass_env):
+    plugin, instance, output_items, commands = single_pass_env
+    plugin.single_pass_encoding = False
+    output_items.extend([
+        _output_item("h264", ["-i input.exr"], ["-y", "h264.mp4"]),
+        _output_item("prores", ["-i input.exr"], ["-y", "prores.mov"]),
+    ])
+
+    plugin.main_process(instance)
+
+    assert commands == [
+        "ffmpeg -i input.exr -y h264.mp4",
+        "ffmpeg -i input.exr -y prores.mov",
+    ]
@@ -0,0 +1,446 @@
+import os
+import errno
+
+import pytest
+import pyblish.api
+
+from ayon_api.utils import create_entity_id
+
+from ayon_core.lib import file_transaction, source_hash
+from ayon_core.lib.file_transaction import FileTransaction
+from ayon_core.pipeline.publish import KnownPublishError
+from ayon_core.plugins.publish import integrate
+from ayon_core.plugins.publish.integrate import IntegrateAsset
+
+
+def _write(path, content):
+    with open(path, "w") as stream:
+        stream.write(content)
+
+
+def _read(path):
+    with open(path, "r") as stream:
+        return stream.read()
+
+
+@pytest.fixture
+def delta_env(tmp_path):
+    """Source file and file of previous version with the same source hash."""
+    src_dir = tmp_path / "src"
+    previous_dir = tmp_path / "v001"
+    for dirpath in (src_dir, previous_dir):
+        dirpath.mkdir()
+
+    src_path = str(src_dir / "file.txt")
+    _write(src_path, "content")
+    previous_path = str(previous_dir / "file.txt")
+    _write(previous_path, "content")
+    previous_files = {
+        source_hash(src_path): (previous_path, os.path.getsize(src_path))
+    }
+    dst_path = str(tmp_path / "v002" / "file.txt")
+
+    plugin = IntegrateAsset()
+    plugin.delta_integrate = True
+    return plugin, src_path, previous_path, dst_path, previous_files
+
+
+def _transfer(plugin, src_path, dst_path, previous_files):
+    transaction = FileTransaction()
+    source_hashes = plugin._add_repre_transfers(
+        transaction, [(src_path, dst_path)], previous_files
+    )
+    transaction.process()
+    transaction.finalize()
+    assert transaction.transferred == [os.path.normpath(dst_path)]
+    return source_hashes
+
+
+def test_delta_integrate_reuses_previous_file(delta_env):
+    plugin, src_path, previous_path, dst_path, previous_files = delta_env
+
+    source_hashes = _transfer(plugin, src_path, dst_path, previous_files)
+
+    assert source_hashes == {dst_path: source_hash(src_path)}
+    assert os.stat(dst_path).st_ino == os.stat(previous_path).st_ino
+
+
+def test_delta_integrate_changed_size_is_copied(delta_env):
+    plugin, src_path, previous_path, dst_path, previous_files = delta_env
+    _write(previous_path, "changed content")
+
+    _transfer(plugin, src_path, dst_path, previous_files)
+
+    assert os.stat(dst_path).st_ino != os.stat(previous_path).st_ino
+    assert _read(dst_path) == "content"
+
+
+def test_delta_integrate_hardlink_fallback(delta_env, monkeypatch):
+    plugin, src_path, previous_path, dst_path, previous_files = delta_env
+    link_calls = []
+
+    def _create_hard_link(src, dst):
+        link_calls.append(src)
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(
+        file_transaction, "create_hard_link", _create_hard_link
+    )
+
+    _transfer(plugin, src_path, dst_path, previous_files)
+
+    assert link_calls == [os.path.normpath(previous_path)]
+    assert os.stat(dst_path).st_ino != os.stat(previous_path).st_ino
+    assert _read(dst_path) == "content"
+
+
+def test_hardlink_error_without_fallback(tmp_path, monkeypatch):
+    src_path = str(tmp_path / "file.txt")
+    _write(src_path, "content")
+
+    def _create_hard_link(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(
+        file_transaction, "create_hard_link", _create_hard_link
+    )
+    transaction = FileTransaction()
+    transaction.add(
+        src_path,
+        str(tmp_path / "dst.txt"),
+        mode=FileTransaction.MODE_HARDLINK
+    )
+    with pytest.raises(OSError):
+        transaction.process()
+    assert transaction.transferred == []
+
+
+FOLDER_ID = create_entity_id()
+EXISTING_PRODUCT_ID = create_entity_id()
+EXISTING_VERSION_ID = create_entity_id()
+
+
+class _FakeOperationsSession(object):
+    """Fake of 'OperationsSession' recording committed operations."""
+
+    committed = []
+    # Index of commit call which fails
+    fail_on_commit = None
+
+    def __init__(self):
+        self._operations = []
+
+    def create_entity(self, project_name, entity_type, data):
+        self._operations.append(("create", entity_type, data["id"]))
+
+    def update_entity(self, project_name, entity_type, entity_id, data):
+        self._operations.append(("update", entity_type, entity_id))
+
+    def delete_entity(self, project_name, entity_type, entity_id):
+        self._operations.append(("delete", entity_type, entity_id))
+
+    def to_data(self):
+        return list(self._operations)
+
+    def commit(self):
+        cls = self.__class__
+        if cls.fail_on_commit == len(cls.committed):
+            cls.fail_on_commit = None
+            raise RuntimeError("Commit failed")
+        cls.committed.append(list(self._operations))
+        self._operations = []
+
+
+class _FakeFileTransaction(object):
+    """Fake of 'FileTransaction' recording its state."""
+
+    def __init__(self, *args, **kwargs):
+        self.state = None
+
+    def rollback(self):
+        self.state = "rollback"
+
+    def finalize(self):
+        self.state = "finalize"
+
+
+def _create_instance(context, product_name, version=1):
+    instance = context.create_instance(product_name)
+    instance.data.update({
+        "folderEntity": {"id": FOLDER_ID},
+        "productName": product_name,
+        "productType": "render",
+        "version": version,
+        "representations": [{"name": "exr", "tags": []}],
+    })
+    return instance
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    """IntegrateAsset with batched operations and fake server.
+
+    Product 'existing' with version 1 and its representation exist.
+    """
+    existing_product = {
+        "id": EXISTING_PRODUCT_ID,
+        "folderId": FOLDER_ID,
+        "name": "existing",
+        "attrib": {},
+    }
+    existing_version = {
+        "id": EXISTING_VERSION_ID,
+        "productId": EXISTING_PRODUCT_ID,
+        "version": 1,
+        "attrib": {},
+    }
+    existing_repre = {
+        "id": "repre_existing",
+        "versionId": EXISTING_VERSION_ID,
+        "name": "exr",
+    }
+    queries = []
+
+    def _get_products(project_name, folder_ids, product_names):
+        queries.append(("products", set(product_names)))
+        return [
+            product
+            for product in [existing_product]
+            if product["name"] in product_names
+        ]
+
+    def _get_versions(project_name, product_ids, versions):
+        queries.append(("versions", set(product_ids)))
+        return [
+            version
+            for version in [existing_version]
+            if version["productId"] in product_ids
+            and version["version"] in versions
+        ]
+
+    def _get_representations(project_name, version_ids):
+        queries.append(("representations", set(version_ids)))
+        return [
+            repre
+            for repre in [existing_repre]
+            if repre["versionId"] in version_ids
+        ]
+
+    def _query(*args, **kwargs):
+        raise AssertionError("Unexpected server query")
+
+    _FakeOperationsSession.committed = []
+    _FakeOperationsSession.fail_on_commit = None
+    for attr_name, value in (
+        ("OperationsSession", _FakeOperationsSession),
+        ("FileTransaction", _FakeFileTransaction),
+        ("get_products", _get_products),
+        ("get_versions", _get_versions),
+        ("get_representations", _get_representations),
+        ("get_product_by_name", _query),
+        ("get_version_by_name", _query),
+    ):
+        monkeypatch.setattr(integrate, attr_name, value)
+
+    plugin = IntegrateAsset()
+    plugin.batch_operations = True
+    plugin.operations_chunk_size = 2
+    monkeypatch.setattr(plugin, "create_version_data", lambda instance: {})
+
+    # Register prepares only product and version
+    transactions = []
+
+    def _register(instance, file_transactions, filtered_repres):
+        transactions.append(file_transactions)
+        batched_operations = plugin._get_batched_operations(
+            instance.context
+        )
+        product_entity = plugin.prepare_product(
+            instance, batched_operations, "test_project"
+        )
+        plugin.prepare_version(
+            instance, batched_operations, product_entity, "test_project"
+        )
+        if instance.data.get("fail"):
+            raise RuntimeError("Failed")
+
+    monkeypatch.setattr(plugin, "register", _register)
+
+    context = pyblish.api.Context()
+    context.data.update({
+        "projectName": "test_project",
+        "ayonAttributes": {"version": {}},
+    })
+    return plugin, context, queries, transactions
+
+
+def test_batched_operations_commit_in_chunks(batch_env):
+    batched_operations = integrate.BatchedOperations(2)
+    entity_ids = [create_entity_id() for _ in range(5)]
+    for entity_id in entity_ids:
+        batched_operations.create_entity(
+            "test_project", "product", {"id": entity_id}
+        )
+
+    batched_operations.commit()
+
+    committed = _FakeOperationsSession.committed
+    assert [len(operations) for operations in committed] == [2, 2, 1]
+    assert [operation[2] for operation in sum(committed, [])] == entity_ids
+    assert batched_operations.to_data() == []
+
+
+def test_batched_operations_failed_commit_removes_created(batch_env):
+    batched_operations = integrate.BatchedOperations(2)
+    product_id, version_id, other_id = (
+        create_entity_id() for _ in range(3)
+    )
+    batched_operations.create_entity(
+        "test_project", "product", {"id": product_id}
+    )
+    batched_operations.create_entity(
+        "test_project", "version", {"id": version_id}
+    )
+    batched_operations.update_entity(
+        "test_project", "product", EXISTING_PRODUCT_ID, {}
+    )
+    batched_operations.create_entity(
+        "test_project", "product", {"id": other_id}
+    )
+    _FakeOperationsSession.fail_on_commit = 1
+
+    with pytest.raises(RuntimeError):
+        batched_operations.commit()
+
+    # Created entities of committed chunk are removed, children first
+    assert _FakeOperationsSession.committed[-1] == [
+        ("delete", "version", version_id),
+        ("delete", "product", product_id),
+    ]
+
+
+def test_batched_entities_query_and_dedupe(batch_env):
+    plugin, context, queries, _ = batch_env
+    instances = [
+        _create_instance(context, "existing"),
+        _create_instance(context, "new"),
+        _create_instance(context, "new", version=2),
+    ]
+    skipped = _create_instance(context, "farm")
+    skipped.data["farm"] = True
+
+    batched_operations = plugin._get_batched_operations(context)
+
+    # Existing entities are queried once for all integrated instances
+    assert queries == [
+        ("products", {"existing", "new"}),
+        ("versions", {EXISTING_PRODUCT_ID}),
+        ("representations", {EXISTING_VERSION_ID}),
+    ]
+
+    entities = []
+    for instance in instances:
+        product_entity = plugin.prepare_product(
+            instance, batched_operations, "test_project"
+        )
+        version_entity = plugin.prepare_version(
+            instance, batched_operations, product_entity, "test_project"
+        )
+        entities.append((product_entity, version_entity))
+
+    # Nothing is committed before all instances are integrated
+    assert _FakeOperationsSession.committed == []
+    assert len(queries) == 3
+    assert entities[0][0]["id"] == EXISTING_PRODUCT_ID
+    assert entities[0][1]["id"] == EXISTING_VERSION_ID
+    # Instances with the same product share the product entity
+    new_product_id = entities[1][0]["id"]
+    assert entities[2][0]["id"] == new_product_id
+    assert [
+        operation[:2] for operation in batched_operations.to_data()
+    ] == [
+        ("update", "product"),
+        ("update", "version"),
+        ("create", "product"),
+        ("create", "version"),
+        ("update", "product"),
+        ("create", "version"),
+    ]
+    assert plugin._get_existing_representations(
+        context, "test_project", entities[1][1]["id"]
+    ) == []
+
+
+def test_batched_operations_committed_by_context_plugin(batch_env):
+    plugin, context, queries, transactions = batch_env
+    instances = [
+        _create_instance(context, product_name)
+        for product_name in ("first", "second", "third")
+    ]
+    for instance in instances:
+        plugin.process(instance)
+
+    # Files are not finalized before entities are committed
+    assert _FakeOperationsSession.committed == []
+    assert [transaction.state for transaction in transactions] == [
+        None, None, None
+    ]
+
+    integrate.IntegrateBatchedOperations().process(context)
+
+    committed = _FakeOperationsSession.committed
+    assert [len(operations) for operations in committed] == [2, 2, 2]
+    assert [transaction.state for transaction in transactions] == [
+        "finalize", "finalize", "finalize"
+    ]
+
+
+def test_batched_operations_failed_commit_rolls_back_files(batch_env):
+    plugin, context, queries, transactions = batch_env
+    instances = [
+        _create_instance(context, product_name)
+        for product_name in ("first", "second")
+    ]
+    for instance in instances:
+        plugin.process(instance)
+    _FakeOperationsSession.fail_on_commit = 1
+
+    with pytest.raises(RuntimeError):
+        integrate.IntegrateBatchedOperations().process(context)
+
+    assert [transaction.state for transaction in transactions] == [
+        "rollback", "rollback"
+    ]
+    # Entities of committed chunk are removed
+    assert [
+        operation[0] for operation in _FakeOperationsSession.committed[-1]
+    ] == ["delete", "delete"]
+
+
+def test_batched_operations_discarded_on_failure(batch_env):
+    plugin, context, queries, transactions = batch_env
+    first, failing, following = [
+        _create_instance(context, product_name)
+        for product_name in ("first", "failing", "following")
+    ]
+    failing.data["fail"] = True
+    plugin.process(first)
+    with pytest.raises(RuntimeError):
+        plugin.process(failing)
+
+    # Files of all processed instances are rolled back
+    assert [transaction.state for transaction in transactions] == [
+        "rollback", "rollback"
+    ]
+    batched_operations = context.data["integrateBatchedOperations"]
+    assert batched_operations.failed
+    assert batched_operations.to_data() == []
+
+    # Following instances are not integrated
+    with pytest.raises(KnownPublishError):
+        plugin.process(following)
+    assert len(transactions) == 2
+
+    # Nothing is written to server
+    integrate.IntegrateBatchedOperations().process(context)
+    assert _FakeOperationsSession.committed == []
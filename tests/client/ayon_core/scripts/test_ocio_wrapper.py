@@ -0,0 +1,91 @@
+import os
+import sys
+import json
+import threading
+
+from ayon_core.pipeline import colorspace
+from ayon_core.scripts import ocio_wrapper
+
+TOKEN = "test_token"
+
+
+class _ServeProcess:
+    """Run 'serve' command in a thread with stdin and stdout on pipes."""
+
+    def __init__(self, monkeypatch):
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+        monkeypatch.setattr(sys, "stdin", os.fdopen(stdin_read, "r"))
+        monkeypatch.setattr(sys, "stdout", os.fdopen(stdout_write, "w"))
+        self._stdin = os.fdopen(stdin_write, "w")
+        self._stdout = os.fdopen(stdout_read, "r")
+        self._thread = threading.Thread(
+            target=ocio_wrapper.main,
+            args=(["serve", "--token", TOKEN], ),
+            kwargs={"standalone_mode": False},
+        )
+        self._thread.start()
+
+    def query(self, command, **kwargs):
+        request = {"command": command, "kwargs": kwargs}
+        self._stdin.write(json.dumps(request) + "\n")
+        self._stdin.flush()
+        prefix, _, response = self._stdout.readline().partition(":")
+        assert prefix == TOKEN
+        return json.loads(response)
+
+    def close(self):
+        # Process ends when stdin is closed
+        self._stdin.close()
+        self._thread.join(5)
+        is_alive = self._thread.is_alive()
+        sys.stdout.close()
+        self._stdout.close()
+        return not is_alive
+
+
+def test_serve(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.ocio"
+    config_path.write_text("config")
+    calls = []
+
+    def _get_ocio_config_views(config_path):
+        calls.append(config_path)
+        return {"sRGB/ACES": {"display": "sRGB", "view": "ACES"}}
+
+    monkeypatch.setattr(
+        colorspace, "_get_ocio_config_views", _get_ocio_config_views
+    )
+
+    process = _ServeProcess(monkeypatch)
+    try:
+        expected = {"result": _get_ocio_config_views(str(config_path))}
+        calls.clear()
+        for _ in range(2):
+            response = process.query(
+                "get_ocio_config_views", config_path=str(config_path)
+            )
+            assert response == expected
+        # Result is cached
+        assert calls == [str(config_path)]
+
+        # Changed config is loaded again
+        stat = os.stat(config_path)
+        os.utime(config_path, (stat.st_atime, stat.st_mtime + 10))
+        response = process.query(
+            "get_ocio_config_views", config_path=str(config_path)
+        )
+        assert response == expected
+        assert len(calls) == 2
+
+        # Errors don't stop the process
+        response = process.query(
+            "unknown_command", config_path=str(config_path)
+        )
+        assert "KeyError" in response["error"]
+        response = process.query(
+            "get_ocio_config_views", config_path=str(tmp_path / "missing")
+        )
+        assert "error" in response
+    finally:
+        assert process.close()
@@ -0,0 +1,136 @@
+import pytest
+
+from ayon_core.tools.common_models import hierarchy
+from ayon_core.tools.common_models.hierarchy import HierarchyModel
+
+PROJECT_NAME = "test_project"
+
+
+class _Controller:
+    def __init__(self):
+        self.events = []
+
+    def emit_event(self, topic, data, source):
+        self.events.append(topic)
+
+
+class _FakeServer:
+    """Task entities with 'get_tasks' function of 'ayon_api'."""
+
+    def __init__(self, tasks):
+        self.tasks = {task["id"]: task for task in tasks}
+        self.calls = []
+        self.fail_after = None
+
+    def get_tasks(
+        self, project_name, task_ids=None, folder_ids=None, fields=None
+    ):
+        self.calls.append(None if task_ids is None else set(task_ids))
+        for idx, task in enumerate(list(self.tasks.values())):
+            if task_ids is not None and task["id"] not in task_ids:
+                continue
+            if folder_ids is not None and task["folderId"] not in folder_ids:
+                continue
+            if self.fail_after is not None and idx >= self.fail_after:
+                raise ConnectionError("Connection lost")
+            yield {key: task[key] for key in fields}
+
+
+def _task(task_id, folder_id, name=None, updated_at="1"):
+    return {
+        "id": task_id,
+        "name": name or task_id,
+        "label": None,
+        "folderId": folder_id,
+        "type": "Generic",
+        "updatedAt": updated_at,
+    }
+
+
+def _task_names(model, folder_id):
+    return sorted(
+        task_item.name
+        for task_item in model.get_task_items(PROJECT_NAME, folder_id, None)
+    )
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = _FakeServer([
+        _task("t1", "f1"),
+        _task("t2", "f1"),
+        _task("t3", "f2"),
+    ])
+    monkeypatch.setattr(hierarchy.ayon_api, "get_tasks", server.get_tasks)
+    return server
+
+
+def _create_model(monkeypatch, lifetime=None):
+    if lifetime is not None:
+        monkeypatch.setattr(HierarchyModel, "lifetime", lifetime)
+    return HierarchyModel(_Controller(), index_project_tasks=True)
+
+
+def test_index_queries_project_once(server, monkeypatch):
+    model = _create_model(monkeypatch)
+
+    assert _task_names(model, "f1") == ["t1", "t2"]
+    assert _task_names(model, "f2") == ["t3"]
+    assert _task_names(model, "unknown") == []
+    assert server.calls == [None]
+
+    task_items = model.get_task_items_by_folder_ids(
+        PROJECT_NAME, ["f1", "f2"], None
+    )
+    assert sorted(task_items) == ["f1", "f2"]
+    assert server.calls == [None]
+
+
+def test_index_updates_only_changed_tasks(server, monkeypatch):
+    model = _create_model(monkeypatch, lifetime=0)
+    assert _task_names(model, "f1") == ["t1", "t2"]
+
+    server.tasks["t2"] = _task("t2", "f2", "renamed", updated_at="2")
+    server.tasks.pop("t3")
+    server.tasks["t4"] = _task("t4", "f1")
+    server.calls = []
+
+    assert _task_names(model, "f1") == ["t1", "t4"]
+    # Ids of all tasks and then full data of changed tasks only
+    assert server.calls == [None, {"t2", "t4"}]
+    assert _task_names(model, "f2") == ["renamed"]
+
+
+def test_index_resumes_after_failed_query(server, monkeypatch):
+    model = _create_model(monkeypatch)
+    controller = model._controller
+
+    server.fail_after = 2
+    with pytest.raises(ConnectionError):
+        model.get_task_items(PROJECT_NAME, "f1", None)
+    assert controller.events == [
+        "tasks.refresh.started", "tasks.refresh.finished"
+    ]
+
+    # Already received tasks are kept and only missing are queried
+    server.fail_after = None
+    server.calls = []
+    assert _task_names(model, "f1") == ["t1", "t2"]
+    assert _task_names(model, "f2") == ["t3"]
+    assert server.calls == [None, {"t3"}]
+
+
+def test_index_kept_after_failed_update(server, monkeypatch):
+    model = _create_model(monkeypatch, lifetime=0)
+    assert _task_names(model, "f2") == ["t3"]
+
+    server.tasks["t3"] = _task("t3", "f2", "renamed", updated_at="2")
+    server.fail_after = 2
+    with pytest.raises(ConnectionError):
+        model.get_task_items(PROJECT_NAME, "f2", None)
+
+    server.fail_after = None
+    server.calls = []
+    assert _task_names(model, "f2") == ["renamed"]
+    assert _task_names(model, "f1") == ["t1", "t2"]
+    assert server.calls == [None, {"t3"}, None]
@@ -0,0 +1,193 @@
+import threading
+
+import pytest
+
+from ayon_core.tools.loader.models import products
+from ayon_core.tools.loader.models.products import ProductsModel
+
+PROJECT_NAME = "test_project"
+
+
+class _FakeServer:
+    """Representations with 'get_representations' function of 'ayon_api'."""
+
+    def __init__(self, repre_count_by_version_id):
+        self.representations = [
+            {"id": "{}_{}".format(version_id, idx), "versionId": version_id}
+            for version_id, count in repre_count_by_version_id.items()
+            for idx in range(count)
+        ]
+        self.queried_version_ids = []
+        self.fail = False
+
+    def get_representations(self, project_name, version_ids, fields):
+        version_ids = set(version_ids)
+        self.queried_version_ids.append(version_ids)
+        for representation in self.representations:
+            if representation["versionId"] not in version_ids:
+                continue
+            if self.fail:
+                raise ConnectionError("Connection lost")
+            yield {key: representation[key] for key in fields}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = _FakeServer({"v1": 2, "v2": 1, "v3": 0})
+    monkeypatch.setattr(
+        products.ayon_api,
+        "get_representations",
+        server.get_representations
+    )
+    return server
+
+
+def test_repre_count_is_cached(server):
+    model = ProductsModel(None)
+
+    output = model.get_versions_repre_count(
+        PROJECT_NAME, {"v1", "v2"}, None
+    )
+    assert output == {"v1": 2, "v2": 1}
+    assert server.queried_version_ids == [{"v1", "v2"}]
+
+    # Only versions without cached count are queried, versions without
+    #   representations are cached too
+    output = model.get_versions_repre_count(
+        PROJECT_NAME, {"v1", "v2", "v3"}, None
+    )
+    assert output == {"v1": 2, "v2": 1, "v3": 0}
+    assert server.queried_version_ids[1:] == [{"v3"}]
+
+    model.get_versions_repre_count(PROJECT_NAME, {"v1", "v2", "v3"}, None)
+    assert len(server.queried_version_ids) == 2
+
+
+def test_repre_count_query_in_chunks(server):
+    model = ProductsModel(None)
+    version_ids = {"v1", "v2"}
+    version_ids |= {"empty_{}".format(idx) for idx in range(1000)}
+
+    output = model.get_versions_repre_count(PROJECT_NAME, version_ids, None)
+
+    assert set(output) == version_ids
+    assert output["v1"] == 2
+    assert output["empty_0"] == 0
+    assert [len(ids) for ids in server.queried_version_ids] == [
+        500, 500, 2
+    ]
+
+
+def test_repre_count_failed_query_is_not_cached(server):
+    model = ProductsModel(None)
+
+    server.fail = True
+    with pytest.raises(ConnectionError):
+        model.get_versions_repre_count(PROJECT_NAME, {"v1", "v3"}, None)
+
+    server.fail = False
+    server.queried_version_ids = []
+    output = model.get_versions_repre_count(
+        PROJECT_NAME, {"v1", "v3"}, None
+    )
+    assert output == {"v1": 2, "v3": 0}
+    assert server.queried_version_ids == [{"v1", "v3"}]
+
+
+class _FolderItem:
+    def __init__(self, label):
+        self.label = label
+
+
+class _Controller:
+    """Controller which records threads from which it was called."""
+
+    def __init__(self):
+        self.call_threads = []
+
+    def _record(self):
+        self.call_threads.append(threading.current_thread())
+
+    def get_loaded_product_ids(self):
+        self._record()
+        return {"p1"}
+
+    def get_folder_items(self, project_name, sender=None):
+        self._record()
+        return {"f1": _FolderItem("F1")}
+
+    def __getattr__(self, name):
+        raise AssertionError("Unexpected controller call '{}'".format(name))
+
+
+def _version(version_id, product_id, version):
+    return {
+        "id": version_id,
+        "productId": product_id,
+        "version": version,
+        "attrib": {},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "author": "user",
+        "thumbnailId": "thumb_{}".format(version_id),
+        "status": "",
+    }
+
+
+def test_prefetch_does_not_use_controller_in_thread(monkeypatch):
+    fake_api = products.ayon_api
+    monkeypatch.setattr(
+        fake_api, "get_project_product_types", lambda project_name: []
+    )
+    monkeypatch.setattr(
+        fake_api, "get_default_fields_for_type", lambda entity_type: set()
+    )
+    monkeypatch.setattr(
+        fake_api,
+        "get_products",
+        lambda project_name, folder_ids: iter([
+            {
+                "id": product_id,
+                "name": product_id,
+                "folderId": "f1",
+                "productType": "model",
+                "attrib": {},
+            }
+            for product_id in ("p1", "p2")
+        ])
+    )
+    monkeypatch.setattr(
+        fake_api,
+        "get_versions",
+        lambda project_name, product_ids, fields: [
+            _version("v1", "p1", 1),
+            _version("v2", "p1", 2),
+        ]
+    )
+    monkeypatch.setattr(
+        fake_api,
+        "get_folders",
+        lambda project_name, folder_ids, fields: [
+            {"id": "f1", "thumbnailId": "thumb_f1"}
+        ]
+    )
+    thumbnail_ids = []
+    monkeypatch.setattr(
+        products,
+        "get_thumbnail_path",
+        lambda project_name, thumbnail_id: thumbnail_ids.append(thumbnail_id)
+    )
+    controller = _Controller()
+    model = ProductsModel(controller)
+
+    model.prefetch_product_items(PROJECT_NAME, {"f1"})
+    model._prefetch_thread.join(5)
+
+    main_thread = threading.current_thread()
+    assert controller.call_threads
+    assert all(thread is main_thread for thread in controller.call_threads)
+    assert sorted(thumbnail_ids) == ["thumb_f1", "thumb_v2"]
+
+    # Product without versions is skipped
+    product_items = model.get_product_items(PROJECT_NAME, {"f1"}, None)
+    assert [item.product_id for item in product_items] == ["p1"]
+    assert product_items[0].product_in_scene
@@ -0,0 +1,9 @@
+import os
+import sys
+
+CLIENT_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client"
+)
+if CLIENT_ROOT not in sys.path:
+    sys.path.insert(0, CLIENT_ROOT)